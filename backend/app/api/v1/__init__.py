@@ -1,5 +1,15 @@
 from fastapi import APIRouter
-from . import news, social, markets, regions, hotspot, translate, semantic
+from . import (
+    news,
+    social,
+    markets,
+    regions,
+    hotspot,
+    translate,
+    semantic,
+    search,
+    stream,
+)
 
 api_router = APIRouter()
 
@@ -10,3 +20,5 @@ api_router.include_router(regions.router, prefix="/regions", tags=["regions"])
 api_router.include_router(hotspot.router, prefix="/hotspot", tags=["hotspot"])
 api_router.include_router(translate.router, prefix="/translate", tags=["translate"])
 api_router.include_router(semantic.router, prefix="/semantic", tags=["semantic"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(stream.router, prefix="/stream", tags=["stream"])
@@ -3,20 +3,28 @@ Hotspot Detection API
 Real-time geopolitical hotspot monitoring endpoints
 """
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from datetime import datetime, timezone
-import asyncio
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from typing import Annotated, Optional
+from datetime import datetime, timedelta, timezone
 
+from app.services.broadcast import hotspot_broadcaster
+from app.services.history import DEFAULT_POINTS, MAX_POINTS
 from app.services.hotspot_detector import detector
+from app.services.scheduler import hotspot_scheduler
 
 router = APIRouter()
 
 
+async def _require_snapshot() -> None:
+    if not await hotspot_scheduler.wait_ready():
+        raise HTTPException(status_code=503, detail="Hotspot scores not ready yet")
+
+
 @router.get("/current")
 async def get_current_hotspot():
     """Get the current hottest region"""
-    # Update scores with real data
-    await detector.update_scores()
+    # Serve the last snapshot computed by the background scheduler
+    await _require_snapshot()
 
     hotspot = detector.get_current_hotspot()
     if hotspot:
@@ -27,57 +35,96 @@ async def get_current_hotspot():
             "total_score": hotspot.total_score,
             "alert_level": hotspot.alert_level.value,
             "factors": hotspot.factors,
+            "z_score": hotspot.z_score,
+            "anomalies": hotspot.anomalies,
             "last_updated": hotspot.last_updated.isoformat(),
         }
     return {"error": "No hotspot data available"}
 
 
 @router.get("/all")
-async def get_all_regions():
+async def get_all_regions(force_refresh: bool = Query(False)):
     """Get all region scores"""
-    # Update scores with real data
-    await detector.update_scores()
+    if force_refresh:
+        try:
+            await hotspot_scheduler.refresh_now()
+        except Exception as e:
+            # Fall back to the last good snapshot, if any
+            print(f"Hotspot refresh error: {e}")
+    await _require_snapshot()
 
     return {
         "current_hotspot": detector.current_hotspot,
         "regions": detector.get_all_scores(),
+        "last_update": detector.last_update.isoformat()
+        if detector.last_update
+        else None,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
 
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 @router.get("/history")
-async def get_history(limit: int = 20):
-    """Get hotspot history"""
+async def get_history(
+    since: Annotated[
+        Optional[datetime], Query(description="Start (default: 24h ago)")
+    ] = None,
+    until: Annotated[
+        Optional[datetime], Query(description="End (default: now)")
+    ] = None,
+    resolution: Annotated[str, Query(pattern="^(auto|1m|15m|1h)$")] = "auto",
+    limit: Annotated[int, Query(ge=1, le=MAX_POINTS)] = DEFAULT_POINTS,
+):
+    """Get hotspot score history
+
+    Columnar series (timestamps, hotspot, per-region mean/min/max) at 1m, 15m
+    or 1h resolution; auto picks the finest one that fits the range in limit
+    points. Naive datetimes are taken as UTC.
+    """
+    until = _utc(until) if until else datetime.now(timezone.utc)
+    since = _utc(since) if since else until - timedelta(hours=24)
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+
     return {
-        "history": detector.get_history(limit),
+        "history": detector.get_history(since, until, resolution, limit),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket for real-time hotspot updates"""
+    """WebSocket for real-time hotspot updates
+
+    All clients share one broadcaster fed by the scheduler; a slow client only
+    ever has the most recent update queued.
+    """
     await websocket.accept()
 
+    await hotspot_scheduler.wait_ready()
+    subscription = hotspot_broadcaster.subscribe()
+
     try:
         while True:
-            # Update scores
-            await detector.update_scores()
-
-            # Send update
-            data = {
-                "type": "hotspot_update",
-                "current_hotspot": detector.current_hotspot,
-                "regions": detector.get_all_scores(),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-
-            await websocket.send_json(data)
-
-            # Wait before next update
-            await asyncio.sleep(30)  # Update every 30 seconds
+            payload = await subscription.get()
+            await websocket.send_text(payload)
 
     except WebSocketDisconnect:
         pass
     except Exception as e:
         print(f"WebSocket error: {e}")
+    finally:
+        subscription.close()
+
+
+@router.get("/ws/status")
+async def get_websocket_status():
+    """Get broadcaster status (connected clients, dropped updates)"""
+    return {
+        **hotspot_broadcaster.get_status(),
+        "interval": hotspot_scheduler.interval,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
@@ -4,50 +4,93 @@ Real-time news aggregation endpoints
 Supports lang=zh for automatic LLM translation
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from datetime import datetime, timezone
 
+from app.core.pagination import encode_cursor, paginate
 from app.services.news.aggregator import news_aggregator
+from app.services.news.models import NewsItem
 from app.services.translate.llm_translator import llm_translator
 
 router = APIRouter()
 
 
+def serialize_item(item: NewsItem) -> dict:
+    """News item as returned by the API, with its story cluster"""
+    cluster = news_aggregator.get_cluster(item)
+    return {
+        "id": item.id,
+        "title": item.title,
+        "summary": item.summary,
+        "source": item.source,
+        "source_id": item.source_id,
+        "url": item.url,
+        "published": item.published.isoformat(),
+        "region": item.region,
+        "classification": item.classification,
+        "relevance_score": item.relevance_score,
+        "cluster_id": cluster.id if cluster else None,
+        "cluster_size": cluster.size if cluster else 1,
+        "cluster_sources": cluster.sources if cluster else [item.source],
+        "first_seen": cluster.first_seen.isoformat()
+        if cluster and cluster.first_seen
+        else item.published.isoformat(),
+    }
+
+
 @router.get("/")
 async def get_news(
     region: Optional[str] = Query(None, description="Filter by region"),
     limit: int = Query(50, ge=1, le=100),
     force_refresh: bool = Query(False),
+    collapse: bool = Query(True, description="One item per near-duplicate story"),
+    sort: str = Query("relevance", pattern="^(relevance|time)$"),
+    cursor: Optional[str] = Query(None, description="Next page (older items)"),
+    since: Optional[str] = Query(
+        None, description="Only items newer than this cursor (delta polling)"
+    ),
     lang: Optional[str] = Query(
         None, description="Language: zh for Chinese translation"
     ),
 ):
-    """Get aggregated news from all sources"""
+    """Get aggregated news from all sources
+
+    Cursors page through retained history newest first: pass next_cursor as
+    cursor= for older items, or latest_cursor as since= to get only new ones.
+    """
     if region:
         items = await news_aggregator.fetch_by_region(region)
     else:
         items = await news_aggregator.fetch_all(force=force_refresh)
 
-    # Limit results
-    items = items[:limit]
+    timeline = news_aggregator.get_timeline(region)
+    next_cursor = None
+    latest_cursor = encode_cursor(timeline.keys[0]) if timeline.keys else None
+    has_more_newer = False
+
+    if sort == "time" or cursor or since:
+        try:
+            page = paginate(
+                timeline.keys, timeline.items, cursor=cursor, since=since, limit=limit
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        items = page.items
+        next_cursor = page.next_cursor
+        latest_cursor = page.latest_cursor
+        has_more_newer = page.has_more_newer
+        if collapse:
+            items = news_aggregator.collapse_duplicates(items)
+    else:
+        if collapse:
+            items = news_aggregator.collapse_duplicates(items)
+
+        # Limit results
+        items = items[:limit]
 
     # Build response items
-    result_items = [
-        {
-            "id": item.id,
-            "title": item.title,
-            "summary": item.summary,
-            "source": item.source,
-            "source_id": item.source_id,
-            "url": item.url,
-            "published": item.published.isoformat(),
-            "region": item.region,
-            "classification": item.classification,
-            "relevance_score": item.relevance_score,
-        }
-        for item in items
-    ]
+    result_items = [serialize_item(item) for item in items]
 
     # Translate if lang=zh
     if lang in ["zh", "zh-CN", "zh-TW"] and llm_translator.is_configured():
@@ -58,13 +101,18 @@ async def get_news(
     return {
         "count": len(result_items),
         "items": result_items,
+        "next_cursor": next_cursor,
+        "latest_cursor": latest_cursor,
+        "has_more_newer": has_more_newer,
         "lang": lang,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
 
 @router.get("/velocity")
-async def get_news_velocity():
+async def get_news_velocity(
+    hours: int = Query(24, ge=1, le=24, description="Time window in hours"),
+):
     """Get news velocity for all regions"""
     # Ensure data is fresh
     await news_aggregator.fetch_all()
@@ -77,10 +125,55 @@ async def get_news_velocity():
         "taiwan-strait",
         "korea",
     ]:
-        velocities[region] = round(news_aggregator.get_news_velocity(region), 1)
+        velocities[region] = round(
+            news_aggregator.get_news_velocity(region, hours=hours), 1
+        )
 
     return {
         "velocities": velocities,
+        "hours": hours,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get("/velocity/series")
+async def get_news_velocity_series(
+    region: str = Query(..., description="Region id"),
+    hours: int = Query(24, ge=1, le=24),
+    step: int = Query(15, ge=1, le=240, description="Step in minutes"),
+):
+    """Get article counts per time step for the velocity chart"""
+    await news_aggregator.fetch_all()
+
+    points = news_aggregator.get_velocity_series(region, hours, step)
+    for point in points:
+        point["start"] = datetime.fromtimestamp(
+            point["start"], timezone.utc
+        ).isoformat()
+
+    return {
+        "region": region,
+        "hours": hours,
+        "step_minutes": step,
+        "velocity": news_aggregator.get_news_velocity(region, hours=hours),
+        "points": points,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get("/history")
+async def get_news_history(
+    region: Optional[str] = Query(None, description="Filter by region"),
+    hours: int = Query(24, ge=1, le=24 * 30),
+    limit: int = Query(100, ge=1, le=500),
+):
+    """Get stored articles published within the last N hours"""
+    items = await news_aggregator.get_history(region=region, hours=hours, limit=limit)
+
+    return {
+        "count": len(items),
+        "items": [serialize_item(item) for item in items],
+        "hours": hours,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -90,9 +183,15 @@ async def get_sources():
     """Get list of news sources"""
     from app.services.news.aggregator import RSS_FEEDS
 
+    polling = news_aggregator.poller.get_status()
     return {
         "sources": [
-            {"id": key, "name": config["name"], "source_id": config["source_id"]}
+            {
+                "id": key,
+                "name": config["name"],
+                "source_id": config["source_id"],
+                "polling": polling.get(key),
+            }
             for key, config in RSS_FEEDS.items()
         ]
     }
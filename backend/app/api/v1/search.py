@@ -0,0 +1,70 @@
+"""
+Search API
+Full-text search over ingested news and social posts (no upstream calls)
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Query
+
+from app.services.search import search_index
+
+router = APIRouter()
+
+
+@router.get("/")
+async def search(
+    q: Annotated[str, Query(min_length=1, description="Search query")],
+    region: Annotated[Optional[str], Query(description="Filter by region")] = None,
+    since: Annotated[
+        Optional[datetime], Query(description="Only items published after")
+    ] = None,
+    kind: Annotated[
+        Optional[str],
+        Query(description="news, bluesky, truthsocial or twitter (comma-separated)"),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    """BM25-ranked search over everything ingested so far"""
+    kinds = {k.strip() for k in kind.split(",") if k.strip()} if kind else None
+
+    start = time.perf_counter()
+    hits, total = search_index.search(
+        q, region=region, since=since, kinds=kinds, limit=limit
+    )
+    took_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "query": q,
+        "count": len(hits),
+        "total_matches": total,
+        "results": [
+            {
+                "id": hit.document.id,
+                "kind": hit.document.kind,
+                "title": hit.document.title,
+                "text": hit.document.text,
+                "source": hit.document.source,
+                "url": hit.document.url,
+                "region": hit.document.region,
+                "published": datetime.fromtimestamp(
+                    hit.document.published, timezone.utc
+                ).isoformat(),
+                "score": round(hit.score, 3),
+            }
+            for hit in hits
+        ],
+        "took_ms": round(took_ms, 2),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get("/status")
+async def search_status():
+    """Index size by item kind"""
+    return {
+        **search_index.get_status(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
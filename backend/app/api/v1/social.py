@@ -4,18 +4,62 @@ Bluesky, Truth Social, Twitter/X and social intelligence endpoints
 Supports lang=zh for automatic LLM translation
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from datetime import datetime, timezone
 
+from app.core.pagination import paginate_many
 from app.services.social.bluesky import bluesky_service
-from app.services.social.truthsocial import truthsocial_service
-from app.services.social.twitter import twitter_service
+from app.services.social.truthsocial import TruthPost, truthsocial_service
+from app.services.social.twitter import Tweet, twitter_service
 from app.services.translate.llm_translator import llm_translator
 
 router = APIRouter()
 
 
+PLATFORM_SERVICES = {
+    "bluesky": bluesky_service,
+    "truthsocial": truthsocial_service,
+    "twitter": twitter_service,
+}
+
+
+def serialize_post(post) -> dict:
+    """Post dict for the timeline endpoint (fields vary by platform)"""
+    if isinstance(post, Tweet):
+        return {
+            "id": post.id,
+            "author": post.author,
+            "handle": post.handle,
+            "text": post.text,
+            "created_at": post.created_at.isoformat(),
+            "likes": post.likes,
+            "reposts": post.retweets,
+            "replies": post.replies,
+            "views": post.views,
+            "region": post.region,
+            "platform": "twitter",
+            "url": post.url,
+        }
+
+    item = {
+        "id": post.id,
+        "author": post.author,
+        "handle": post.handle,
+        "text": post.text,
+        "created_at": post.created_at.isoformat(),
+        "likes": post.likes,
+        "reposts": post.reposts,
+        "region": post.region,
+        "platform": "bluesky",
+        "url": getattr(post, "url", None),
+    }
+    if isinstance(post, TruthPost):
+        item["replies"] = getattr(post, "replies", 0)
+        item["platform"] = "truthsocial"
+    return item
+
+
 @router.get("/")
 async def get_social_posts(
     region: Optional[str] = Query(None, description="Filter by region"),
@@ -24,117 +68,59 @@ async def get_social_posts(
     ),
     limit: int = Query(50, ge=1, le=100),
     force_refresh: bool = Query(False),
+    cursor: Optional[str] = Query(None, description="Next page (older posts)"),
+    since: Optional[str] = Query(
+        None, description="Only posts newer than this cursor (delta polling)"
+    ),
     lang: Optional[str] = Query(
         None, description="Language: zh for Chinese translation"
     ),
 ):
-    """Get social media posts from all platforms"""
-    all_posts = []
-
-    # Fetch from Bluesky
-    if platform in [None, "all", "bluesky"]:
-        if region:
-            bsky_posts = await bluesky_service.fetch_by_region(region)
-        else:
-            bsky_posts = await bluesky_service.fetch_all(force=force_refresh)
-
-        for post in bsky_posts:
-            all_posts.append(
-                {
-                    "id": post.id,
-                    "author": post.author,
-                    "handle": post.handle,
-                    "text": post.text,
-                    "created_at": post.created_at.isoformat(),
-                    "likes": post.likes,
-                    "reposts": post.reposts,
-                    "region": post.region,
-                    "platform": "bluesky",
-                    "url": getattr(post, "url", None),
-                }
-            )
-
-    # Fetch from Truth Social
-    if platform in [None, "all", "truthsocial"]:
-        truth_posts = await truthsocial_service.fetch_all(force=force_refresh)
-
-        for post in truth_posts:
-            # Filter by region if specified
-            if region and post.region != region:
-                continue
-
-            all_posts.append(
-                {
-                    "id": post.id,
-                    "author": post.author,
-                    "handle": post.handle,
-                    "text": post.text,
-                    "created_at": post.created_at.isoformat(),
-                    "likes": post.likes,
-                    "reposts": post.reposts,
-                    "replies": getattr(post, "replies", 0),
-                    "region": post.region,
-                    "platform": "truthsocial",
-                    "url": getattr(post, "url", None),
-                }
-            )
-
-    # Fetch from Twitter/X (if configured)
-    if platform in [None, "all", "twitter"] and twitter_service.is_configured():
-        twitter_posts = await twitter_service.fetch_all(force=force_refresh)
-
-        for post in twitter_posts:
-            if region and post.region != region:
-                continue
-
-            all_posts.append(
-                {
-                    "id": post.id,
-                    "author": post.author,
-                    "handle": post.handle,
-                    "text": post.text,
-                    "created_at": post.created_at.isoformat(),
-                    "likes": post.likes,
-                    "reposts": post.retweets,
-                    "replies": post.replies,
-                    "views": post.views,
-                    "region": post.region,
-                    "platform": "twitter",
-                    "url": post.url,
-                }
-            )
-
-    # Balanced sorting: ensure all platforms are represented
-    # Group by platform
-    by_platform = {}
-    for post in all_posts:
-        plat = post["platform"]
-        if plat not in by_platform:
-            by_platform[plat] = []
-        by_platform[plat].append(post)
-
-    # Sort each platform by date
-    for plat in by_platform:
-        by_platform[plat].sort(key=lambda x: x["created_at"], reverse=True)
-
-    # Take proportional amount from each platform
-    # If specific platform requested, just sort by date
-    if platform and platform not in ["all", None]:
-        all_posts.sort(key=lambda x: x["created_at"], reverse=True)
-        all_posts = all_posts[:limit]
+    """Get social media posts from all platforms
+
+    Served from each service's retained, already sorted timeline. With
+    cursor= or since= posts are paged newest first across platforms instead
+    of the balanced per-platform mix.
+    """
+    selected = [
+        (name, service)
+        for name, service in PLATFORM_SERVICES.items()
+        if platform in [None, "all", name]
+        and (name != "twitter" or twitter_service.is_configured())
+    ]
+    # Refresh (stale-while-revalidate); the posts come from the timelines
+    for _, service in selected:
+        await service.fetch_all(force=force_refresh)
+    timelines = [
+        (ranked.keys, ranked.items)
+        for ranked in (service.timeline.get(region) for _, service in selected)
+        if len(ranked)
+    ]
+
+    next_cursor = None
+    has_more_newer = False
+
+    if cursor or since:
+        try:
+            page = paginate_many(timelines, cursor=cursor, since=since, limit=limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        next_cursor = page.next_cursor
+        has_more_newer = page.has_more_newer
+    elif platform and platform != "all":
+        # Single platform: newest first
+        page = paginate_many(timelines, limit=limit)
     else:
-        # Distribute limit across platforms proportionally, min 10 each
-        num_platforms = len(by_platform)
-        if num_platforms > 0:
-            per_platform = max(limit // num_platforms, 10)
-            balanced_posts = []
-            for plat, posts in by_platform.items():
-                balanced_posts.extend(posts[:per_platform])
-            # Sort combined by date
-            balanced_posts.sort(key=lambda x: x["created_at"], reverse=True)
-            all_posts = balanced_posts[:limit]
-        else:
-            all_posts = []
+        # Balanced: the newest of each platform (min 10 each), merged
+        per_platform = max(limit // len(timelines), 10) if timelines else 0
+        page = paginate_many(
+            [(keys[:per_platform], items[:per_platform]) for keys, items in timelines],
+            limit=limit,
+        )
+    posts = page.items
+    latest_cursor = page.latest_cursor
+
+    all_posts = [serialize_post(post) for post in posts]
 
     # Translate if lang=zh
     if lang in ["zh", "zh-CN", "zh-TW"] and llm_translator.is_configured():
@@ -150,6 +136,9 @@ async def get_social_posts(
     return {
         "count": len(all_posts),
         "items": all_posts,
+        "next_cursor": next_cursor,
+        "latest_cursor": latest_cursor,
+        "has_more_newer": has_more_newer,
         "platforms": platforms,
         "lang": lang,
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -0,0 +1,112 @@
+"""
+Stream API
+Server-Sent Events for newly ingested news articles and social posts
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.api.v1.news import serialize_item
+from app.services import ingest
+from app.services.broadcast import ingest_stream
+
+router = APIRouter()
+
+STREAM_TYPES = {"news", "social"}
+KEEPALIVE_SECONDS = 15
+RETRY_MS = 3000
+
+
+def _serialize_post(kind: str, post) -> dict:
+    return {
+        "id": post.id,
+        "author": post.author,
+        "handle": post.handle,
+        "text": post.text,
+        "created_at": post.created_at.isoformat(),
+        "likes": post.likes,
+        "reposts": getattr(post, "reposts", getattr(post, "retweets", 0)),
+        "replies": getattr(post, "replies", 0),
+        "region": post.region,
+        "platform": kind,
+        "url": getattr(post, "url", None),
+    }
+
+
+def on_ingest(kind: str, items: list) -> None:
+    """IngestHub listener: push new items onto the SSE event stream"""
+    if kind == ingest.NEWS:
+        for item in items:
+            ingest_stream.publish("news", item.region, serialize_item(item))
+        return
+
+    for post in items:
+        ingest_stream.publish("social", post.region, _serialize_post(kind, post))
+
+
+@router.get("/")
+async def stream_events(
+    request: Request,
+    types: Optional[str] = Query(
+        None, description="Comma-separated event types: news, social"
+    ),
+    region: Optional[str] = Query(None, description="Filter by region"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """Push newly ingested items as they are merged (text/event-stream)
+
+    Reconnecting clients send Last-Event-ID and get the events they missed
+    from a bounded replay buffer.
+    """
+    wanted = None
+    if types:
+        wanted = {t.strip() for t in types.split(",") if t.strip()}
+        unknown = wanted - STREAM_TYPES
+        if unknown or not wanted:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown event types: {', '.join(sorted(unknown)) or types}",
+            )
+    subscription, backlog = ingest_stream.subscribe(wanted, region, last_event_id)
+
+    async def events():
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            for event in backlog:
+                yield event.encode()
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), timeout=KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    # Fell too far behind - client resumes via Last-Event-ID
+                    break
+                yield event.encode()
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/status")
+async def stream_status():
+    """Get event stream status"""
+    return {
+        **ingest_stream.get_status(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
@@ -0,0 +1,139 @@
+"""
+Caching primitives shared by the data services
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from app.core.metrics import registry
+
+T = TypeVar("T")
+
+CACHE_REQUESTS = registry.counter(
+    "edgeseeker_cache_requests_total",
+    "TTLCache reads: hit (fresh), stale (served while revalidating), "
+    "miss (caller waited for a load), forced",
+    ("cache", "result"),
+)
+CACHE_LOAD_SECONDS = registry.histogram(
+    "edgeseeker_cache_load_seconds",
+    "Duration of TTLCache loader runs (one upstream sweep per service)",
+    ("cache",),
+)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight task
+
+    While a refresh for a key is running, every other caller awaits the same
+    task instead of starting its own upstream sweep.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        task = self._inflight.get(key)
+        return task is not None and not task.done()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+
+            def _forget(done: asyncio.Future, key=key) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_forget)
+
+        # Shield so one caller's cancellation doesn't abort the shared refresh
+        return await asyncio.shield(task)
+
+
+class TTLCache(Generic[T]):
+    """Stale-while-revalidate cache around one async loader
+
+    - younger than soft_ttl: served as is
+    - between soft_ttl and hard_ttl: served stale, refreshed in the background
+    - older than hard_ttl (or never loaded): the caller waits for the refresh
+
+    Refreshes go through a SingleFlight, so there is never more than one
+    load in flight.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], Awaitable[T]],
+        soft_ttl: timedelta,
+        hard_ttl: timedelta,
+        cache_empty: bool = False,
+    ):
+        self.name = name
+        self.loader = loader
+        self.soft_ttl = soft_ttl.total_seconds()
+        self.hard_ttl = max(hard_ttl, soft_ttl).total_seconds()
+        self.cache_empty = cache_empty
+        self.value: Optional[T] = None
+        self.loaded_at: Optional[float] = None
+        self.version = 0
+        self._flight = SingleFlight()
+        self._background: Optional[asyncio.Task] = None
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful load"""
+        if self.loaded_at is None:
+            return None
+        return time.monotonic() - self.loaded_at
+
+    def _has_value(self) -> bool:
+        if self.loaded_at is None:
+            return False
+        return self.cache_empty or bool(self.value)
+
+    def peek(self) -> Optional[T]:
+        """Current value without triggering any load"""
+        return self.value
+
+    async def get(self, force: bool = False) -> T:
+        if force or not self._has_value():
+            CACHE_REQUESTS.inc(cache=self.name, result="forced" if force else "miss")
+            return await self.refresh()
+
+        age = self.age() or 0.0
+        if age < self.soft_ttl:
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return self.value  # type: ignore[return-value]
+        if age < self.hard_ttl:
+            CACHE_REQUESTS.inc(cache=self.name, result="stale")
+            self._revalidate()
+            return self.value  # type: ignore[return-value]
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return await self.refresh()
+
+    async def refresh(self) -> T:
+        """Load now, joining a load that is already in flight"""
+        return await self._flight.do(self.name, self._load)
+
+    async def _load(self) -> T:
+        with CACHE_LOAD_SECONDS.time(cache=self.name):
+            value = await self.loader()
+        self.value = value
+        self.loaded_at = time.monotonic()
+        self.version += 1
+        return value
+
+    def _revalidate(self) -> None:
+        """Start a background refresh unless one is already running"""
+        if self._flight.in_flight(self.name):
+            return
+        self._background = asyncio.create_task(self.refresh())
+        self._background.add_done_callback(self._log_background_error)
+
+    def _log_background_error(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            print(f"{self.name} background refresh error: {task.exception()}")
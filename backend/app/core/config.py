@@ -52,6 +52,26 @@ class Settings(BaseSettings):
     # Proxy configuration
     PROXY_URL: Optional[str] = None
 
+    # 共享 HTTP 连接池
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_LIMIT_PER_HOST: int = 8
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0
+
+    # 新闻文章存储 (SQLite WAL)
+    NEWS_DB_PATH: str = "data/edgeseeker.db"
+    NEWS_RETENTION_HOURS: int = 24  # 内存中保留的时间窗口
+    NEWS_STORE_DAYS: int = 30  # 数据库中保留的天数
+    NEWS_POLL_FLOOR: int = 60  # 单个 RSS 源最短轮询间隔 (秒)
+    NEWS_POLL_CEILING: int = 1800  # 单个 RSS 源最长轮询间隔 (秒)
+
+    # 社交帖子时间线 (游标分页)
+    SOCIAL_RETENTION_HOURS: int = 24  # 内存中保留的时间窗口 (按最后一次抓取到的时间)
+
+    # RSS 解析执行器: process | thread | inline
+    FEED_PARSER_EXECUTOR: str = "process"
+    FEED_PARSER_WORKERS: int = 2
+
     # 热点地区配置
     REGIONS: List[str] = [
         "israel-palestine",
@@ -64,6 +84,18 @@ class Settings(BaseSettings):
     # 默认地区
     DEFAULT_REGION: str = "russia-ukraine"
 
+    # 热点后台刷新间隔 (秒)
+    HOTSPOT_REFRESH_INTERVAL: int = 30
+
+    # 接口等待首个热点快照的最长时间 (秒), 超时返回 503
+    HOTSPOT_READY_TIMEOUT: float = 15.0
+
+    # 热点分数历史 (内存映射环形缓冲, 1m/15m/1h 降采样)
+    HOTSPOT_HISTORY_DIR: str = "data/hotspot_history"
+
+    # 评分输入快照 (JSONL), 供离线回放/回测; 为空则不记录
+    HOTSPOT_SNAPSHOT_PATH: Optional[str] = None
+
     class Config:
         env_file = ".env"
         case_sensitive = True
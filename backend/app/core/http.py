@@ -0,0 +1,78 @@
+"""
+Shared HTTP client pool for external API requests
+One lifespan-scoped aiohttp session keeps TCP/TLS connections and DNS results
+warm across refreshes instead of every service opening its own session
+"""
+
+from typing import Optional
+
+import aiohttp
+
+from app.core.config import settings
+
+
+# Per-upstream total timeouts (seconds)
+UPSTREAM_TIMEOUTS = {
+    "rss": 15,
+    "bluesky": 10,
+    "bluesky_resolve": 5,
+    "truthsocial": 15,
+    "polymarket": 20,
+    "polymarket_clob": 10,
+    "yahoo": 10,
+    "getxapi": 15,
+    "scrapebadger": 15,
+    "jina": 30,
+}
+
+DEFAULT_TIMEOUT = 15
+
+
+class HttpClientRegistry:
+    """Owns the shared aiohttp.ClientSession that all services borrow"""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timeouts = {
+            name: aiohttp.ClientTimeout(total=seconds)
+            for name, seconds in UPSTREAM_TIMEOUTS.items()
+        }
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+        )
+
+    async def start(self) -> None:
+        """Create the pool (called from the app lifespan)"""
+        self.get_session()
+
+    async def close(self) -> None:
+        """Close the pool and all pooled connections"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Borrow the shared session, creating it lazily outside the lifespan"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def timeout(self, upstream: str) -> aiohttp.ClientTimeout:
+        """Get the configured timeout for an upstream"""
+        return self._timeouts.get(upstream) or aiohttp.ClientTimeout(
+            total=DEFAULT_TIMEOUT
+        )
+
+
+# Global instance
+http_client = HttpClientRegistry()
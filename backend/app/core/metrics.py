@@ -0,0 +1,308 @@
+"""
+Metrics
+Minimal Prometheus-style counters, gauges and histograms rendered in the text
+exposition format for GET /metrics, plus the instrumentation shared across
+services (upstream request timing, event-loop lag sampling)
+
+Metrics are updated from the event loop only.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+LOOP_LAG_INTERVAL = 0.5
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels(self, key: tuple[str, ...], extra: Optional[tuple] = None) -> str:
+        pairs = list(zip(self.label_names, key, strict=True))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+    def samples(self) -> Iterator[str]:
+        return iter(())
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{self._labels(key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # key -> (per-bucket counts incl. +Inf, sum)
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1][0] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+
+    def samples(self) -> Iterator[str]:
+        bounds = (*self.buckets, float("inf"))
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(bounds, counts, strict=True):
+                cumulative += count
+                le = self._labels(key, ("le", _format_value(bound)))
+                yield f"{self.name}_bucket{le} {cumulative}"
+            yield f"{self.name}_sum{self._labels(key)} {_format_value(total[0])}"
+            yield f"{self.name}_count{self._labels(key)} {cumulative}"
+
+
+class MetricsRegistry:
+    """Named metrics; creating one that already exists returns the existing one"""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def _get_or_create(self, cls: type, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args, **kwargs)
+        elif type(metric) is not cls:
+            raise ValueError(f"Metric {name} already registered as {metric.type}")
+        return metric
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labels, buckets)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global instance
+registry = MetricsRegistry()
+
+
+# ========== Upstream requests ==========
+
+UPSTREAM_SECONDS = registry.histogram(
+    "edgeseeker_upstream_request_seconds",
+    "Upstream request latency until the response body is read",
+    ("upstream", "target"),
+)
+UPSTREAM_REQUESTS = registry.counter(
+    "edgeseeker_upstream_requests_total",
+    "Upstream requests by HTTP status (or error / timeout)",
+    ("upstream", "target", "status"),
+)
+
+
+class UpstreamCall:
+    """Times one upstream request (sync or async context manager)
+
+    Set status once the response arrives and call done() after reading the
+    body; otherwise the call is recorded when the block exits.
+    """
+
+    __slots__ = ("upstream", "target", "status", "_start", "_recorded")
+
+    def __init__(self, upstream: str, target: str):
+        self.upstream = upstream
+        self.target = target
+        self.status: Optional[object] = None
+        self._start = time.perf_counter()
+        self._recorded = False
+
+    def done(self, status: Optional[object] = None) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        if status is not None:
+            self.status = status
+        UPSTREAM_SECONDS.observe(
+            time.perf_counter() - self._start,
+            upstream=self.upstream,
+            target=self.target,
+        )
+        UPSTREAM_REQUESTS.inc(
+            upstream=self.upstream, target=self.target, status=self.status or "error"
+        )
+
+    def __enter__(self) -> "UpstreamCall":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.done()
+        elif issubclass(exc_type, asyncio.TimeoutError):
+            self.done("timeout")
+        elif issubclass(exc_type, asyncio.CancelledError):
+            self.done("cancelled")
+        else:
+            self.done("error")
+
+    async def __aenter__(self) -> "UpstreamCall":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+
+def track_upstream(upstream: str, target: str) -> UpstreamCall:
+    """async with track_upstream("rss", feed_key) as call, session.get(...)"""
+    return UpstreamCall(upstream, target)
+
+
+# ========== Event loop ==========
+
+LOOP_LAG_SECONDS = registry.histogram(
+    "edgeseeker_event_loop_lag_seconds",
+    "How late a periodic timer fires - time the loop spent blocked",
+    buckets=LAG_BUCKETS,
+)
+LOOP_LAG_MAX = registry.gauge(
+    "edgeseeker_event_loop_lag_max_seconds",
+    "Largest event-loop lag seen since the previous scrape",
+)
+
+
+class LoopLagSampler:
+    """Background task that measures event-loop lag (started in the lifespan)"""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._max = 0.0
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="loop-lag-sampler")
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - start - self.interval)
+            LOOP_LAG_SECONDS.observe(lag)
+            self._max = max(self._max, lag)
+
+    def collect(self) -> None:
+        """Publish the max lag since the previous scrape and reset it"""
+        LOOP_LAG_MAX.set(self._max)
+        self._max = 0.0
+
+
+# Global instance
+loop_lag_sampler = LoopLagSampler()
+
+
+def render_metrics() -> str:
+    loop_lag_sampler.collect()
+    return registry.render()
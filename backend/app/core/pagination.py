@@ -0,0 +1,118 @@
+"""
+Cursor pagination for time-ordered feeds
+Cursors are opaque tokens wrapping (published timestamp, item id); items are
+ordered newest first, ties broken by id
+"""
+
+import base64
+import heapq
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
+from typing import Generic, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Ascending sort key for newest-first order
+TimelineKey = tuple[float, str]
+
+
+def timeline_key(ts: float, item_id: str) -> TimelineKey:
+    return (-ts, item_id)
+
+
+def encode_cursor(key: TimelineKey) -> str:
+    raw = f"{-key[0]!r}:{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> TimelineKey:
+    """Raises ValueError for malformed cursors"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, item_id = base64.urlsafe_b64decode(padded).decode().split(":", 1)
+        return timeline_key(float(ts), item_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    # Pass as cursor= for the next (older) page
+    next_cursor: Optional[str]
+    # Pass as since= to get only items newer than everything seen so far
+    latest_cursor: Optional[str]
+    # since= mode only: more new items than fit in this page
+    has_more_newer: bool = False
+
+
+def paginate(
+    keys: Sequence[TimelineKey],
+    items: Sequence[T],
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: int = 50,
+) -> Page[T]:
+    """Slice a newest-first timeline (keys sorted ascending, aligned with items)
+
+    - cursor: items older than the cursor
+    - since: items newer than the cursor; if more than `limit` are new, the
+      oldest of them are returned first so repeated polling never skips any
+    """
+    return paginate_many([(keys, items)], cursor=cursor, since=since, limit=limit)
+
+
+def paginate_many(
+    timelines: Sequence[tuple[Sequence[TimelineKey], Sequence[T]]],
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: int = 50,
+) -> Page[T]:
+    """paginate() over several timelines merged into one
+
+    Each timeline is bisected and contributes at most `limit` candidates, so
+    the cost does not depend on how long the timelines are.
+    """
+    if since:
+        key = decode_cursor(since)
+        ends = [bisect_left(keys, key) for keys, _ in timelines]
+        candidates = heapq.merge(
+            *(
+                zip(
+                    keys[max(0, end - limit) : end],
+                    items[max(0, end - limit) : end],
+                    strict=True,
+                )
+                for (keys, items), end in zip(timelines, ends, strict=True)
+            ),
+            key=itemgetter(0),
+        )
+        page = list(candidates)[-limit:]
+        latest = encode_cursor(page[0][0]) if page else since
+        return Page(
+            [item for _, item in page], None, latest, has_more_newer=sum(ends) > limit
+        )
+
+    key = decode_cursor(cursor) if cursor else None
+    starts = [bisect_right(keys, key) if key else 0 for keys, _ in timelines]
+    candidates = heapq.merge(
+        *(
+            zip(
+                keys[start : start + limit],
+                items[start : start + limit],
+                strict=True,
+            )
+            for (keys, items), start in zip(timelines, starts, strict=True)
+        ),
+        key=itemgetter(0),
+    )
+    page = list(islice(candidates, limit))
+    remaining = sum(
+        len(keys) - start for (keys, _), start in zip(timelines, starts, strict=True)
+    )
+    next_cursor = encode_cursor(page[-1][0]) if remaining > limit else None
+    firsts = [keys[0] for keys, _ in timelines if len(keys)]
+    latest = encode_cursor(min(firsts)) if firsts else None
+    return Page([item for _, item in page], next_cursor, latest)
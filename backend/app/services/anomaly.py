@@ -0,0 +1,176 @@
+"""
+Anomaly Detection
+Streaming per-region, per-factor baselines (exponentially weighted mean and
+variance) and z-scores of each new tick against them
+
+Each update is O(regions x columns) whatever the history length. The decay
+is time-based, so the baseline does not depend on how often the detector
+ticks. The variance is bias-corrected for the effective number of samples,
+so a young baseline does not underestimate the spread.
+"""
+
+import asyncio
+import math
+import os
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+HALFLIFE = 6 * 3600  # seconds for an observation's weight to halve
+WARMUP = 2 * HALFLIFE  # seconds of baseline per region before z-scores are reported
+# Std floor as a fraction of a column's range; keeps near-constant series
+# from turning a few points of movement into a large z
+MIN_STD = 0.05
+SAVE_INTERVAL = 60.0  # seconds between state snapshots
+
+
+class AnomalyDetector:
+    """EWMA mean / variance per (region, column) with z-scores per tick
+
+    State is kept in memory and snapshotted to an .npz file at most every
+    SAVE_INTERVAL seconds (and on save()), so baselines survive restarts.
+    """
+
+    def __init__(
+        self,
+        regions: Sequence[str],
+        columns: Sequence[str],
+        path: Optional[str] = None,
+        halflife: float = HALFLIFE,
+        warmup: float = WARMUP,
+        ranges: Optional[Sequence[float]] = None,
+    ):
+        self.regions = list(regions)
+        self.columns = list(columns)
+        # Value range per column (default: 0-100 scores)
+        if ranges is None:
+            ranges = [100.0] * len(self.columns)
+        self.min_std = MIN_STD * np.asarray(ranges, dtype=np.float64)
+        self.path = path
+        self.halflife = halflife
+        self.warmup = warmup
+        shape = (len(self.regions), len(self.columns))
+        self.mean = np.zeros(shape)
+        self.var = np.zeros(shape)
+        # Sum of squared sample weights per region (1 = a single sample)
+        self.weight_sq = np.ones(len(self.regions))
+        # First sample time per region (NaN = no baseline yet)
+        self.started = np.full(len(self.regions), np.nan)
+        self.updated_at: Optional[float] = None
+        self._loaded = path is None
+        self._saved_at = time.monotonic()
+
+    # ========== Update ==========
+
+    def update(self, values: np.ndarray, ts: Optional[float] = None) -> np.ndarray:
+        """Fold one regions x columns sample into the baselines
+
+        Returns the z-scores of values against the baselines as they were
+        before this sample; NaN for regions still warming up.
+        """
+        self._load()
+        ts = time.time() if ts is None else ts
+        values = np.asarray(values, dtype=np.float64)
+
+        std = np.maximum(np.sqrt(self._unbiased_var()), self.min_std)
+        z = (values - self.mean) / std
+        warming = ~(ts - self.started >= self.warmup)  # NaN start -> warming
+        z[warming] = np.nan
+
+        if self.updated_at is None:
+            alpha = 1.0
+        else:
+            dt = max(ts - self.updated_at, 0.0)
+            alpha = 1.0 - math.exp(-dt * math.log(2) / self.halflife)
+
+        diff = values - self.mean
+        increment = alpha * diff
+        self.mean += increment
+        self.var = (1.0 - alpha) * (self.var + diff * increment)
+        self.weight_sq = (1.0 - alpha) ** 2 * self.weight_sq + alpha**2
+
+        fresh = np.isnan(self.started)
+        if fresh.any():
+            self.mean[fresh] = values[fresh]
+            self.var[fresh] = 0.0
+            self.weight_sq[fresh] = 1.0
+            self.started[fresh] = ts
+
+        self.updated_at = ts
+        return z
+
+    def _unbiased_var(self) -> np.ndarray:
+        """EWMA variance divided by 1 - sum(w^2), the reliability-weights
+        correction; regions with a single sample have none"""
+        correction = 1.0 - self.weight_sq
+        unbiased = np.zeros_like(self.var)
+        np.divide(
+            self.var, correction[:, None], out=unbiased, where=correction[:, None] > 0
+        )
+        return unbiased
+
+    # ========== Persistence ==========
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as state:
+                if list(state["columns"]) != self.columns:
+                    print("Anomaly baselines: factors changed, starting fresh")
+                    return
+                index = {region: i for i, region in enumerate(self.regions)}
+                for j, region in enumerate(state["regions"]):
+                    i = index.get(str(region))
+                    if i is not None:
+                        self.mean[i] = state["mean"][j]
+                        self.var[i] = state["var"][j]
+                        # Older snapshots: no correction
+                        self.weight_sq[i] = (
+                            state["weight_sq"][j] if "weight_sq" in state else 0.0
+                        )
+                        self.started[i] = state["started"][j]
+                self.updated_at = float(state["updated_at"])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Anomaly baselines unreadable, starting fresh: {e}")
+
+    def _state(self) -> Optional[dict]:
+        if self.path is None or self.updated_at is None:
+            return None
+        return {
+            "regions": np.array(self.regions),
+            "columns": np.array(self.columns),
+            "mean": self.mean.copy(),
+            "var": self.var.copy(),
+            "weight_sq": self.weight_sq.copy(),
+            "started": self.started.copy(),
+            "updated_at": self.updated_at,
+        }
+
+    def _write(self, state: Optional[dict]) -> None:
+        if state is None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **state)
+        os.replace(tmp, self.path)
+
+    def save(self) -> None:
+        """Snapshot the baselines (atomic replace)"""
+        self._saved_at = time.monotonic()
+        self._write(self._state())
+
+    async def save_if_due(self) -> None:
+        """Snapshot in the loop, write in a worker thread, at most every
+        SAVE_INTERVAL seconds"""
+        if time.monotonic() - self._saved_at >= SAVE_INTERVAL:
+            self._saved_at = time.monotonic()
+            await asyncio.to_thread(self._write, self._state())
@@ -0,0 +1,214 @@
+"""
+Broadcast Hub
+Fans one pre-serialized payload out to many subscribers (WebSocket clients)
+and keeps ordered event streams with a replay buffer (SSE clients)
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+
+# Events kept for Last-Event-ID resume
+REPLAY_SIZE = 1000
+# Events queued per stream subscriber before it is cut off
+STREAM_QUEUE_SIZE = 256
+
+
+class Subscription:
+    """A single subscriber's mailbox - holds only the latest payload"""
+
+    def __init__(self, hub: "Broadcaster"):
+        self.hub = hub
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1)
+        self.dropped = 0
+
+    def offer(self, payload: str) -> None:
+        """Deliver a payload, replacing any unread one (drop-to-latest)"""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(payload)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class Broadcaster:
+    """Pub/sub hub: one serialization per publish, O(1) delivery per subscriber"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.subscribers: set[Subscription] = set()
+        self.latest: Optional[str] = None
+
+    def subscribe(self) -> Subscription:
+        """Register a subscriber; it immediately receives the latest payload"""
+        sub = Subscription(self)
+        if self.latest is not None:
+            sub.offer(self.latest)
+        self.subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self.subscribers.discard(sub)
+
+    def publish(self, data: dict) -> str:
+        """Serialize once and hand the payload to every subscriber"""
+        payload = json.dumps(data, ensure_ascii=False)
+        self.latest = payload
+        for sub in self.subscribers:
+            sub.offer(payload)
+        return payload
+
+    def get_status(self) -> dict:
+        return {
+            "name": self.name,
+            "subscribers": len(self.subscribers),
+            "dropped": sum(s.dropped for s in self.subscribers),
+        }
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    seq: int
+    id: str
+    type: str
+    region: Optional[str]
+    data: str
+
+    def encode(self) -> str:
+        """SSE wire format"""
+        return f"id: {self.id}\nevent: {self.type}\ndata: {self.data}\n\n"
+
+
+class StreamSubscription:
+    """A stream subscriber's filtered, bounded queue of events
+
+    Unlike Subscription this never drops individual events: a subscriber that
+    falls STREAM_QUEUE_SIZE events behind is closed and resumes from the
+    replay buffer with Last-Event-ID when it reconnects.
+    """
+
+    def __init__(
+        self,
+        stream: "EventStream",
+        types: Optional[set[str]],
+        region: Optional[str],
+    ):
+        self.stream = stream
+        self.types = types
+        self.region = region
+        self.queue: asyncio.Queue[Optional[StreamEvent]] = asyncio.Queue(
+            maxsize=STREAM_QUEUE_SIZE
+        )
+        self.overflowed = False
+
+    def matches(self, event: StreamEvent) -> bool:
+        if self.types is not None and event.type not in self.types:
+            return False
+        return not self.region or event.region == self.region
+
+    def offer(self, event: StreamEvent) -> None:
+        if self.overflowed or not self.matches(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.stream.unsubscribe(self)
+            # Wake the reader so it ends the response
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self) -> Optional[StreamEvent]:
+        """Next event, or None once the subscriber has been cut off"""
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.stream.unsubscribe(self)
+
+
+class EventStream:
+    """Ordered event log with a bounded replay buffer
+
+    Event ids are "<boot epoch>-<seq>", so a client resuming with an id from
+    a previous server run gets the whole buffer instead of nothing.
+    """
+
+    def __init__(self, name: str, replay_size: int = REPLAY_SIZE):
+        self.name = name
+        self.epoch = str(int(time.time()))
+        self.replay: deque[StreamEvent] = deque(maxlen=replay_size)
+        self.subscribers: set[StreamSubscription] = set()
+        self._seq = 0
+        self.published = 0
+
+    def publish(self, type: str, region: Optional[str], data: dict) -> StreamEvent:
+        self._seq += 1
+        event = StreamEvent(
+            seq=self._seq,
+            id=f"{self.epoch}-{self._seq}",
+            type=type,
+            region=region,
+            data=json.dumps(data, ensure_ascii=False, default=str),
+        )
+        self.replay.append(event)
+        self.published += 1
+        for sub in list(self.subscribers):
+            sub.offer(event)
+        return event
+
+    def _parse_last_id(self, last_event_id: Optional[str]) -> int:
+        """Sequence number to resume after (0 = replay everything buffered)"""
+        if not last_event_id:
+            return -1
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return 0
+        return int(seq)
+
+    def subscribe(
+        self,
+        types: Optional[set[str]] = None,
+        region: Optional[str] = None,
+        last_event_id: Optional[str] = None,
+    ) -> tuple[StreamSubscription, list[StreamEvent]]:
+        """Register a subscriber and return the matching events it missed
+
+        Without last_event_id the subscriber only gets events from now on.
+        """
+        sub = StreamSubscription(self, types, region)
+        after = self._parse_last_id(last_event_id)
+        backlog = []
+        if after >= 0:
+            backlog = [e for e in self.replay if e.seq > after and sub.matches(e)]
+        self.subscribers.add(sub)
+        return sub, backlog
+
+    def unsubscribe(self, sub: StreamSubscription) -> None:
+        self.subscribers.discard(sub)
+
+    def get_status(self) -> dict:
+        return {
+            "name": self.name,
+            "subscribers": len(self.subscribers),
+            "published": self.published,
+            "buffered": len(self.replay),
+            "oldest_id": self.replay[0].id if self.replay else None,
+            "latest_id": self.replay[-1].id if self.replay else None,
+        }
+
+
+# Global instances
+hotspot_broadcaster = Broadcaster("hotspot")
+ingest_stream = EventStream("ingest")
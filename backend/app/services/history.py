@@ -0,0 +1,273 @@
+"""
+Score History
+Ring-buffer time series of region scores in memory-mapped files, downsampled
+on write into 1m / 15m / 1h tiers (min / max / mean per bucket)
+
+Every tier is a fixed-size array indexed by bucket number modulo its
+capacity, so recording is O(tiers x regions) and a query reads at most
+`limit` buckets however long the requested range is.
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+# (name, bucket seconds, buckets kept)
+TIERS = (
+    ("1m", 60, 7 * 24 * 60),  # 7 days
+    ("15m", 15 * 60, 28 * 24 * 4),  # 28 days
+    ("1h", 60 * 60, 90 * 24),  # 90 days
+)
+
+FLUSH_INTERVAL = 60.0  # seconds between msyncs of the dirty pages
+
+DEFAULT_POINTS = 500
+MAX_POINTS = 2000
+
+META_FILE = "regions.json"
+
+
+def _dtype(regions: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("ts", "<i8"),  # bucket start (unix seconds), -1 = empty slot
+            ("count", "<i4"),  # samples in the bucket
+            ("hotspot", "<i2"),  # region index of the latest hotspot, -1 = none
+            ("min", "<f4", (regions,)),
+            ("max", "<f4", (regions,)),
+            ("sum", "<f4", (regions,)),
+        ]
+    )
+
+
+@dataclass
+class _Tier:
+    name: str
+    step: int
+    capacity: int
+    data: np.ndarray
+
+    def slot(self, bucket: int) -> int:
+        return bucket % self.capacity
+
+
+def _series(values: np.ndarray) -> list:
+    """Rounded floats for JSON; NaN (region added after the bucket) -> None"""
+    values = np.round(values.astype(np.float64), 1)
+    nan = np.isnan(values)
+    if nan.any():
+        return [
+            None if missing else v
+            for v, missing in zip(values.tolist(), nan, strict=True)
+        ]
+    return values.tolist()
+
+
+class ScoreHistory:
+    """Per-region score history, one memory-mapped .npy file per tier
+
+    Files are opened lazily on first use. Writes land in the page cache and
+    are flushed at most every FLUSH_INTERVAL seconds (and on close); if the
+    region list changes the stored history is migrated column by column.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        regions: Sequence[str],
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        self.directory = directory
+        self.regions = list(regions)
+        self.flush_interval = flush_interval
+        self._index = {region: i for i, region in enumerate(self.regions)}
+        self._tiers: Optional[list[_Tier]] = None
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+
+    # ========== Storage ==========
+
+    def _open(self) -> list[_Tier]:
+        if self._tiers is None:
+            os.makedirs(self.directory, exist_ok=True)
+            stored = self._stored_regions()
+            self._tiers = [
+                self._open_tier(name, step, capacity, stored)
+                for name, step, capacity in TIERS
+            ]
+            with open(os.path.join(self.directory, META_FILE), "w") as f:
+                json.dump({"regions": self.regions}, f)
+        return self._tiers
+
+    def _stored_regions(self) -> Optional[list[str]]:
+        try:
+            with open(os.path.join(self.directory, META_FILE)) as f:
+                return json.load(f)["regions"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _open_tier(
+        self, name: str, step: int, capacity: int, stored: Optional[list[str]]
+    ) -> _Tier:
+        path = os.path.join(self.directory, f"{name}.npy")
+        dtype = _dtype(len(self.regions))
+        old = None
+
+        if os.path.exists(path) and stored is not None:
+            try:
+                data = np.lib.format.open_memmap(path, mode="r+")
+                if (
+                    stored == self.regions
+                    and data.dtype == dtype
+                    and data.shape == (capacity,)
+                ):
+                    return _Tier(name, step, capacity, data)
+                old = np.array(data)
+                del data
+            except (OSError, ValueError) as e:
+                print(f"Score history {name} unreadable, starting fresh: {e}")
+
+        data = np.lib.format.open_memmap(
+            path, mode="w+", dtype=dtype, shape=(capacity,)
+        )
+        data["ts"] = -1
+        data["hotspot"] = -1
+        tier = _Tier(name, step, capacity, data)
+        if old is not None:
+            self._migrate(tier, old, stored)
+        data.flush()
+        return tier
+
+    def _migrate(self, tier: _Tier, old: np.ndarray, stored: list[str]) -> None:
+        """Copy buckets written under a different region list or capacity"""
+        rows = old[old["ts"] >= 0]
+        if not len(rows):
+            return
+        # Keep the newest bucket per slot if the capacity shrank
+        rows = rows[np.argsort(rows["ts"])]
+        slots = (rows["ts"] // tier.step) % tier.capacity
+        data = tier.data
+        data["ts"][slots] = rows["ts"]
+        data["count"][slots] = rows["count"]
+
+        remap = np.array([self._index.get(region, -1) for region in stored] + [-1])
+        data["hotspot"][slots] = remap[rows["hotspot"]]
+
+        for field in ("min", "max", "sum"):
+            column = np.full((len(rows), len(self.regions)), np.nan, np.float32)
+            for j, region in enumerate(stored):
+                i = self._index.get(region)
+                if i is not None:
+                    column[:, i] = rows[field][:, j]
+            data[field][slots] = column
+        print(f"Score history {tier.name}: migrated {len(rows)} buckets")
+
+    def flush(self) -> None:
+        """Write dirty pages back to the files"""
+        if self._tiers is not None:
+            for tier in self._tiers:
+                tier.data.flush()
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+
+    async def flush_if_due(self) -> None:
+        """Flush in a worker thread once FLUSH_INTERVAL has passed"""
+        if self._dirty and time.monotonic() - self._flushed_at >= self.flush_interval:
+            await asyncio.to_thread(self.flush)
+
+    def close(self) -> None:
+        if self._tiers is not None:
+            self.flush()
+            self._tiers = None
+
+    # ========== Write ==========
+
+    def record(
+        self,
+        scores: np.ndarray,
+        hotspot: Optional[str] = None,
+        ts: Optional[float] = None,
+    ) -> None:
+        """Add one sample: scores aligned with self.regions"""
+        ts = time.time() if ts is None else ts
+        scores = np.asarray(scores, dtype=np.float32)
+        hotspot_index = self._index.get(hotspot, -1)
+
+        for tier in self._open():
+            bucket = int(ts // tier.step)
+            row = tier.data[tier.slot(bucket)]
+            start = bucket * tier.step
+            if row["ts"] != start or row["count"] == 0:
+                # Slot holds an older bucket (or nothing): overwrite it
+                row["ts"] = start
+                row["count"] = 1
+                row["min"] = scores
+                row["max"] = scores
+                row["sum"] = scores
+            else:
+                row["count"] += 1
+                row["min"] = np.fmin(row["min"], scores)
+                row["max"] = np.fmax(row["max"], scores)
+                row["sum"] += scores
+            row["hotspot"] = hotspot_index
+
+        self._dirty = True
+
+    # ========== Read ==========
+
+    def _pick_tier(self, since: float, until: float, limit: int) -> _Tier:
+        """Finest tier that covers the range in at most limit buckets"""
+        tiers = self._open()
+        now = time.time()
+        for tier in tiers:
+            if (until - since) / tier.step <= limit and (
+                since >= now - tier.step * tier.capacity
+            ):
+                return tier
+        return tiers[-1]
+
+    def query(
+        self,
+        since: float,
+        until: float,
+        resolution: str = "auto",
+        limit: int = DEFAULT_POINTS,
+    ) -> dict:
+        """Columnar series between since and until (unix seconds), newest
+        `limit` buckets at most"""
+        limit = max(1, min(limit, MAX_POINTS))
+        if resolution == "auto":
+            tier = self._pick_tier(since, until, limit)
+        else:
+            tier = next((t for t in self._open() if t.name == resolution), None)
+            if tier is None:
+                raise ValueError(f"Unknown resolution: {resolution}")
+
+        last = int(until // tier.step)
+        first = max(int(since // tier.step), last - tier.capacity + 1, last - limit + 1)
+        buckets = np.arange(first, last + 1, dtype=np.int64)
+        rows = tier.data[buckets % tier.capacity]
+        rows = rows[(rows["ts"] == buckets * tier.step) & (rows["count"] > 0)]
+
+        mean = rows["sum"] / rows["count"][:, None]
+        names = np.array(self.regions + [None], dtype=object)
+        return {
+            "resolution": tier.name,
+            "step_seconds": tier.step,
+            "timestamps": rows["ts"].tolist(),
+            "hotspot": names[rows["hotspot"]].tolist(),
+            "regions": {
+                region: {
+                    "mean": _series(mean[:, i]),
+                    "min": _series(rows["min"][:, i]),
+                    "max": _series(rows["max"][:, i]),
+                }
+                for i, region in enumerate(self.regions)
+            },
+        }
@@ -4,16 +4,28 @@ Automatically detects the hottest geopolitical region based on real-time data
 """
 
 import asyncio
+import math
+import os
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 from enum import Enum
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.services.anomaly import AnomalyDetector
+from app.services.history import ScoreHistory, DEFAULT_POINTS
 from app.services.news.aggregator import news_aggregator, NewsItem
 from app.services.social.bluesky import bluesky_service, SocialPost
-from app.services.social.truthsocial import truthsocial_service
+from app.services.social.truthsocial import truthsocial_service, TruthPost
 from app.services.markets.polymarket import polymarket_service
 from app.services.markets.commodities_service import commodities_service
+from app.services.snapshots import SnapshotRecorder
+from app.services.text.keywords import KeywordMatcher
 from app.services.trends.google_trends import google_trends_service
 
 
@@ -24,6 +36,10 @@ class AlertLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Ascending severity, for ranking regions by alert level
+ALERT_RANK = {level: rank for rank, level in enumerate(AlertLevel)}
+
+
 @dataclass
 class RegionScore:
     region_id: str
@@ -32,6 +48,10 @@ class RegionScore:
     total_score: float = 0.0
     alert_level: AlertLevel = AlertLevel.LOW
     factors: dict = field(default_factory=dict)
+    # Deviation of total_score from the region's own baseline (None while warming up)
+    z_score: Optional[float] = None
+    # Factors spiking at least ANOMALY_Z standard deviations: factor -> z
+    anomalies: dict = field(default_factory=dict)
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
@@ -54,13 +74,269 @@ WEIGHTS = {
     "event_triggers": 0.05,
 }
 
+UPDATE_PHASE_SECONDS = registry.histogram(
+    "edgeseeker_update_scores_phase_seconds",
+    "update_scores duration per phase: each source fetch, all fetches, scoring, total",
+    ("phase",),
+)
+
+
+FACTOR_RECOMPUTES = registry.counter(
+    "edgeseeker_factor_recomputes_total",
+    "Factor columns recomputed by update_scores because an input changed",
+    ("factor",),
+)
+
+
+async def _timed(phase: str, awaitable):
+    with UPDATE_PHASE_SECONDS.time(phase=phase):
+        return await awaitable
+
+
+# ========== Scoring ==========
+
+# Columns of the factor matrix, in WEIGHTS order
+FACTORS = tuple(WEIGHTS)
+WEIGHT_VECTOR = np.array([WEIGHTS[factor] for factor in FACTORS])
+
+# Alert levels by how far the total score is above the region's baseline
+# (z-score), once it has one; until then the static score thresholds apply
+Z_LEVELS = (
+    (4.0, AlertLevel.CRITICAL),
+    (3.0, AlertLevel.HIGH),
+    (2.0, AlertLevel.ELEVATED),
+)
+# Totals below this never escalate on z: a quiet region's small moves stay LOW
+Z_MIN_SCORE = 30.0
+# Only regions within this share of the top total compete on alert level for
+# the hotspot, so an escalated low total cannot beat a much higher one
+HOTSPOT_SCORE_SHARE = 0.75
+# Factor z-score reported as an anomaly
+ANOMALY_Z = 2.0
+
+# Upstream inputs, fetched concurrently by update_scores
+SOURCES = ("news", "bluesky", "truthsocial", "polymarket", "commodities", "trends")
+
+# Inputs each factor reads; "clock" is the current minute, as the news
+# velocity window slides with time
+FACTOR_INPUTS = {
+    "news_velocity": ("news", "clock"),
+    "social_volume": ("bluesky", "truthsocial"),
+    "google_trends": ("trends",),
+    "sentiment_shift": ("news", "bluesky"),
+    "prediction_volatility": ("polymarket",),
+    "market_movement": ("commodities",),
+    "event_triggers": ("news",),
+}
+
+# Keywords indicating escalation (sentiment shift)
+ESCALATION_KEYWORDS = [
+    "strike",
+    "attack",
+    "war",
+    "invasion",
+    "military",
+    "nuclear",
+    "missile",
+    "bomb",
+    "troops",
+    "conflict",
+    "threat",
+    "urgent",
+    "breaking",
+    "emergency",
+    "crisis",
+    "escalation",
+    "tension",
+]
+
+# Headline phrases marking a major event
+TRIGGER_PHRASES = [
+    "breaking:",
+    "just in:",
+    "urgent:",
+    "developing:",
+    "strike",
+    "explosion",
+    "attack",
+    "invasion",
+    "declares war",
+    "state of emergency",
+    "evacuate",
+    "nuclear",
+    "missile launch",
+    "airstrikes",
+]
+# Most recent headlines per region checked for triggers
+TRIGGER_HEADLINES = 20
+
+# Posts mentioning a region count towards its social volume even if they
+# were classified elsewhere (or not at all)
+SOCIAL_REGION_KEYWORDS = {
+    "iran": ["iran", "tehran", "persian"],
+    "israel-palestine": ["israel", "gaza", "hamas"],
+    "russia-ukraine": ["ukraine", "russia", "kyiv"],
+    "taiwan-strait": ["taiwan", "china"],
+    "korea": ["korea", "pyongyang"],
+}
+
+# Plain substring matching, as scoring has always counted e.g. "war" in "warns"
+_escalation_matcher = KeywordMatcher(
+    {"escalation": ESCALATION_KEYWORDS}, whole_word_max_len=0
+)
+_trigger_matcher = KeywordMatcher({"trigger": TRIGGER_PHRASES}, whole_word_max_len=0)
+_social_region_matcher = KeywordMatcher(SOCIAL_REGION_KEYWORDS, whole_word_max_len=0)
+
+
+# Sweeps return mostly the same articles and posts; match each text once
+@lru_cache(maxsize=16384)
+def _escalation_keywords(text: str) -> frozenset[str]:
+    return frozenset(_escalation_matcher.keywords(text))
+
+
+@lru_cache(maxsize=16384)
+def _news_escalation(title: str, summary: str) -> frozenset[str]:
+    # Keyed on the parts: their hashes are cached, a joined copy's is not
+    return frozenset(_escalation_matcher.keywords(f"{title} {summary}"))
+
+
+@lru_cache(maxsize=16384)
+def _is_trigger(title: str) -> bool:
+    return _trigger_matcher.contains_any(title)
+
+
+@lru_cache(maxsize=16384)
+def _mentioned_regions(text: str) -> frozenset[str]:
+    return frozenset(_social_region_matcher.labels(text))
+
+
+@dataclass
+class ScoringInputs:
+    """Everything one scoring pass reads, already fetched"""
+
+    news_items: list[NewsItem] = field(default_factory=list)
+    bsky_posts: list[SocialPost] = field(default_factory=list)
+    truth_posts: list[TruthPost] = field(default_factory=list)
+    # region -> 0-100, missing regions score 50 (Google Trends)
+    trends: dict[str, float] = field(default_factory=dict)
+    # region -> 0-100 scores the services maintain themselves
+    news_velocity: dict[str, float] = field(default_factory=dict)
+    prediction_volatility: dict[str, float] = field(default_factory=dict)
+    market_movement: dict[str, float] = field(default_factory=dict)
+
+
+def compute_factor_matrix(
+    inputs: ScoringInputs,
+    regions: list[str],
+    factors: Sequence[str] = FACTORS,
+) -> np.ndarray:
+    """Regions x factors matrix of 0-100 factor scores (rounded to 0.1)
+
+    Every news item and post is visited once and bucketed by region, so the
+    cost is O(items + regions) however many regions are scored. Inputs that
+    none of the requested factors read are skipped.
+    """
+    index = {region: i for i, region in enumerate(regions)}
+    n = len(regions)
+    wanted = set(factors)
+    sentiment = "sentiment_shift" in wanted
+
+    escalation: list[set[str]] = [set() for _ in range(n)]
+    headlines = [0] * n
+    triggers = np.zeros(n)
+    posts = np.zeros(n)
+    engagement = np.zeros(n)
+
+    if sentiment or "event_triggers" in wanted:
+        for item in inputs.news_items:
+            i = index.get(item.region)
+            if i is None:
+                continue
+            if sentiment:
+                escalation[i].update(_news_escalation(item.title, item.summary))
+            if headlines[i] < TRIGGER_HEADLINES:
+                headlines[i] += 1
+                if _is_trigger(item.title):
+                    triggers[i] += 1
+
+    if "social_volume" in wanted:
+        for post in (*inputs.bsky_posts, *inputs.truth_posts):
+            post_engagement = post.likes + post.reposts
+            i = index.get(post.region)
+            if i is not None:
+                posts[i] += 1
+                engagement[i] += post_engagement
+            for region in _mentioned_regions(post.text):
+                j = index.get(region)
+                if j is not None:
+                    posts[j] += 0.5
+                    engagement[j] += post_engagement
+
+    if sentiment:
+        # Only Bluesky posts feed the sentiment factor
+        for post in inputs.bsky_posts:
+            i = index.get(post.region)
+            if i is not None:
+                escalation[i].update(_escalation_keywords(post.text))
+
+    def per_region(values: dict[str, float], default: float = 0.0) -> np.ndarray:
+        return np.array([values.get(region, default) for region in regions], float)
+
+    columns = {
+        "news_velocity": lambda: per_region(inputs.news_velocity),
+        # 10 posts or 100 engagement = 50 each
+        "social_volume": lambda: (
+            np.minimum(posts / 10 * 50, 50) + np.minimum(engagement / 100 * 50, 50)
+        ),
+        "google_trends": lambda: per_region(inputs.trends, 50.0),
+        # 20 distinct escalation keywords = 100
+        "sentiment_shift": lambda: np.minimum(
+            np.array([len(found) for found in escalation]) / 20 * 100, 100
+        ),
+        "prediction_volatility": lambda: per_region(inputs.prediction_volatility),
+        "market_movement": lambda: per_region(inputs.market_movement),
+        # 5 trigger headlines = 100
+        "event_triggers": lambda: np.minimum(triggers / 5 * 100, 100),
+    }
+    matrix = np.empty((n, len(factors)))
+    for j, factor in enumerate(factors):
+        matrix[:, j] = columns[factor]()
+    return np.round(matrix, 1)
+
 
 class HotspotDetector:
-    def __init__(self):
+    def __init__(
+        self,
+        history_dir: Optional[str] = settings.HOTSPOT_HISTORY_DIR,
+        snapshot_path: Optional[str] = settings.HOTSPOT_SNAPSHOT_PATH,
+        weights: Optional[dict[str, float]] = None,
+        z_levels: Sequence[tuple[float, AlertLevel]] = Z_LEVELS,
+    ):
         self.scores: dict[str, RegionScore] = {}
         self.current_hotspot: Optional[str] = None
-        self.history: list[dict] = []
+        # No history_dir: nothing persisted (offline replay)
+        self.history = ScoreHistory(history_dir, list(REGIONS)) if history_dir else None
         self.last_update: Optional[datetime] = None
+        # WEIGHTS as a vector; overridable for backtests (missing factors = 0)
+        self.weights = (
+            WEIGHT_VECTOR
+            if weights is None
+            else np.array([weights.get(factor, 0.0) for factor in FACTORS])
+        )
+        self.z_levels = tuple(z_levels)
+        # Regions x FACTORS, and the input versions it was computed from
+        self._factors = np.zeros((len(REGIONS), len(FACTORS)))
+        self._versions: dict[str, object] = {}
+        # Streaming baselines of every factor and the total, per region
+        self.anomalies = AnomalyDetector(
+            list(REGIONS),
+            (*FACTORS, "total"),
+            os.path.join(history_dir, "anomaly.npz") if history_dir else None,
+            # Factors are 0-100; the total spans the sum of the weights
+            ranges=(*(100.0,) * len(FACTORS), 100.0 * float(self.weights.sum())),
+        )
+        # Scored inputs for offline replay (app/services/replay.py)
+        self.recorder = SnapshotRecorder(snapshot_path) if snapshot_path else None
 
         # Initialize region scores
         for region_id, info in REGIONS.items():
@@ -68,241 +344,213 @@ class HotspotDetector:
                 region_id=region_id, name=info["name"], name_zh=info["name_zh"]
             )
 
-    def _determine_alert_level(self, score: float) -> AlertLevel:
-        """Determine alert level based on score"""
-        if score >= 80:
-            return AlertLevel.CRITICAL
-        elif score >= 60:
-            return AlertLevel.HIGH
-        elif score >= 40:
-            return AlertLevel.ELEVATED
-        else:
+    def _determine_alert_level(
+        self, score: float, z_score: Optional[float] = None
+    ) -> AlertLevel:
+        """Determine alert level based on score, or on its z-score once the
+        region has a baseline
+
+        Against the baseline, a region that is always loud settles back to
+        LOW and only genuine spikes (with a total of at least Z_MIN_SCORE)
+        escalate.
+        """
+        if z_score is None:
+            if score >= 80:
+                return AlertLevel.CRITICAL
+            if score >= 60:
+                return AlertLevel.HIGH
+            if score >= 40:
+                return AlertLevel.ELEVATED
             return AlertLevel.LOW
 
-    def _calculate_sentiment_shift(
-        self, news_items: list[NewsItem], posts: list[SocialPost]
-    ) -> float:
-        """Calculate sentiment shift based on content analysis"""
-        # Keywords indicating escalation
-        escalation_keywords = [
-            "strike",
-            "attack",
-            "war",
-            "invasion",
-            "military",
-            "nuclear",
-            "missile",
-            "bomb",
-            "troops",
-            "conflict",
-            "threat",
-            "urgent",
-            "breaking",
-            "emergency",
-            "crisis",
-            "escalation",
-            "tension",
-        ]
+        if score >= Z_MIN_SCORE:
+            for threshold, level in self.z_levels:
+                if z_score >= threshold:
+                    return level
+        return AlertLevel.LOW
 
-        # Combine all text
-        all_text = " ".join(
-            [item.title.lower() + " " + item.summary.lower() for item in news_items]
-        )
-        all_text += " ".join([post.text.lower() for post in posts])
-
-        # Count escalation keywords
-        count = sum(1 for kw in escalation_keywords if kw in all_text)
-
-        # Normalize: 20+ keywords = 100
-        return min(count / 20 * 100, 100)
-
-    def _calculate_event_triggers(self, news_items: list[NewsItem]) -> float:
-        """Check for major event triggers in headlines"""
-        trigger_phrases = [
-            "breaking:",
-            "just in:",
-            "urgent:",
-            "developing:",
-            "strike",
-            "explosion",
-            "attack",
-            "invasion",
-            "declares war",
-            "state of emergency",
-            "evacuate",
-            "nuclear",
-            "missile launch",
-            "airstrikes",
+    def _input_versions(self, trends: dict[str, float]) -> dict[str, object]:
+        """Current version of every factor input (see FACTOR_INPUTS)"""
+        return {
+            "news": news_aggregator.version,
+            "bluesky": bluesky_service.version,
+            "truthsocial": truthsocial_service.version,
+            "polymarket": polymarket_service.version,
+            "commodities": commodities_service.version,
+            # Trend values are few and have no cache version; compare them
+            "trends": trends,
+            "clock": int(time.time() // 60),
+        }
+
+    def _dirty_factors(self, versions: dict[str, object]) -> list[str]:
+        """Factors with an input whose version differs from the last score()"""
+        return [
+            factor
+            for factor in FACTORS
+            if any(
+                versions[name] != self._versions.get(name)
+                for name in FACTOR_INPUTS[factor]
+            )
         ]
 
-        trigger_count = 0
-        for item in news_items[:20]:  # Check recent items
-            text = item.title.lower()
-            for phrase in trigger_phrases:
-                if phrase in text:
-                    trigger_count += 1
-                    break
-
-        # Normalize: 5+ triggers = 100
-        return min(trigger_count / 5 * 100, 100)
-
-    def _calculate_social_volume(
-        self, bsky_posts: list, truth_posts: list, region: str
-    ) -> float:
-        """Calculate combined social volume from all platforms"""
-        # Count posts for this region
-        bsky_count = sum(1 for p in bsky_posts if p.region == region)
-        truth_count = sum(1 for p in truth_posts if p.region == region)
-
-        # Count engagement
-        bsky_engagement = sum(
-            p.likes + p.reposts for p in bsky_posts if p.region == region
-        )
-        truth_engagement = sum(
-            p.likes + p.reposts for p in truth_posts if p.region == region
+    def score(
+        self, inputs: ScoringInputs, versions: dict[str, object], now: datetime
+    ) -> np.ndarray:
+        """Score one tick from inputs that are already fetched (live or replayed)
+
+        versions holds the version of every FACTOR_INPUTS input; only factors
+        with a changed input are recomputed. Returns the total per region.
+        """
+        dirty = self._dirty_factors(versions)
+        region_ids = list(REGIONS)
+        if dirty:
+            # One pass over the changed inputs; unchanged columns are kept
+            columns = [FACTORS.index(factor) for factor in dirty]
+            self._factors[:, columns] = compute_factor_matrix(inputs, region_ids, dirty)
+            for factor in dirty:
+                FACTOR_RECOMPUTES.inc(factor=factor)
+        self._versions = versions
+
+        # One weighted dot product for the totals
+        totals = self._factors @ self.weights
+
+        # z-scores against each region's baseline, then update it: O(1)
+        z_scores = self.anomalies.update(
+            np.column_stack([self._factors, totals]), now.timestamp()
         )
 
-        total_posts = bsky_count + truth_count
-        total_engagement = bsky_engagement + truth_engagement
-
-        # Also count posts mentioning region keywords (even if not classified)
-        region_keywords = {
-            "iran": ["iran", "tehran", "persian"],
-            "israel-palestine": ["israel", "gaza", "hamas"],
-            "russia-ukraine": ["ukraine", "russia", "kyiv"],
-            "taiwan-strait": ["taiwan", "china"],
-            "korea": ["korea", "pyongyang"],
-        }
-        keywords = region_keywords.get(region, [])
-
-        for p in bsky_posts + truth_posts:
-            text = p.text.lower() if hasattr(p, "text") else ""
-            if any(kw in text for kw in keywords):
-                total_posts += 0.5
-                total_engagement += (p.likes + p.reposts) if hasattr(p, "likes") else 0
-
-        # Normalize: 10 posts or 100 engagement = 50 each, max 100
-        post_score = min(total_posts / 10 * 50, 50)
-        engagement_score = min(total_engagement / 100 * 50, 50)
+        for region_id, row, total_score, z_row in zip(
+            region_ids,
+            self._factors.tolist(),
+            totals.tolist(),
+            z_scores.tolist(),
+            strict=True,
+        ):
+            z_total = None if math.isnan(z_row[-1]) else round(z_row[-1], 2)
+            self.scores[region_id] = RegionScore(
+                region_id=region_id,
+                name=REGIONS[region_id]["name"],
+                name_zh=REGIONS[region_id]["name_zh"],
+                total_score=round(total_score, 1),
+                alert_level=self._determine_alert_level(total_score, z_total),
+                factors=dict(zip(FACTORS, row, strict=True)),
+                z_score=z_total,
+                anomalies={
+                    factor: round(z, 2)
+                    for factor, z in zip(FACTORS, z_row[:-1], strict=True)
+                    if z >= ANOMALY_Z
+                },
+                last_updated=now,
+            )
 
-        return post_score + engagement_score
+        # Determine current hotspot: highest alert level among the regions
+        # close to the top score, then score
+        contender = HOTSPOT_SCORE_SHARE * float(totals.max())
+        self.current_hotspot = max(
+            self.scores.keys(),
+            key=lambda r: (
+                self.scores[r].total_score >= contender,
+                ALERT_RANK[self.scores[r].alert_level],
+                self.scores[r].total_score,
+            ),
+        )
 
-    async def update_scores(self) -> None:
-        """Update all region scores using real API data"""
+        self.last_update = now
+
+        # Record history (flushed to disk periodically)
+        totals = np.round(totals, 1)
+        if self.history:
+            self.history.record(totals, self.current_hotspot, now.timestamp())
+        if self.recorder:
+            self.recorder.record(now.timestamp(), versions, inputs)
+        return totals
+
+    async def update_scores(self, sources: Optional[Iterable[str]] = None) -> None:
+        """Update all region scores using real API data
+
+        sources limits which upstreams are awaited (default: all of SOURCES);
+        the others are read from their caches as they are. Only factors whose
+        inputs changed since the previous update are recomputed.
+        """
+        wanted = SOURCES if sources is None else tuple(sources)
+        unknown = set(wanted) - set(SOURCES)
+        if unknown:
+            raise ValueError(f"Unknown sources: {sorted(unknown)}")
+
+        started = time.perf_counter()
         try:
-            # Fetch data from all services concurrently
-            news_task = news_aggregator.fetch_all()
-            bsky_task = bluesky_service.fetch_all()
-            truth_task = truthsocial_service.fetch_all()
-            prediction_task = polymarket_service.fetch_all()
-            market_task = commodities_service.fetch_commodities()
-
-            (
-                news_items,
-                bsky_posts,
-                truth_posts,
-                predictions,
-                market_data,
-            ) = await asyncio.gather(
-                news_task,
-                bsky_task,
-                truth_task,
-                prediction_task,
-                market_task,
+            fetchers = {
+                "news": news_aggregator.fetch_all,
+                "bluesky": bluesky_service.fetch_all,
+                "truthsocial": truthsocial_service.fetch_all,
+                "polymarket": polymarket_service.fetch_all,
+                "commodities": commodities_service.fetch_commodities,
+                # Every region's trend interest concurrently (rate limited)
+                "trends": google_trends_service.get_all_regions_interest,
+            }
+
+            # Fetch the requested sources concurrently
+            awaited = [source for source in SOURCES if source in wanted]
+            results = await asyncio.gather(
+                *(_timed(f"fetch_{source}", fetchers[source]()) for source in awaited),
                 return_exceptions=True,
             )
 
-            # Handle exceptions
-            if isinstance(news_items, Exception):
-                print(f"News fetch error: {news_items}")
-                news_items = []
-            if isinstance(bsky_posts, Exception):
-                print(f"Bluesky fetch error: {bsky_posts}")
-                bsky_posts = []
-            if isinstance(truth_posts, Exception):
-                print(f"Truth Social fetch error: {truth_posts}")
-                truth_posts = []
-            if isinstance(predictions, Exception):
-                print(f"Prediction fetch error: {predictions}")
-                predictions = []
-            if isinstance(market_data, Exception):
-                print(f"Market fetch error: {market_data}")
-                market_data = {}
-
-            # Combine social posts for sentiment analysis
-            all_social = []
-            for p in bsky_posts:
-                all_social.append(p)
-
-            # Calculate scores for each region
-            for region_id in REGIONS.keys():
-                # Filter data by region
-                region_news = [n for n in news_items if n.region == region_id]
-                region_posts = [p for p in all_social if p.region == region_id]
-                # Filter predictions for region (used for volatility calculation)
-                _ = [p for p in predictions if p.region == region_id]
-
-                # Calculate individual factors
-                news_velocity = news_aggregator.get_news_velocity(region_id)
-                social_volume = self._calculate_social_volume(
-                    bsky_posts, truth_posts, region_id
+            # Handle exceptions: keep scoring with the last good data
+            data = {}
+            for source, result in zip(awaited, results, strict=True):
+                if isinstance(result, Exception):
+                    print(f"{source} fetch error: {result}")
+                else:
+                    data[source] = result
+
+            news_items = data.get("news", news_aggregator.peek())
+            bsky_posts = data.get("bluesky", bluesky_service.peek())
+            truth_posts = data.get("truthsocial", truthsocial_service.peek())
+            trends = data.get("trends")
+            if trends is None:
+                trends = google_trends_service.get_cached_interest()
+
+            fetched = time.perf_counter()
+            UPDATE_PHASE_SECONDS.observe(fetched - started, phase="fetch")
+
+            versions = self._input_versions(trends)
+            dirty = self._dirty_factors(versions)
+
+            def per_region(score) -> dict[str, float]:
+                return {r: score(r) for r in REGIONS}
+
+            # Per-region scores the services keep up to date themselves, only
+            # fetched for the factors about to be recomputed
+            inputs = ScoringInputs(
+                news_items=news_items,
+                bsky_posts=bsky_posts,
+                truth_posts=truth_posts,
+                trends=trends,
+                news_velocity=per_region(news_aggregator.get_news_velocity)
+                if "news_velocity" in dirty
+                else {},
+                prediction_volatility=per_region(
+                    polymarket_service.get_prediction_volatility
                 )
-                # Get Google Trends interest (0-100)
-                google_trends = await google_trends_service.get_trend_interest(region_id)
-                sentiment_shift = self._calculate_sentiment_shift(
-                    region_news, region_posts
-                )
-                prediction_volatility = polymarket_service.get_prediction_volatility(
-                    region_id
-                )
-                market_movement = commodities_service.get_market_movement(region_id)
-                event_triggers = self._calculate_event_triggers(region_news)
-
-                factors = {
-                    "news_velocity": round(news_velocity, 1),
-                    "social_volume": round(social_volume, 1),
-                    "google_trends": round(google_trends, 1),
-                    "sentiment_shift": round(sentiment_shift, 1),
-                    "prediction_volatility": round(prediction_volatility, 1),
-                    "market_movement": round(market_movement, 1),
-                    "event_triggers": round(event_triggers, 1),
-                }
-
-                # Calculate weighted total
-                total_score = sum(
-                    factors[factor] * weight for factor, weight in WEIGHTS.items()
-                )
-
-                # Update region score
-                self.scores[region_id] = RegionScore(
-                    region_id=region_id,
-                    name=REGIONS[region_id]["name"],
-                    name_zh=REGIONS[region_id]["name_zh"],
-                    total_score=round(total_score, 1),
-                    alert_level=self._determine_alert_level(total_score),
-                    factors=factors,
-                    last_updated=datetime.now(timezone.utc),
-                )
-
-            # Determine current hotspot (highest score)
-            self.current_hotspot = max(
-                self.scores.keys(), key=lambda r: self.scores[r].total_score
+                if "prediction_volatility" in dirty
+                else {},
+                market_movement=per_region(commodities_service.get_market_movement)
+                if "market_movement" in dirty
+                else {},
             )
 
-            # Record history
-            self.history.append(
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "hotspot": self.current_hotspot,
-                    "scores": {r: s.total_score for r, s in self.scores.items()},
-                }
-            )
+            self.score(inputs, versions, datetime.now(timezone.utc))
 
-            # Keep only last 100 history entries
-            if len(self.history) > 100:
-                self.history = self.history[-100:]
+            finished = time.perf_counter()
+            UPDATE_PHASE_SECONDS.observe(finished - fetched, phase="score")
+            UPDATE_PHASE_SECONDS.observe(finished - started, phase="total")
 
-            self.last_update = datetime.now(timezone.utc)
+            if self.history:
+                await self.history.flush_if_due()
+            await self.anomalies.save_if_due()
+            if self.recorder:
+                await self.recorder.flush_if_due()
 
         except Exception as e:
             print(f"Error updating scores: {e}")
@@ -324,14 +572,41 @@ class HotspotDetector:
                 "total_score": score.total_score,
                 "alert_level": score.alert_level.value,
                 "factors": score.factors,
+                "z_score": score.z_score,
+                "anomalies": score.anomalies,
                 "last_updated": score.last_updated.isoformat(),
             }
             for region_id, score in self.scores.items()
         }
 
-    def get_history(self, limit: int = 20) -> list[dict]:
-        """Get score history"""
-        return self.history[-limit:]
+    def get_update_payload(self) -> dict:
+        """Build the hotspot_update message pushed to WebSocket clients"""
+        return {
+            "type": "hotspot_update",
+            "current_hotspot": self.current_hotspot,
+            "regions": self.get_all_scores(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def get_history(
+        self,
+        since: datetime,
+        until: datetime,
+        resolution: str = "auto",
+        limit: int = DEFAULT_POINTS,
+    ) -> dict:
+        """Get score history as columnar series (see ScoreHistory.query)"""
+        return self.history.query(
+            since.timestamp(), until.timestamp(), resolution, limit
+        )
+
+    def close(self) -> None:
+        """Flush the score history and anomaly baselines (app lifespan)"""
+        if self.history:
+            self.history.close()
+        self.anomalies.save()
+        if self.recorder:
+            self.recorder.close()
 
 
 # Global instance
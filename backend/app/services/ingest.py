@@ -0,0 +1,48 @@
+"""
+Ingest Hub
+Data services publish each batch of newly ingested items here; consumers
+(search index, live stream) subscribe without the services knowing about them
+"""
+
+from typing import Callable
+
+# Item kinds published by the services
+NEWS = "news"
+BLUESKY = "bluesky"
+TRUTHSOCIAL = "truthsocial"
+TWITTER = "twitter"
+
+Listener = Callable[[str, list], None]
+
+
+class IngestHub:
+    """Synchronous fan-out of (kind, items) batches to registered listeners"""
+
+    def __init__(self):
+        # listener -> whether it also wants backfill batches
+        self._listeners: dict[Listener, bool] = {}
+
+    def subscribe(self, listener: Listener, backfill: bool = True) -> None:
+        """backfill=False: only items ingested live, not ones reloaded from
+        storage at startup"""
+        self._listeners[listener] = backfill
+
+    def unsubscribe(self, listener: Listener) -> None:
+        self._listeners.pop(listener, None)
+
+    def publish(self, kind: str, items: list, backfill: bool = False) -> None:
+        """Hand a batch to every listener; one failing listener doesn't
+        stop the others or the publishing service"""
+        if not items:
+            return
+        for listener, wants_backfill in list(self._listeners.items()):
+            if backfill and not wants_backfill:
+                continue
+            try:
+                listener(kind, items)
+            except Exception as e:
+                print(f"Ingest listener error ({kind}): {e}")
+
+
+# Global instance
+ingest_hub = IngestHub()
@@ -10,12 +10,16 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from typing import Optional
 
+from app.core.cache import TTLCache
+from app.core.http import http_client
+from app.core.metrics import track_upstream
 from app.core.proxy import get_proxy
 
 
 # Rate limiting
 MAX_CONCURRENT = 2
 REQUEST_DELAY = 0.5
+REQUEST_JITTER = 0.3
 
 
 @dataclass
@@ -46,13 +50,19 @@ class CommoditiesService:
         self.cache: dict[str, CommodityData] = {}
         self.last_fetch: Optional[datetime] = None
         self.fetch_interval = timedelta(minutes=5)
+        self._quotes_cache = TTLCache(
+            "commodities",
+            self._refresh,
+            soft_ttl=self.fetch_interval,
+            hard_ttl=timedelta(minutes=30),
+        )
 
     async def _fetch_quote(
         self, session: aiohttp.ClientSession, symbol: str, semaphore: asyncio.Semaphore
     ) -> Optional[dict]:
         """Fetch quote data from Yahoo Finance with rate limiting"""
         async with semaphore:
-            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, 0.3))
+            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, REQUEST_JITTER))
 
             for attempt in range(3):
                 try:
@@ -62,15 +72,20 @@ class CommoditiesService:
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                     }
 
-                    async with session.get(
-                        url,
-                        params=params,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                        proxy=get_proxy(),
-                    ) as response:
+                    async with (
+                        track_upstream("yahoo", symbol) as call,
+                        session.get(
+                            url,
+                            params=params,
+                            headers=headers,
+                            timeout=http_client.timeout("yahoo"),
+                            proxy=get_proxy(),
+                        ) as response,
+                    ):
+                        call.status = response.status
                         if response.status == 200:
                             data = await response.json()
+                            call.done()
                             result = data.get("chart", {}).get("result", [])
                             if result:
                                 return result[0]
@@ -95,60 +110,66 @@ class CommoditiesService:
             return None
 
     async def fetch_commodities(self, force: bool = False) -> list[CommodityData]:
-        """Fetch commodity prices"""
-        now = datetime.now()
+        """Fetch commodity prices (stale-while-revalidate)"""
+        commodities = await self._quotes_cache.get(force=force)
+
+        if not commodities:
+            return self._get_mock_commodities()
+
+        return commodities
 
-        if not force and self.cache and self.last_fetch:
-            if (now - self.last_fetch) < self.fetch_interval:
-                return list(self.cache.values())
+    @property
+    def version(self) -> int:
+        """Bumped after every completed refresh"""
+        return self._quotes_cache.version
 
+    async def _refresh(self) -> list[CommodityData]:
+        """Fetch all commodity quotes and rebuild the cache"""
+        now = datetime.now()
         commodities = []
         semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_quote(session, symbol, semaphore)
-                for symbol in COMMODITIES.keys()
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for symbol, result in zip(COMMODITIES.keys(), results):
-                if isinstance(result, dict):
-                    try:
-                        meta = result.get("meta", {})
-                        indicators = result.get("indicators", {})
-                        quotes = indicators.get("quote", [{}])[0]
-
-                        current = meta.get("regularMarketPrice", 0)
-                        prev_close = meta.get("previousClose") or meta.get(
-                            "chartPreviousClose", 0
-                        )
-
-                        change = current - prev_close if prev_close else 0
-                        change_pct = (change / prev_close * 100) if prev_close else 0
-
-                        # Get price history
-                        closes = quotes.get("close", [])
-                        history = [p for p in closes if p is not None][-24:]
-
-                        commodity = CommodityData(
-                            symbol=symbol,
-                            name=COMMODITIES[symbol],
-                            price=round(current, 2),
-                            change=round(change, 2),
-                            change_percent=round(change_pct, 2),
-                            history=history,
-                        )
-                        commodities.append(commodity)
-                        self.cache[symbol] = commodity
-
-                    except Exception as e:
-                        print(f"Error parsing {symbol}: {e}")
+        session = http_client.get_session()
+        tasks = [
+            self._fetch_quote(session, symbol, semaphore)
+            for symbol in COMMODITIES.keys()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        self.last_fetch = now
+        for symbol, result in zip(COMMODITIES.keys(), results):
+            if isinstance(result, dict):
+                try:
+                    meta = result.get("meta", {})
+                    indicators = result.get("indicators", {})
+                    quotes = indicators.get("quote", [{}])[0]
+
+                    current = meta.get("regularMarketPrice", 0)
+                    prev_close = meta.get("previousClose") or meta.get(
+                        "chartPreviousClose", 0
+                    )
+
+                    change = current - prev_close if prev_close else 0
+                    change_pct = (change / prev_close * 100) if prev_close else 0
+
+                    # Get price history
+                    closes = quotes.get("close", [])
+                    history = [p for p in closes if p is not None][-24:]
+
+                    commodity = CommodityData(
+                        symbol=symbol,
+                        name=COMMODITIES[symbol],
+                        price=round(current, 2),
+                        change=round(change, 2),
+                        change_percent=round(change_pct, 2),
+                        history=history,
+                    )
+                    commodities.append(commodity)
+                    self.cache[symbol] = commodity
 
-        if not commodities:
-            return self._get_mock_commodities()
+                except Exception as e:
+                    print(f"Error parsing {symbol}: {e}")
+
+        self.last_fetch = now
 
         return commodities
 
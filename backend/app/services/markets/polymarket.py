@@ -10,9 +10,15 @@ from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
 
+from app.core.cache import TTLCache
+from app.core.http import http_client
+from app.core.metrics import track_upstream
+from app.services.text.keywords import KeywordMatcher
+
 
 # Rate limiting
 REQUEST_DELAY = 0.5
+REQUEST_JITTER = 0.3
 
 
 @dataclass
@@ -37,6 +43,7 @@ class PredictionMarket:
 
 
 GAMMA_API = "https://gamma-api.polymarket.com"
+CLOB_API = "https://clob.polymarket.com"
 
 # STRICT keywords - must match geopolitical content
 GEOPOLITICAL_KEYWORDS = {
@@ -207,6 +214,40 @@ EXCLUDE_KEYWORDS = [
     "kardashian",
 ]
 
+# General conflict/military terms (need a country term as well)
+CONFLICT_TERMS = [
+    "war",
+    "strike",
+    "invasion",
+    "military",
+    "troops",
+    "missile",
+    "nuclear",
+    "conflict",
+    "sanctions",
+]
+COUNTRY_TERMS = [
+    "us ",
+    "united states",
+    "china",
+    "russia",
+    "iran",
+    "israel",
+    "ukraine",
+    "korea",
+    "taiwan",
+]
+
+KEYWORD_MATCHER = KeywordMatcher(
+    {
+        **GEOPOLITICAL_KEYWORDS,
+        "exclude": EXCLUDE_KEYWORDS,
+        "conflict": CONFLICT_TERMS,
+        "country": COUNTRY_TERMS,
+    }
+)
+EXCLUDE_MATCHER = KeywordMatcher({"exclude": EXCLUDE_KEYWORDS})
+
 
 class PolymarketService:
     def __init__(self):
@@ -214,56 +255,35 @@ class PolymarketService:
         self.all_markets: list[PredictionMarket] = []
         self.last_fetch: Optional[datetime] = None
         self.fetch_interval = timedelta(minutes=5)
+        self._markets_cache = TTLCache(
+            "polymarket",
+            self._refresh,
+            soft_ttl=self.fetch_interval,
+            hard_ttl=timedelta(minutes=30),
+        )
 
     def _is_geopolitical(self, question: str) -> bool:
         """Check if market is about geopolitics"""
-        q_lower = question.lower()
+        labels = KEYWORD_MATCHER.labels(question)
 
         # Exclude non-geopolitical content
-        if any(excl in q_lower for excl in EXCLUDE_KEYWORDS):
+        if "exclude" in labels:
             return False
 
         # Must match geopolitical keywords
-        for keywords in GEOPOLITICAL_KEYWORDS.values():
-            if any(kw in q_lower for kw in keywords):
-                return True
+        if any(region in labels for region in GEOPOLITICAL_KEYWORDS):
+            return True
 
         # Also accept general conflict/military terms
-        conflict_terms = [
-            "war",
-            "strike",
-            "invasion",
-            "military",
-            "troops",
-            "missile",
-            "nuclear",
-            "conflict",
-            "sanctions",
-        ]
-        country_terms = [
-            "us ",
-            "united states",
-            "china",
-            "russia",
-            "iran",
-            "israel",
-            "ukraine",
-            "korea",
-            "taiwan",
-        ]
-
-        has_conflict = any(ct in q_lower for ct in conflict_terms)
-        has_country = any(ct in q_lower for ct in country_terms)
-
-        return has_conflict and has_country
+        return "conflict" in labels and "country" in labels
 
     def _classify_region(self, question: str) -> Optional[str]:
         """Classify market by region - STRICT"""
-        q_lower = question.lower()
+        hits = KEYWORD_MATCHER.keywords_by_label(question)
 
         scores = {}
-        for region, keywords in GEOPOLITICAL_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in q_lower)
+        for region in GEOPOLITICAL_KEYWORDS:
+            score = len(hits.get(region, ()))
             if score > 0:
                 scores[region] = score
 
@@ -281,8 +301,7 @@ class PolymarketService:
                 return None
 
             # Exclude non-geopolitical content
-            q_lower = question.lower()
-            if any(excl in q_lower for excl in EXCLUDE_KEYWORDS):
+            if EXCLUDE_MATCHER.contains_any(question):
                 return None
 
             # Classify region (relaxed - allow None)
@@ -357,13 +376,17 @@ class PolymarketService:
         tag_name: str = "api",
     ) -> list:
         """Fetch with retry and rate limiting"""
-        await asyncio.sleep(REQUEST_DELAY + random.uniform(0, 0.3))
+        await asyncio.sleep(REQUEST_DELAY + random.uniform(0, REQUEST_JITTER))
 
         for attempt in range(3):
             try:
-                async with session.get(
-                    url, params=params, timeout=aiohttp.ClientTimeout(total=20)
-                ) as response:
+                async with (
+                    track_upstream("polymarket", tag_name) as call,
+                    session.get(
+                        url, params=params, timeout=http_client.timeout("polymarket")
+                    ) as response,
+                ):
+                    call.status = response.status
                     if response.status == 200:
                         return await response.json()
                     elif response.status in (429, 503):
@@ -455,19 +478,19 @@ class PolymarketService:
         return markets
 
     async def fetch_all(self, force: bool = False) -> list[PredictionMarket]:
-        """Fetch all geopolitical prediction markets"""
-        now = datetime.now()
+        """Fetch all geopolitical prediction markets (stale-while-revalidate)"""
+        return await self._markets_cache.get(force=force)
 
-        if (
-            not force
-            and self.all_markets
-            and self.last_fetch
-            and (now - self.last_fetch) < self.fetch_interval
-        ):
-            return self.all_markets
+    @property
+    def version(self) -> int:
+        """Bumped after every completed refresh"""
+        return self._markets_cache.version
 
-        async with aiohttp.ClientSession() as session:
-            markets = await self._fetch_markets(session)
+    async def _refresh(self) -> list[PredictionMarket]:
+        """Fetch markets from all strategies and rebuild the cache"""
+        now = datetime.now()
+        session = http_client.get_session()
+        markets = await self._fetch_markets(session)
 
         # Deduplicate and cache by region
         seen = set()
@@ -502,18 +525,23 @@ class PolymarketService:
     ) -> tuple[list, float]:
         """Fetch price history for a market from CLOB API. Returns (history, change_24h)"""
         try:
-            url = "https://clob.polymarket.com/prices-history"
+            url = f"{CLOB_API}/prices-history"
             params = {
                 "market": clob_token_id,
                 "interval": "1d",
                 "fidelity": 50,
             }
 
-            async with session.get(
-                url, params=params, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
+            async with (
+                track_upstream("polymarket_clob", "prices-history") as call,
+                session.get(
+                    url, params=params, timeout=http_client.timeout("polymarket_clob")
+                ) as response,
+            ):
+                call.status = response.status
                 if response.status == 200:
                     data = await response.json()
+                    call.done()
                     raw_history = data.get("history", [])
 
                     # Extract prices as percentages
@@ -544,27 +572,27 @@ class PolymarketService:
         for m in self.all_markets:
             if m.id == market_id:
                 if not m.history and m.clob_token_id:
-                    async with aiohttp.ClientSession() as session:
-                        history, change = await self._fetch_price_history(
-                            session, m.clob_token_id
-                        )
-                        m.history = history
-                        if change != 0:
-                            m.change_24h = change
-                return m
-        return None
-
-    async def fetch_top_markets_history(self, limit: int = 10):
-        """Fetch history for top N markets (by volume)"""
-        async with aiohttp.ClientSession() as session:
-            for m in self.all_markets[:limit]:
-                if not m.history and m.clob_token_id:
+                    session = http_client.get_session()
                     history, change = await self._fetch_price_history(
                         session, m.clob_token_id
                     )
                     m.history = history
                     if change != 0:
                         m.change_24h = change
+                return m
+        return None
+
+    async def fetch_top_markets_history(self, limit: int = 10):
+        """Fetch history for top N markets (by volume)"""
+        session = http_client.get_session()
+        for m in self.all_markets[:limit]:
+            if not m.history and m.clob_token_id:
+                history, change = await self._fetch_price_history(
+                    session, m.clob_token_id
+                )
+                m.history = history
+                if change != 0:
+                    m.change_24h = change
 
     def get_prediction_volatility(self, region: str) -> float:
         """Calculate prediction volatility for a region"""
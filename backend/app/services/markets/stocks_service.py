@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from typing import Optional
 
+from app.core.cache import TTLCache
+from app.core.http import http_client
 from app.core.proxy import get_proxy
 
 
@@ -52,6 +54,12 @@ class StocksService:
         self.cache: dict[str, StockData] = {}
         self.last_fetch: Optional[datetime] = None
         self.fetch_interval = timedelta(minutes=1)
+        self._quotes_cache = TTLCache(
+            "stocks",
+            self._refresh,
+            soft_ttl=self.fetch_interval,
+            hard_ttl=timedelta(minutes=10),
+        )
 
     async def _fetch_quote(
         self, session: aiohttp.ClientSession, symbol: str, semaphore: asyncio.Semaphore
@@ -73,7 +81,7 @@ class StocksService:
                         url,
                         params=params,
                         headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
+                        timeout=http_client.timeout("yahoo"),
                         proxy=get_proxy(),
                     ) as response:
                         if response.status == 200:
@@ -103,58 +111,57 @@ class StocksService:
             return None
 
     async def fetch_defense_stocks(self, force: bool = False) -> list[StockData]:
-        """Fetch defense sector stocks via Yahoo Finance"""
-        now = datetime.now()
-
-        if not force and self.cache and self.last_fetch:
-            if (now - self.last_fetch) < self.fetch_interval:
-                return list(self.cache.values())
+        """Fetch defense sector stocks via Yahoo Finance (stale-while-revalidate)"""
+        return await self._quotes_cache.get(force=force)
 
+    async def _refresh(self) -> list[StockData]:
+        """Fetch all defense stock quotes and rebuild the cache"""
+        now = datetime.now()
         stocks = []
         semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_quote(session, symbol, semaphore)
-                for symbol in DEFENSE_STOCKS.keys()
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for symbol, result in zip(DEFENSE_STOCKS.keys(), results):
-                if isinstance(result, dict):
-                    try:
-                        meta = result.get("meta", {})
-                        indicators = result.get("indicators", {})
-                        quotes = indicators.get("quote", [{}])[0]
-
-                        current = meta.get("regularMarketPrice", 0)
-                        prev_close = meta.get("previousClose") or meta.get(
-                            "chartPreviousClose", 0
-                        )
-
-                        change = current - prev_close if prev_close else 0
-                        change_pct = (change / prev_close * 100) if prev_close else 0
-
-                        # Get price history
-                        closes = quotes.get("close", [])
-                        history = [p for p in closes if p is not None][-24:]
-
-                        stock = StockData(
-                            symbol=symbol,
-                            name=DEFENSE_STOCKS[symbol],
-                            price=round(current, 2),
-                            change=round(change, 2),
-                            change_percent=round(change_pct, 2),
-                            volume=int(meta.get("regularMarketVolume", 0)),
-                            market_cap=meta.get("marketCap"),
-                            category="defense",
-                            history=history,
-                        )
-                        stocks.append(stock)
-                        self.cache[symbol] = stock
-
-                    except Exception as e:
-                        print(f"Error parsing {symbol}: {e}")
+        session = http_client.get_session()
+        tasks = [
+            self._fetch_quote(session, symbol, semaphore)
+            for symbol in DEFENSE_STOCKS.keys()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for symbol, result in zip(DEFENSE_STOCKS.keys(), results):
+            if isinstance(result, dict):
+                try:
+                    meta = result.get("meta", {})
+                    indicators = result.get("indicators", {})
+                    quotes = indicators.get("quote", [{}])[0]
+
+                    current = meta.get("regularMarketPrice", 0)
+                    prev_close = meta.get("previousClose") or meta.get(
+                        "chartPreviousClose", 0
+                    )
+
+                    change = current - prev_close if prev_close else 0
+                    change_pct = (change / prev_close * 100) if prev_close else 0
+
+                    # Get price history
+                    closes = quotes.get("close", [])
+                    history = [p for p in closes if p is not None][-24:]
+
+                    stock = StockData(
+                        symbol=symbol,
+                        name=DEFENSE_STOCKS[symbol],
+                        price=round(current, 2),
+                        change=round(change, 2),
+                        change_percent=round(change_pct, 2),
+                        volume=int(meta.get("regularMarketVolume", 0)),
+                        market_cap=meta.get("marketCap"),
+                        category="defense",
+                        history=history,
+                    )
+                    stocks.append(stock)
+                    self.cache[symbol] = stock
+
+                except Exception as e:
+                    print(f"Error parsing {symbol}: {e}")
 
         self.last_fetch = now
 
@@ -5,32 +5,35 @@ Aggregates news from multiple sources for geopolitical monitoring
 
 import asyncio
 import aiohttp
-import feedparser
+import heapq
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from dataclasses import dataclass
-import re
-import html
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.http import http_client
+from app.core.metrics import track_upstream
+from app.services.ingest import ingest_hub, NEWS
+from app.services.news.clustering import StoryCluster, StoryClusterIndex
+from app.services.news.models import NewsItem
+from app.services.news.parsing import feed_parser
+from app.services.news.polling import AdaptivePoller
+from app.services.news.ranking import RankedList, time_key
+from app.services.news.store import ArticleStore
+from app.services.news.velocity import VelocityCounter, scale_velocity
+from app.services.text.keywords import KeywordMatcher
+from app.services.text.normalize import clean_text
 
 
 # Rate limiting for RSS feeds
 MAX_CONCURRENT = 4
 REQUEST_DELAY = 0.2
+REQUEST_JITTER = 0.2
 
 
-@dataclass
-class NewsItem:
-    id: str
-    title: str
-    summary: str
-    source: str
-    source_id: str
-    url: str
-    published: datetime
-    region: Optional[str] = None
-    classification: str = "OSINT"
-    relevance_score: float = 0.0
+# How often old articles are pruned from the store
+PRUNE_INTERVAL = timedelta(hours=1)
 
 
 # RSS Feed sources - FOCUSED on geopolitics/defense
@@ -261,34 +264,121 @@ TRIGGER_WORDS = [
     "evacuation",
 ]
 
+# Military/political context required alongside trigger words
+MILITARY_CONTEXT = [
+    "military",
+    "defense",
+    "army",
+    "navy",
+    "air force",
+    "strike",
+    "missile",
+    "nuclear",
+    "war",
+    "conflict",
+]
+
+# One automaton over regions, trigger words and military context
+KEYWORD_MATCHER = KeywordMatcher(
+    {
+        **REGION_KEYWORDS,
+        "trigger": TRIGGER_WORDS,
+        "military_context": MILITARY_CONTEXT,
+    }
+)
+
 
 class NewsAggregator:
     def __init__(self):
+        # Ranked views kept sorted incrementally; all_items and cache[region]
+        # are the live lists behind them
+        self._ranked = RankedList()
+        self._ranked_by_region: dict[str, RankedList] = {}
+        # Newest-first timelines for cursor pagination
+        self._timeline = RankedList(key=time_key)
+        self._timeline_by_region: dict[str, RankedList] = {}
         self.cache: dict[str, list[NewsItem]] = {}
-        self.all_items: list[NewsItem] = []
+        self.all_items: list[NewsItem] = self._ranked.items
         self.last_fetch: Optional[datetime] = None
-        self.fetch_interval = timedelta(minutes=3)
+        # Sweeps run as often as the fastest feed may be polled; each sweep
+        # only requests the feeds the poller says are due
+        self.fetch_interval = timedelta(seconds=settings.NEWS_POLL_FLOOR)
+        self.poller = AdaptivePoller(
+            floor=settings.NEWS_POLL_FLOOR,
+            ceiling=settings.NEWS_POLL_CEILING,
+            initial=180,
+        )
+        self.failed_feeds: set[str] = set()
+        self._force_all = False
+        # Conditional GET state: feed_key -> {"etag", "last_modified"}
+        self.feed_validators: dict[str, dict[str, str]] = {}
+        # Last parsed items per feed, reused when a feed answers 304
+        self.feed_items: dict[str, list[NewsItem]] = {}
+        # Entry ids the last parse of each feed filtered out as irrelevant
+        self.feed_rejected: dict[str, set[str]] = {}
+        self.not_modified_count = 0
+        # Articles seen within the retention window, served from memory and
+        # persisted to the article store on every sweep
+        self.store = ArticleStore(settings.NEWS_DB_PATH)
+        self.retention = timedelta(hours=settings.NEWS_RETENTION_HOURS)
+        self.retained: dict[str, NewsItem] = {}
+        self.last_seen: dict[str, datetime] = {}
+        # (last_seen timestamp, id) min-heap for expiry; entries may be stale
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._warm = False
+        self._last_prune: Optional[datetime] = None
+        # Sliding-window counts by publication time for get_news_velocity
+        self.velocity = VelocityCounter()
+        # Near-duplicate story clusters across sources
+        self.clusters = StoryClusterIndex()
+        self._sweep_cache = TTLCache(
+            "news",
+            self._refresh,
+            soft_ttl=self.fetch_interval,
+            hard_ttl=timedelta(minutes=30),
+        )
+
+    def _conditional_headers(self, feed_key: str) -> dict[str, str]:
+        """Build request headers with the feed's cached validators"""
+        headers = {"User-Agent": "Mozilla/5.0 EdgeSeeker/1.0"}
+        if feed_key not in self.feed_items:
+            # Nothing to reuse on a 304 yet - ask for the full feed
+            return headers
+        validators = self.feed_validators.get(feed_key, {})
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _store_validators(self, feed_key: str, response: aiohttp.ClientResponse):
+        """Remember ETag / Last-Modified for the next conditional request"""
+        validators = {}
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag:
+            validators["etag"] = etag
+        if last_modified:
+            validators["last_modified"] = last_modified
+        if validators:
+            self.feed_validators[feed_key] = validators
+        else:
+            self.feed_validators.pop(feed_key, None)
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags and decode entities"""
-        if not text:
-            return ""
-        clean = re.sub(r"<[^>]+>", "", text)
-        clean = html.unescape(clean)
-        clean = " ".join(clean.split())
-        return clean[:500]
-
-    def _classify_region(self, title: str, summary: str) -> Optional[str]:
-        """Classify news item by region - STRICT matching"""
-        text = f"{title} {summary}".lower()
+        return clean_text(text)
+
+    def _match_keywords(self, title: str, summary: str) -> dict[str, set[str]]:
+        """Single automaton pass over the article: matched keywords by label"""
+        return KEYWORD_MATCHER.keywords_by_label(f"{title} {summary}")
 
+    def _classify_region(self, hits: dict[str, set[str]]) -> Optional[str]:
+        """Classify news item by region - STRICT matching"""
         scores = {}
-        for region, keywords in REGION_KEYWORDS.items():
-            score = 0
-            for kw in keywords:
-                if kw in text:
-                    # Longer keywords get more weight
-                    score += len(kw.split())
+        for region in REGION_KEYWORDS:
+            # Longer keywords get more weight
+            score = sum(len(kw.split()) for kw in hits.get(region, ()))
             if score > 0:
                 scores[region] = score
 
@@ -300,21 +390,18 @@ class NewsAggregator:
         return None
 
     def _calculate_relevance(
-        self, title: str, summary: str, region: Optional[str]
+        self, hits: dict[str, set[str]], region: Optional[str]
     ) -> float:
         """Calculate relevance score - prioritize geopolitical content"""
         if not region:
             return 0.05  # Very low for unclassified
 
-        text = f"{title} {summary}".lower()
-        keywords = REGION_KEYWORDS.get(region, [])
-
         # Count keyword matches
-        matches = sum(1 for kw in keywords if kw in text)
+        matches = len(hits.get(region, ()))
         base_score = min(matches / 3, 0.6)  # Up to 0.6 for keywords
 
         # Boost for trigger words
-        trigger_boost = sum(0.1 for tw in TRIGGER_WORDS if tw in text)
+        trigger_boost = 0.1 * len(hits.get("trigger", ()))
         trigger_boost = min(trigger_boost, 0.3)
 
         # Boost for defense/military sources
@@ -322,33 +409,14 @@ class NewsAggregator:
 
         return min(base_score + trigger_boost + source_boost, 1.0)
 
-    def _is_relevant(self, title: str, summary: str) -> bool:
+    def _is_relevant(self, hits: dict[str, set[str]]) -> bool:
         """Check if article is relevant to geopolitical monitoring"""
-        text = f"{title} {summary}".lower()
-
         # Must match at least one region's keywords
-        for keywords in REGION_KEYWORDS.values():
-            if any(kw in text for kw in keywords):
-                return True
+        if any(region in hits for region in REGION_KEYWORDS):
+            return True
 
         # Or contain trigger words with military/political context
-        military_context = [
-            "military",
-            "defense",
-            "army",
-            "navy",
-            "air force",
-            "strike",
-            "missile",
-            "nuclear",
-            "war",
-            "conflict",
-        ]
-        if any(tw in text for tw in TRIGGER_WORDS):
-            if any(mc in text for mc in military_context):
-                return True
-
-        return False
+        return "trigger" in hits and "military_context" in hits
 
     async def _fetch_feed(
         self,
@@ -362,57 +430,84 @@ class NewsAggregator:
 
         async def do_fetch():
             nonlocal items
-            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, 0.2))
+            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, REQUEST_JITTER))
 
             try:
-                async with session.get(
-                    feed_config["url"],
-                    timeout=aiohttp.ClientTimeout(total=15),
-                    headers={"User-Agent": "Mozilla/5.0 EdgeSeeker/1.0"},
-                ) as response:
+                async with (
+                    track_upstream("rss", feed_key) as call,
+                    session.get(
+                        feed_config["url"],
+                        timeout=http_client.timeout("rss"),
+                        headers=self._conditional_headers(feed_key),
+                    ) as response,
+                ):
+                    call.status = response.status
+                    if response.status not in (200, 304):
+                        self.failed_feeds.add(feed_key)
+                        return
+
+                    if response.status == 304:
+                        # Unchanged since last poll - skip download and parse
+                        self.not_modified_count += 1
+                        items = list(self.feed_items.get(feed_key, []))
+                        return
+
                     if response.status == 200:
                         content = await response.text()
-                        parsed = feedparser.parse(content)
+                        call.done()
+                        # Parsed off the event loop; entries come back cleaned
+                        entries = await feed_parser.parse(
+                            content, url=feed_config["url"]
+                        )
 
-                        for entry in parsed.entries[:20]:
+                        rejected_before = self.feed_rejected.get(feed_key, set())
+                        rejected = set()
+
+                        for entry in entries:
                             try:
-                                title = self._clean_html(entry.get("title", ""))
-                                summary = self._clean_html(
-                                    entry.get("summary", entry.get("description", ""))
-                                )
+                                title = entry["title"]
+                                summary = entry["summary"]
+                                entry_id = entry["id"] or f"{feed_key}_{len(items)}"
+
+                                # Unchanged articles keep their classification
+                                known = self.retained.get(entry_id)
+                                if (
+                                    known
+                                    and known.title == title
+                                    and known.summary == summary
+                                ):
+                                    items.append(known)
+                                    continue
+                                if entry_id in rejected_before:
+                                    rejected.add(entry_id)
+                                    continue
 
                                 # FILTER: Only keep relevant articles
-                                if not self._is_relevant(title, summary):
+                                hits = self._match_keywords(title, summary)
+                                if not self._is_relevant(hits):
+                                    rejected.add(entry_id)
                                     continue
 
-                                # Parse published date
-                                published = datetime.now()
-                                if (
-                                    hasattr(entry, "published_parsed")
-                                    and entry.published_parsed
-                                ):
+                                # Parse published date (feedparser structs are UTC)
+                                published = datetime.now(timezone.utc)
+                                if entry["published"]:
                                     try:
                                         published = datetime(
-                                            *entry.published_parsed[:6]
+                                            *entry["published"], tzinfo=timezone.utc
                                         )
                                     except Exception:
                                         pass
 
-                                region = self._classify_region(title, summary)
-                                relevance = self._calculate_relevance(
-                                    title, summary, region
-                                )
+                                region = self._classify_region(hits)
+                                relevance = self._calculate_relevance(hits, region)
 
                                 item = NewsItem(
-                                    id=entry.get(
-                                        "id",
-                                        entry.get("link", f"{feed_key}_{len(items)}"),
-                                    ),
+                                    id=entry_id,
                                     title=title,
                                     summary=summary,
                                     source=feed_config["name"],
                                     source_id=feed_config["source_id"],
-                                    url=entry.get("link", ""),
+                                    url=entry["link"],
                                     published=published,
                                     region=region,
                                     classification="OSINT"
@@ -423,7 +518,14 @@ class NewsAggregator:
                                 items.append(item)
                             except Exception:
                                 continue
+
+                        self.feed_items[feed_key] = items
+                        self.feed_rejected[feed_key] = rejected
+                        # Only once the body is parsed: a 304 must never be
+                        # answered with items older than these validators
+                        self._store_validators(feed_key, response)
             except Exception as e:
+                self.failed_feeds.add(feed_key)
                 print(f"Error fetching {feed_key}: {e}")
 
         if semaphore:
@@ -435,52 +537,200 @@ class NewsAggregator:
         return items
 
     async def fetch_all(self, force: bool = False) -> list[NewsItem]:
-        """Fetch news from all RSS feeds with rate limiting"""
-        now = datetime.now()
-
-        if (
-            not force
-            and self.all_items
-            and self.last_fetch
-            and (now - self.last_fetch) < self.fetch_interval
-        ):
-            return self.all_items
+        """Fetch news from all RSS feeds with rate limiting
 
+        Served stale-while-revalidate: past fetch_interval the cached items are
+        returned immediately while a single background sweep refreshes them.
+        force=True polls every feed, not only the ones that are due.
+        """
+        if force:
+            self._force_all = True
+        return await self._sweep_cache.get(force=force)
+
+    @property
+    def version(self) -> int:
+        """Bumped after every completed sweep"""
+        return self._sweep_cache.version
+
+    def peek(self) -> list[NewsItem]:
+        """Items from the last sweep without triggering one"""
+        return self._sweep_cache.peek() or []
+
+    async def warm_start(self) -> None:
+        """Load the retention window from the article store (idempotent)"""
+        if self._warm:
+            return
+        self._warm = True
+        since = datetime.now(timezone.utc) - self.retention
+        try:
+            rows = await self.store.aload_seen_since(since)
+        except Exception as e:
+            print(f"Article store warm start error: {e}")
+            return
+
+        for item, seen in rows:
+            self._ingest(item, seen)
+        ingest_hub.publish(NEWS, [item for item, _ in rows], backfill=True)
+        print(f"Article store: warm start with {len(rows)} articles")
+
+    def close(self) -> None:
+        """Close the article store (called from the app lifespan)"""
+        self.store.close()
+
+    async def _refresh(self) -> list[NewsItem]:
+        """Sweep all RSS feeds, persist the results and merge them into the views"""
+        await self.warm_start()
+
+        now = datetime.now(timezone.utc)
         semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_feed(session, key, config, semaphore)
-                for key, config in RSS_FEEDS.items()
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_items = []
-        self.cache.clear()
-
-        for i, (key, _) in enumerate(RSS_FEEDS.items()):
-            result = results[i]
-            if isinstance(result, list):
-                for item in result:
-                    all_items.append(item)
-                    # Cache by region
-                    region = item.region or "global"
-                    if region not in self.cache:
-                        self.cache[region] = []
-                    self.cache[region].append(item)
-
-        # Sort by relevance then date
-        all_items.sort(key=lambda x: (x.relevance_score, x.published), reverse=True)
-
-        self.all_items = all_items
+        if self._force_all:
+            self._force_all = False
+            due = list(RSS_FEEDS)
+        else:
+            due = self.poller.due(RSS_FEEDS)
+        self.failed_feeds.clear()
+
+        session = http_client.get_session()
+        tasks = [
+            self._fetch_feed(session, key, RSS_FEEDS[key], semaphore) for key in due
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        sweep_items: dict[str, NewsItem] = {}
+        for key, result in zip(due, results, strict=True):
+            ok = isinstance(result, list) and key not in self.failed_feeds
+            items = result if isinstance(result, list) else []
+            new_items = sum(1 for item in items if item.id not in self.retained)
+            self.poller.record(key, new_items, ok=ok)
+            for item in items:
+                sweep_items[item.id] = item
+
+        # Feeds not polled this sweep are still live with their last items
+        for key in RSS_FEEDS:
+            if key not in due:
+                for item in self.feed_items.get(key, []):
+                    sweep_items.setdefault(item.id, item)
+
+        try:
+            await self.store.aupsert_many(sweep_items.values(), seen=now)
+            if self._last_prune is None or now - self._last_prune >= PRUNE_INTERVAL:
+                self._last_prune = now
+                await self.store.aprune(now - timedelta(days=settings.NEWS_STORE_DAYS))
+        except Exception as e:
+            print(f"Article store write error: {e}")
+
+        ingested = []
+        for item in sweep_items.values():
+            if self.retained.get(item.id) is item:
+                # Unchanged article - only its last-seen time moves
+                self.last_seen[item.id] = now
+            else:
+                self._ingest(item, now)
+                ingested.append(item)
+        self._expire(now)
+        ingest_hub.publish(NEWS, ingested)
         self.last_fetch = now
 
-        return all_items
+        return list(self.all_items)
+
+    def _ingest(self, item: NewsItem, seen: datetime) -> None:
+        """Insert a new (or changed) article into the ranked views, assign its
+        story cluster; velocity counts each story once, through the article
+        that opened the cluster"""
+        previous = self.retained.get(item.id)
+        if previous is not None:
+            self._unrank(previous)
+        else:
+            heapq.heappush(self._expiry_heap, (seen.timestamp(), item.id))
+
+        cluster = self.clusters.add(item)
+        item.cluster_id = cluster.id if cluster else None
+        self.retained[item.id] = item
+        self.last_seen[item.id] = seen
+        if cluster is None or cluster.representative == item.id:
+            self.velocity.observe(item)
+
+        region = item.region or "global"
+        ranked = self._ranked_by_region.get(region)
+        if ranked is None:
+            ranked = self._ranked_by_region[region] = RankedList()
+            self.cache[region] = ranked.items
+        ranked.insert(item)
+        self._ranked.insert(item)
+
+        timeline = self._timeline_by_region.get(region)
+        if timeline is None:
+            timeline = self._timeline_by_region[region] = RankedList(key=time_key)
+        timeline.insert(item)
+        self._timeline.insert(item)
+
+    def _unrank(self, item: NewsItem) -> None:
+        region = item.region or "global"
+        for views, by_region in (
+            (self._ranked, self._ranked_by_region),
+            (self._timeline, self._timeline_by_region),
+        ):
+            views.remove(item)
+            if region in by_region:
+                by_region[region].remove(item)
+
+    def _expire(self, now: datetime) -> None:
+        """Drop articles not seen in any feed within the retention window"""
+        cutoff = (now - self.retention).timestamp()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < cutoff:
+            _, item_id = heapq.heappop(heap)
+            seen = self.last_seen.get(item_id)
+            if seen is None:
+                continue
+            if seen.timestamp() >= cutoff:
+                # Seen again since this entry was pushed - check back later
+                heapq.heappush(heap, (seen.timestamp(), item_id))
+                continue
+
+            del self.last_seen[item_id]
+            item = self.retained.pop(item_id, None)
+            if item is not None:
+                self._unrank(item)
+            self.clusters.remove(item_id)
+
+    def get_timeline(self, region: Optional[str] = None) -> RankedList:
+        """Retained articles newest first, for cursor pagination"""
+        if region:
+            return self._timeline_by_region.get(region) or RankedList(key=time_key)
+        return self._timeline
+
+    def get_cluster(self, item: NewsItem) -> Optional[StoryCluster]:
+        """Story cluster of an article, if it is still retained"""
+        return self.clusters.get(item.cluster_id) or self.clusters.cluster_of(item.id)
+
+    def collapse_duplicates(self, items: list[NewsItem]) -> list[NewsItem]:
+        """Keep only the first (highest ranked) article of each story cluster"""
+        seen: set[str] = set()
+        collapsed = []
+        for item in items:
+            key = item.cluster_id or item.id
+            if key in seen:
+                continue
+            seen.add(key)
+            collapsed.append(item)
+        return collapsed
+
+    async def get_history(
+        self,
+        region: Optional[str] = None,
+        hours: int = 24,
+        limit: int = 100,
+    ) -> list[NewsItem]:
+        """Stored articles published within the last `hours`, newest first"""
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return await self.store.aquery(region=region, since=since, limit=limit)
 
     async def fetch_by_region(self, region: str) -> list[NewsItem]:
         """Fetch news filtered by region"""
         await self.fetch_all()
-        return self.cache.get(region, [])
+        return list(self.cache.get(region, []))
 
     def get_news_velocity(self, region: str, hours: int = 24) -> float:
         """Calculate news velocity for a region (0-100 scale)
@@ -492,29 +742,14 @@ class NewsAggregator:
         - 20 items = ~70
         - 50 items = ~90
         """
-        items = self.cache.get(region, [])
-        
-        if not items:
-            return 0.0
-        
-        import math
-        
-        # Count items by relevance tiers
-        high_rel = sum(1 for i in items if i.relevance_score > 0.7)
-        med_rel = sum(1 for i in items if 0.4 < i.relevance_score <= 0.7)
-        low_rel = sum(1 for i in items if 0.1 < i.relevance_score <= 0.4)
-        
-        # Weighted count: high=2, med=1.5, low=1
-        weighted_count = high_rel * 2 + med_rel * 1.5 + low_rel * 1
-        
-        if weighted_count <= 0:
-            return 0.0
-        
-        # Logarithmic scaling: log(count + 1) / log(100) * 100
-        # This gives better distribution across the 0-100 range
-        velocity = (math.log(weighted_count + 1) / math.log(100)) * 100
-        
-        return round(min(velocity, 100), 1)
+        # Weighted count: high=2, med=1.5, low=1, by publication time
+        return scale_velocity(self.velocity.weighted_count(region, hours))
+
+    def get_velocity_series(
+        self, region: str, hours: int = 24, step_minutes: int = 15
+    ) -> list[dict]:
+        """Tier counts per time step over the window (velocity chart)"""
+        return self.velocity.series(region, hours, step_minutes)
 
 
 # Global instance
@@ -0,0 +1,162 @@
+"""
+Story Clustering
+Groups near-duplicate articles (the same wire story carried by several
+outlets) with 64-bit SimHash fingerprints and a banded LSH index
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from app.services.news.models import NewsItem
+
+
+SHINGLE_SIZE = 3
+# Near-duplicate if fingerprints differ in at most this many bits
+MAX_DISTANCE = 3
+# 4 bands of 16 bits: two fingerprints within MAX_DISTANCE bits share at
+# least one band exactly (pigeonhole), so band lookups find every candidate
+BANDS = 4
+BAND_BITS = 64 // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _features(title: str, summary: str) -> list[str]:
+    """Word shingles of the normalized text; title shingles count twice"""
+    features = []
+    for text, weight in ((title, 2), (summary, 1)):
+        tokens = TOKEN_RE.findall(text.lower())
+        if len(tokens) < SHINGLE_SIZE:
+            grams = tokens
+        else:
+            grams = [
+                " ".join(tokens[i : i + SHINGLE_SIZE])
+                for i in range(len(tokens) - SHINGLE_SIZE + 1)
+            ]
+        features.extend(grams * weight)
+    return features
+
+
+def simhash(title: str, summary: str) -> Optional[int]:
+    """64-bit SimHash over title + summary shingles; None without any words"""
+    features = _features(title, summary)
+    if not features:
+        return None
+    digests = b"".join(
+        hashlib.blake2b(f.encode(), digest_size=8).digest() for f in features
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(-1, 64)
+    # Bit set where more features have a 1 than a 0
+    votes = bits.sum(axis=0, dtype=np.int32) * 2 > len(features)
+    return int.from_bytes(np.packbits(votes).tobytes(), "big")
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+@dataclass
+class StoryCluster:
+    id: str
+    fingerprint: int
+    representative: str
+    members: list[str] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+    first_seen: Optional[datetime] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+
+class StoryClusterIndex:
+    """Incremental near-duplicate index: each add() is a few dict lookups"""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.clusters: dict[str, StoryCluster] = {}
+        self._bands: dict[tuple[int, int], list[str]] = {}
+        self._item_cluster: dict[str, str] = {}
+        self._item_source: dict[str, str] = {}
+
+    def _band_keys(self, fingerprint: int) -> list[tuple[int, int]]:
+        return [
+            (band, (fingerprint >> (band * BAND_BITS)) & BAND_MASK)
+            for band in range(BANDS)
+        ]
+
+    def _find(self, fingerprint: int) -> Optional[StoryCluster]:
+        best, best_distance = None, self.max_distance + 1
+        for key in self._band_keys(fingerprint):
+            for cluster_id in self._bands.get(key, ()):
+                cluster = self.clusters[cluster_id]
+                distance = hamming(fingerprint, cluster.fingerprint)
+                if distance < best_distance:
+                    best, best_distance = cluster, distance
+        return best
+
+    def add(self, item: NewsItem) -> Optional[StoryCluster]:
+        """Assign an article to its story cluster (idempotent per item id)
+
+        Articles with no words to fingerprint are left unclustered (None):
+        they would all share fingerprint 0 and collapse into one story.
+        """
+        cluster_id = self._item_cluster.get(item.id)
+        if cluster_id is not None:
+            return self.clusters[cluster_id]
+
+        fingerprint = simhash(item.title, item.summary)
+        if fingerprint is None:
+            return None
+        cluster = self._find(fingerprint)
+        if cluster is None:
+            cluster = StoryCluster(
+                id=item.id, fingerprint=fingerprint, representative=item.id
+            )
+            self.clusters[cluster.id] = cluster
+            for key in self._band_keys(fingerprint):
+                self._bands.setdefault(key, []).append(cluster.id)
+
+        cluster.members.append(item.id)
+        if item.source not in cluster.sources:
+            cluster.sources.append(item.source)
+        if cluster.first_seen is None or item.published < cluster.first_seen:
+            cluster.first_seen = item.published
+        self._item_cluster[item.id] = cluster.id
+        self._item_source[item.id] = item.source
+        return cluster
+
+    def get(self, cluster_id: Optional[str]) -> Optional[StoryCluster]:
+        return self.clusters.get(cluster_id) if cluster_id else None
+
+    def cluster_of(self, item_id: str) -> Optional[StoryCluster]:
+        return self.get(self._item_cluster.get(item_id))
+
+    def remove(self, item_id: str) -> None:
+        """Forget an expired article; drops its cluster once empty"""
+        cluster_id = self._item_cluster.pop(item_id, None)
+        if cluster_id is None:
+            return
+        self._item_source.pop(item_id, None)
+        cluster = self.clusters[cluster_id]
+        cluster.members.remove(item_id)
+        if cluster.members:
+            # Sources still carrying the story, in first-seen order
+            cluster.sources = list(
+                dict.fromkeys(self._item_source[m] for m in cluster.members)
+            )
+            return
+
+        del self.clusters[cluster_id]
+        for key in self._band_keys(cluster.fingerprint):
+            ids = self._bands.get(key)
+            if ids is not None:
+                ids.remove(cluster_id)
+                if not ids:
+                    del self._bands[key]
@@ -0,0 +1,23 @@
+"""
+News data models shared by the aggregator and the article store
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class NewsItem:
+    id: str
+    title: str
+    summary: str
+    source: str
+    source_id: str
+    url: str
+    published: datetime
+    region: Optional[str] = None
+    classification: str = "OSINT"
+    relevance_score: float = 0.0
+    # Story cluster (near-duplicate group) this article belongs to
+    cluster_id: Optional[str] = None
@@ -0,0 +1,129 @@
+"""
+Feed Parsing
+Runs feedparser off the event loop and ships back only the compact fields
+the aggregator needs
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import feedparser
+
+from app.core.config import settings
+from app.services.text.normalize import clean_text
+
+
+# Entries parsed per feed
+ENTRY_LIMIT = 20
+
+EXECUTOR_MODES = ("process", "thread", "inline")
+
+logger = logging.getLogger(__name__)
+
+
+def parse_feed(content: str, limit: int = ENTRY_LIMIT) -> tuple[list[dict], list[str]]:
+    """Parse an RSS/Atom document into compact entry dicts, plus why each
+    malformed entry was skipped
+
+    Top-level so it can run in a worker process; the result is small and
+    cheap to pickle compared to feedparser's own objects. Skips are returned
+    rather than logged, as worker processes don't share the app's logging.
+    """
+    parsed = feedparser.parse(content)
+    entries = []
+    skipped = []
+    for entry in parsed.entries[:limit]:
+        try:
+            published = None
+            if entry.get("published_parsed"):
+                published = tuple(entry.published_parsed[:6])
+
+            entries.append(
+                {
+                    "id": entry.get("id", entry.get("link")),
+                    "link": entry.get("link", ""),
+                    "title": clean_text(entry.get("title", "")),
+                    "summary": clean_text(
+                        entry.get("summary", entry.get("description", ""))
+                    ),
+                    "published": published,
+                }
+            )
+        except Exception as e:
+            skipped.append(f"{entry.get('link', '?')}: {e!r}")
+    return entries, skipped
+
+
+class FeedParserPool:
+    """Bounded executor for parse_feed
+
+    mode "process" uses a ProcessPoolExecutor (no GIL contention with the
+    event loop), "thread" a ThreadPoolExecutor, "inline" parses on the loop.
+    """
+
+    def __init__(self, mode: str = "process", workers: int = 2):
+        if mode not in EXECUTOR_MODES:
+            print(f"Unknown feed parser executor '{mode}', using thread")
+            mode = "thread"
+        self.mode = mode
+        self.workers = max(1, workers)
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        if self._executor is None:
+            if self.mode == "process":
+                # spawn: forking a process that runs an event loop and
+                # worker threads is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="feed-parser"
+                )
+        return self._executor
+
+    def start(self) -> None:
+        """Create the executor up front (called from the app lifespan)"""
+        self._get_executor()
+
+    def shutdown(self) -> None:
+        """Stop the workers (called from the app lifespan)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def parse(
+        self, content: str, limit: int = ENTRY_LIMIT, url: str = ""
+    ) -> list[dict]:
+        """Parsed entries of one feed document; url only labels the log"""
+        executor = self._get_executor()
+        if executor is None:
+            entries, skipped = parse_feed(content, limit)
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                entries, skipped = await loop.run_in_executor(
+                    executor, parse_feed, content, limit
+                )
+            except BrokenProcessPool:
+                # A worker died; start a fresh pool for the next call
+                self.shutdown()
+                raise
+
+        for reason in skipped:
+            logger.debug("Skipped malformed entry in %s: %s", url, reason)
+        return entries
+
+
+# Global instance
+feed_parser = FeedParserPool(
+    settings.FEED_PARSER_EXECUTOR, settings.FEED_PARSER_WORKERS
+)
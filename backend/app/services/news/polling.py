@@ -0,0 +1,119 @@
+"""
+Adaptive Feed Polling
+Learns how often each feed publishes and polls it accordingly: fast feeds
+down to a floor interval, quiet feeds up to a ceiling
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+# Weight of the latest poll in the EWMA
+EWMA_ALPHA = 0.3
+# Aim for about this many new items per poll
+TARGET_NEW_PER_POLL = 1.0
+# +/- fraction applied to each interval so feeds don't poll in lockstep
+JITTER = 0.1
+
+
+@dataclass
+class FeedSchedule:
+    interval: float
+    next_poll: float = 0.0
+    last_poll: Optional[float] = None
+    # EWMA of new items per poll and the arrival rate it implies (items/s)
+    new_per_poll: float = 0.0
+    rate: Optional[float] = None
+    polls: int = 0
+    failures: int = 0
+
+
+class AdaptivePoller:
+    """Per-feed poll schedule driven by an EWMA of new items per poll"""
+
+    def __init__(
+        self,
+        floor: float,
+        ceiling: float,
+        initial: float,
+        alpha: float = EWMA_ALPHA,
+        target: float = TARGET_NEW_PER_POLL,
+        jitter: float = JITTER,
+    ):
+        self.floor = floor
+        self.ceiling = max(ceiling, floor)
+        self.initial = min(max(initial, floor), self.ceiling)
+        self.alpha = alpha
+        self.target = target
+        self.jitter = jitter
+        self.feeds: dict[str, FeedSchedule] = {}
+
+    def _schedule(self, key: str) -> FeedSchedule:
+        schedule = self.feeds.get(key)
+        if schedule is None:
+            schedule = self.feeds[key] = FeedSchedule(interval=self.initial)
+        return schedule
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.floor), self.ceiling)
+
+    def due(self, keys: Iterable[str], now: Optional[float] = None) -> list[str]:
+        """Feeds whose next poll time has come (new feeds are due at once)"""
+        now = time.monotonic() if now is None else now
+        return [key for key in keys if self._schedule(key).next_poll <= now]
+
+    def record(
+        self,
+        key: str,
+        new_items: int,
+        ok: bool = True,
+        now: Optional[float] = None,
+    ) -> float:
+        """Update a feed after a poll; returns its next interval in seconds"""
+        now = time.monotonic() if now is None else now
+        schedule = self._schedule(key)
+        elapsed = now - schedule.last_poll if schedule.last_poll else schedule.interval
+        schedule.last_poll = now
+        schedule.polls += 1
+
+        if not ok:
+            # Back off on errors without touching the learned rate
+            schedule.failures += 1
+            schedule.interval = self._clamp(schedule.interval * 2)
+        else:
+            schedule.failures = 0
+            if schedule.rate is None:
+                # First poll: everything looks new, so start from a prior that
+                # matches the initial interval instead of learning from it
+                schedule.new_per_poll = self.target
+                schedule.rate = self.target / self.initial
+            else:
+                a = self.alpha
+                schedule.new_per_poll = a * new_items + (1 - a) * schedule.new_per_poll
+                schedule.rate = (
+                    a * new_items / max(elapsed, 1.0) + (1 - a) * schedule.rate
+                )
+
+            if schedule.rate > 0:
+                schedule.interval = self._clamp(self.target / schedule.rate)
+            else:
+                schedule.interval = self.ceiling
+
+        factor = random.uniform(1 - self.jitter, 1 + self.jitter)
+        schedule.next_poll = now + schedule.interval * factor
+        return schedule.interval
+
+    def get_status(self) -> dict[str, dict]:
+        now = time.monotonic()
+        return {
+            key: {
+                "interval_seconds": round(s.interval, 1),
+                "next_poll_in": round(max(s.next_poll - now, 0.0), 1),
+                "new_per_poll": round(s.new_per_poll, 2),
+                "polls": s.polls,
+                "failures": s.failures,
+            }
+            for key, s in self.feeds.items()
+        }
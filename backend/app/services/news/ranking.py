@@ -0,0 +1,56 @@
+"""
+Ranked Article Lists
+Bisect-maintained lists that keep news items in feed order
+(relevance, then publication time, newest first) or timeline order as items
+come and go
+"""
+
+from bisect import bisect_left
+from typing import Callable, Iterator
+
+from app.core.pagination import timeline_key
+from app.services.news.models import NewsItem
+
+
+def rank_key(item: NewsItem) -> tuple[float, float, str]:
+    """Ascending key for descending (relevance_score, published)"""
+    return (-item.relevance_score, -item.published.timestamp(), item.id)
+
+
+def time_key(item: NewsItem) -> tuple[float, str]:
+    """Ascending key for newest-first publication order (cursor pagination)"""
+    return timeline_key(item.published.timestamp(), item.id)
+
+
+class RankedList:
+    """Sorted item list with O(log n) lookup and insert/remove by key
+
+    The key of an item is taken when it is inserted; callers must remove an
+    item before changing its relevance score or published time.
+    """
+
+    def __init__(self, key: Callable[[NewsItem], tuple] = rank_key):
+        self.key = key
+        self.keys: list[tuple] = []
+        self.items: list[NewsItem] = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[NewsItem]:
+        return iter(self.items)
+
+    def insert(self, item: NewsItem) -> None:
+        key = self.key(item)
+        i = bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.items.insert(i, item)
+
+    def remove(self, item: NewsItem) -> bool:
+        key = self.key(item)
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
+            del self.items[i]
+            return True
+        return False
@@ -0,0 +1,233 @@
+"""
+Article Store
+Append-only SQLite (WAL) store for ingested news articles
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from app.services.news.models import NewsItem
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    source TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published REAL NOT NULL,
+    region TEXT,
+    classification TEXT NOT NULL,
+    relevance_score REAL NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_region_published
+    ON articles (region, published);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published);
+CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen);
+"""
+
+UPSERT_SQL = """
+INSERT INTO articles (
+    id, title, summary, source, source_id, url, published, region,
+    classification, relevance_score, first_seen, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    summary = excluded.summary,
+    url = excluded.url,
+    region = excluded.region,
+    relevance_score = excluded.relevance_score,
+    last_seen = excluded.last_seen
+"""
+
+SELECT_COLUMNS = (
+    "id, title, summary, source, source_id, url, published, region, "
+    "classification, relevance_score"
+)
+
+# SQLite's default limit on bound parameters is 999
+ID_CHUNK = 500
+
+
+def _row_to_item(row: tuple) -> NewsItem:
+    return NewsItem(
+        id=row[0],
+        title=row[1],
+        summary=row[2],
+        source=row[3],
+        source_id=row[4],
+        url=row[5],
+        published=datetime.fromtimestamp(row[6], timezone.utc),
+        region=row[7],
+        classification=row[8],
+        relevance_score=row[9],
+    )
+
+
+class ArticleStore:
+    """Articles keyed by id, indexed by (region, published)
+
+    One connection guarded by a lock; async wrappers run queries in a worker
+    thread so the event loop never waits on disk.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ========== Articles ==========
+
+    def upsert_many(
+        self, items: Iterable[NewsItem], seen: Optional[datetime] = None
+    ) -> set[str]:
+        """Bulk upsert one sweep; returns the ids that were not stored before"""
+        items = list(items)
+        if not items:
+            return set()
+        now = seen.timestamp() if seen else time.time()
+
+        with self._lock:
+            conn = self._connect()
+            ids = [item.id for item in items]
+            existing: set[str] = set()
+            for i in range(0, len(ids), ID_CHUNK):
+                chunk = ids[i : i + ID_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                existing.update(
+                    row[0]
+                    for row in conn.execute(
+                        f"SELECT id FROM articles WHERE id IN ({placeholders})",
+                        chunk,
+                    )
+                )
+
+            with conn:
+                conn.executemany(
+                    UPSERT_SQL,
+                    [
+                        (
+                            item.id,
+                            item.title,
+                            item.summary,
+                            item.source,
+                            item.source_id,
+                            item.url,
+                            item.published.timestamp(),
+                            item.region,
+                            item.classification,
+                            item.relevance_score,
+                            now,
+                            now,
+                        )
+                        for item in items
+                    ],
+                )
+
+        return set(ids) - existing
+
+    def load_seen_since(self, since: datetime) -> list[tuple[NewsItem, datetime]]:
+        """Articles still present in a feed since the given time, with the
+        time they were last seen (warm start)"""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    f"SELECT {SELECT_COLUMNS}, last_seen FROM articles "
+                    "WHERE last_seen >= ?",
+                    (since.timestamp(),),
+                )
+                .fetchall()
+            )
+        return [
+            (_row_to_item(row), datetime.fromtimestamp(row[-1], timezone.utc))
+            for row in rows
+        ]
+
+    def query(
+        self,
+        region: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> list[NewsItem]:
+        """Articles by publication time, newest first"""
+        clauses, params = [], []
+        if region:
+            clauses.append("region = ?")
+            params.append(region)
+        if since:
+            clauses.append("published >= ?")
+            params.append(since.timestamp())
+        if until:
+            clauses.append("published < ?")
+            params.append(until.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    f"SELECT {SELECT_COLUMNS} FROM articles {where} "
+                    "ORDER BY published DESC LIMIT ?",
+                    params,
+                )
+                .fetchall()
+            )
+        return [_row_to_item(row) for row in rows]
+
+    def prune(self, before: datetime) -> int:
+        """Delete articles not seen in any feed since the given time"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cur = conn.execute(
+                    "DELETE FROM articles WHERE last_seen < ?", (before.timestamp(),)
+                )
+        return cur.rowcount
+
+    # ========== Async wrappers ==========
+
+    async def aupsert_many(
+        self, items: Iterable[NewsItem], seen: Optional[datetime] = None
+    ) -> set[str]:
+        return await asyncio.to_thread(self.upsert_many, list(items), seen)
+
+    async def aload_seen_since(
+        self, since: datetime
+    ) -> list[tuple[NewsItem, datetime]]:
+        return await asyncio.to_thread(self.load_seen_since, since)
+
+    async def aquery(self, **kwargs) -> list[NewsItem]:
+        return await asyncio.to_thread(lambda: self.query(**kwargs))
+
+    async def aprune(self, before: datetime) -> int:
+        return await asyncio.to_thread(self.prune, before)
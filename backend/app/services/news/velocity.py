@@ -0,0 +1,161 @@
+"""
+News Velocity Counter
+Per-region sliding-window article counts in minute buckets, updated as
+articles arrive so any window is a sum over buckets instead of a rescan
+"""
+
+import math
+import time
+from typing import Optional
+
+import numpy as np
+
+from app.services.news.models import NewsItem
+
+
+BUCKET_SECONDS = 60
+WINDOW_BUCKETS = 24 * 60  # 24h of minute buckets
+
+# Relevance tiers and their weight in the velocity score
+TIERS = ("high", "med", "low")
+TIER_WEIGHTS = np.array([2.0, 1.5, 1.0])
+
+
+def relevance_tier(score: float) -> Optional[int]:
+    """Index into TIERS, or None for articles too weak to count"""
+    if score > 0.7:
+        return 0
+    if score > 0.4:
+        return 1
+    if score > 0.1:
+        return 2
+    return None
+
+
+def scale_velocity(weighted_count: float) -> float:
+    """Logarithmic 0-100 scale: log(count + 1) / log(100) * 100"""
+    if weighted_count <= 0:
+        return 0.0
+    velocity = (math.log(weighted_count + 1) / math.log(100)) * 100
+    return round(min(velocity, 100), 1)
+
+
+class VelocityCounter:
+    """Ring buffer of (bucket x tier) counts per region, keyed by publication time
+
+    Each article is counted once; if a later sweep reclassifies it (region or
+    relevance tier changed) the old count is moved to the new slot.
+    """
+
+    def __init__(
+        self,
+        buckets: int = WINDOW_BUCKETS,
+        bucket_seconds: int = BUCKET_SECONDS,
+    ):
+        self.buckets = buckets
+        self.bucket_seconds = bucket_seconds
+        self._counts: dict[str, np.ndarray] = {}
+        # Index of the newest bucket (absolute, i.e. unix time // bucket_seconds)
+        self._head = self._bucket_of(time.time())
+        # item id -> (region, tier, bucket) it is counted under
+        self._counted: dict[str, tuple[str, int, int]] = {}
+
+    def _bucket_of(self, ts: float) -> int:
+        return int(ts // self.bucket_seconds)
+
+    def _region_counts(self, region: str) -> np.ndarray:
+        counts = self._counts.get(region)
+        if counts is None:
+            counts = np.zeros((self.buckets, len(TIERS)), dtype=np.int32)
+            self._counts[region] = counts
+        return counts
+
+    def _advance(self, now: Optional[float] = None) -> None:
+        """Move the head to the current bucket, clearing buckets that expire"""
+        head = self._bucket_of(now if now is not None else time.time())
+        if head <= self._head:
+            return
+
+        expired = min(head - self._head, self.buckets)
+        slots = [(self._head + k) % self.buckets for k in range(1, expired + 1)]
+        for counts in self._counts.values():
+            counts[slots] = 0
+
+        oldest = head - self.buckets
+        self._counted = {
+            item_id: key for item_id, key in self._counted.items() if key[2] > oldest
+        }
+        self._head = head
+
+    def observe(self, item: NewsItem) -> None:
+        """Count an article (no-op if already counted under the same slot)"""
+        self._advance()
+        tier = relevance_tier(item.relevance_score)
+        region = item.region or "global"
+        # Future timestamps (clock skew) count as now
+        bucket = min(self._bucket_of(item.published.timestamp()), self._head)
+
+        previous = self._counted.get(item.id)
+        if previous == (region, tier, bucket):
+            return
+        if previous is not None:
+            self._decrement(*previous)
+            del self._counted[item.id]
+
+        if tier is None or bucket <= self._head - self.buckets:
+            return
+        self._region_counts(region)[bucket % self.buckets, tier] += 1
+        self._counted[item.id] = (region, tier, bucket)
+
+    def _decrement(self, region: str, tier: Optional[int], bucket: int) -> None:
+        if tier is None or bucket <= self._head - self.buckets:
+            return
+        counts = self._counts.get(region)
+        if counts is not None and counts[bucket % self.buckets, tier] > 0:
+            counts[bucket % self.buckets, tier] -= 1
+
+    def _window_slots(self, minutes: int) -> np.ndarray:
+        n = max(1, min(minutes * 60 // self.bucket_seconds, self.buckets))
+        return np.arange(self._head - n + 1, self._head + 1) % self.buckets
+
+    def tier_counts(self, region: str, hours: float = 24) -> np.ndarray:
+        """Article counts per relevance tier over the last `hours`"""
+        self._advance()
+        counts = self._counts.get(region)
+        if counts is None:
+            return np.zeros(len(TIERS), dtype=np.int64)
+        slots = self._window_slots(int(hours * 60))
+        return counts[slots].sum(axis=0, dtype=np.int64)
+
+    def weighted_count(self, region: str, hours: float = 24) -> float:
+        """Tier-weighted article count: high=2, med=1.5, low=1"""
+        return float(self.tier_counts(region, hours) @ TIER_WEIGHTS)
+
+    def series(
+        self, region: str, hours: float = 24, step_minutes: int = 15
+    ) -> list[dict]:
+        """Per-step tier counts over the window, oldest first (for charts)"""
+        self._advance()
+        step = max(1, step_minutes * 60 // self.bucket_seconds)
+        slots = self._window_slots(int(hours * 60))
+        counts = self._counts.get(region)
+        if counts is None:
+            window = np.zeros((len(slots), len(TIERS)), dtype=np.int64)
+        else:
+            window = counts[slots].astype(np.int64)
+
+        # Align steps to the newest bucket; a partial step sits at the start
+        points = []
+        first_bucket = self._head - len(slots) + 1
+        for end in range(len(slots), 0, -step):
+            start = max(0, end - step)
+            tiers = window[start:end].sum(axis=0)
+            points.append(
+                {
+                    "start": (first_bucket + start) * self.bucket_seconds,
+                    **{name: int(n) for name, n in zip(TIERS, tiers, strict=True)},
+                    "weighted": float(tiers @ TIER_WEIGHTS),
+                }
+            )
+        points.reverse()
+        return points
@@ -0,0 +1,321 @@
+"""
+Hotspot Replay
+Offline backtest: feeds recorded scoring snapshots (see snapshots.py, enabled
+with HOTSPOT_SNAPSHOT_PATH) through a HotspotDetector as fast as the CPU
+allows, and reports score series and hotspot switches - e.g. to compare
+WEIGHTS or alert thresholds against past events without waiting for new ones
+
+Run from backend/:
+    python -m app.services.replay data/hotspot_snapshots.jsonl
+    python -m app.services.replay data/hotspot_snapshots.jsonl \\
+        --weights '{"news_velocity": 0.3, "google_trends": 0.1}' \\
+        --z-levels 2.5,3.5,5 --series series.json
+
+Nothing is fetched: the detector only ever sees the recorded inputs.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from app.services.hotspot_detector import (
+    ALERT_RANK,
+    FACTORS,
+    REGIONS,
+    SOURCES,
+    WEIGHTS,
+    Z_LEVELS,
+    AlertLevel,
+    HotspotDetector,
+    ScoringInputs,
+)
+from app.services.snapshots import LIST_SOURCES, read_snapshots
+
+
+@dataclass
+class RecordedNews:
+    """The NewsItem fields scoring reads"""
+
+    id: str
+    region: Optional[str]
+    title: str
+    summary: str
+
+
+@dataclass
+class RecordedPost:
+    """The SocialPost / TruthPost fields scoring reads"""
+
+    id: str
+    region: Optional[str]
+    text: str
+    likes: int
+    reposts: int
+
+
+DECODERS = {"news": RecordedNews, "bluesky": RecordedPost, "truthsocial": RecordedPost}
+
+# Per-region score dict in a snapshot -> the FACTOR_INPUTS input it stands for
+SCORE_INPUTS = {
+    "trends": "trends",
+    "news_velocity": "clock",
+    "prediction_volatility": "polymarket",
+    "market_movement": "commodities",
+}
+
+LEVELS = list(AlertLevel)
+
+
+class SnapshotState:
+    """ScoringInputs and input versions rebuilt line by line"""
+
+    def __init__(self):
+        self.inputs = ScoringInputs()
+        self.versions: dict[str, int] = {name: 0 for name in (*SOURCES, "clock")}
+        self._items: dict[str, dict[str, object]] = {
+            source: {} for source in LIST_SOURCES
+        }
+
+    def apply(self, line: dict) -> None:
+        for source, attr in LIST_SOURCES.items():
+            delta = line.get(source)
+            if delta is None:
+                continue
+            known = self._items[source]
+            decode = DECODERS[source]
+            for row in delta["new"]:
+                known[row[0]] = decode(*row)
+            items = [known[item_id] for item_id in delta["order"] if item_id in known]
+            self._items[source] = {item.id: item for item in items}
+            setattr(self.inputs, attr, items)
+            self.versions[source] += 1
+
+        for name, source in SCORE_INPUTS.items():
+            if name in line:
+                setattr(self.inputs, name, line[name])
+                self.versions[source] += 1
+
+
+@dataclass
+class ReplayResult:
+    regions: list[str]
+    weights: dict[str, float]
+    timestamps: list[float] = field(default_factory=list)
+    totals: list[np.ndarray] = field(default_factory=list)
+    levels: list[list[int]] = field(default_factory=list)  # ALERT_RANK per region
+    hotspots: list[Optional[str]] = field(default_factory=list)
+    switches: list[dict] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def summary(self) -> dict:
+        """Time-weighted hotspot share, score stats and switches"""
+        ticks = len(self.timestamps)
+        if not ticks:
+            return {"ticks": 0, "switches": []}
+
+        ts = np.array(self.timestamps)
+        totals = np.vstack(self.totals)
+        levels = np.array(self.levels)
+        # Each tick holds until the next one
+        durations = np.diff(ts, append=ts[-1])
+        span = float(ts[-1] - ts[0]) or 1.0
+        hotspots = np.array(self.hotspots, dtype=object)
+
+        return {
+            "ticks": ticks,
+            "start": datetime.fromtimestamp(ts[0], timezone.utc).isoformat(),
+            "end": datetime.fromtimestamp(ts[-1], timezone.utc).isoformat(),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "ticks_per_second": round(ticks / self.elapsed) if self.elapsed else None,
+            "weights": self.weights,
+            "regions": {
+                region: {
+                    "hotspot_share": round(
+                        float(durations[hotspots == region].sum()) / span, 4
+                    ),
+                    "mean_score": round(float(totals[:, i].mean()), 1),
+                    "max_score": round(float(totals[:, i].max()), 1),
+                    "alert_ticks": {
+                        level.value: int((levels[:, i] == rank).sum())
+                        for rank, level in enumerate(LEVELS)
+                    },
+                }
+                for i, region in enumerate(self.regions)
+            },
+            "switches": self.switches,
+        }
+
+    def series(self) -> dict:
+        """Columnar score series, one value per replayed tick"""
+        totals = np.vstack(self.totals) if self.totals else np.zeros((0, 0))
+        levels = np.array(self.levels)
+        return {
+            "timestamps": self.timestamps,
+            "hotspot": self.hotspots,
+            "regions": {
+                region: {
+                    "total": totals[:, i].tolist(),
+                    "alert_level": [LEVELS[rank].value for rank in levels[:, i]],
+                }
+                for i, region in enumerate(self.regions)
+            },
+        }
+
+
+def replay(
+    lines: Iterable[dict],
+    weights: Optional[dict[str, float]] = None,
+    z_levels: Sequence[tuple[float, AlertLevel]] = Z_LEVELS,
+) -> ReplayResult:
+    """Score every snapshot line in order with a fresh, offline detector
+
+    Lines flagged "warmup" update the inputs and baselines but are left out
+    of the result.
+    """
+    weights = dict(WEIGHTS if weights is None else weights)
+    regions = list(REGIONS)
+    result = ReplayResult(regions=regions, weights=weights)
+    state = SnapshotState()
+
+    # Nothing persisted, nothing recorded: the detector only scores
+    detector = HotspotDetector(
+        history_dir=None, snapshot_path=None, weights=weights, z_levels=z_levels
+    )
+    previous: Optional[str] = None
+    started = time.perf_counter()
+
+    for line in lines:
+        state.apply(line)
+        now = datetime.fromtimestamp(line["ts"], timezone.utc)
+        totals = detector.score(state.inputs, dict(state.versions), now)
+        if line.get("warmup"):
+            previous = detector.current_hotspot
+            continue
+
+        hotspot = detector.current_hotspot
+        result.timestamps.append(line["ts"])
+        result.totals.append(totals)
+        result.levels.append(
+            [ALERT_RANK[detector.scores[region].alert_level] for region in regions]
+        )
+        result.hotspots.append(hotspot)
+        if hotspot != previous and previous is not None:
+            score = detector.scores[hotspot]
+            result.switches.append(
+                {
+                    "timestamp": now.isoformat(),
+                    "from": previous,
+                    "to": hotspot,
+                    "total_score": score.total_score,
+                    "alert_level": score.alert_level.value,
+                }
+            )
+        previous = hotspot
+
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+# ========== CLI ==========
+
+
+def _timestamp(value: str) -> float:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded hotspot inputs")
+    parser.add_argument("snapshots", help="JSONL file written by the recorder")
+    parser.add_argument(
+        "--weights",
+        help="JSON factor weights merged over WEIGHTS, e.g. '{\"google_trends\": 0.1}'",
+    )
+    default_z = ",".join(str(threshold) for threshold, _ in reversed(Z_LEVELS))
+    parser.add_argument(
+        "--z-levels",
+        help=f"z-scores for elevated,high,critical (default: {default_z})",
+    )
+    parser.add_argument("--since", help="ISO start; earlier lines only warm up")
+    parser.add_argument("--until", help="ISO end")
+    parser.add_argument("--series", help="write the columnar score series here")
+    parser.add_argument("--json", action="store_true", help="print JSON summary")
+    args = parser.parse_args()
+
+    weights = dict(WEIGHTS)
+    if args.weights:
+        overrides = json.loads(args.weights)
+        unknown = set(overrides) - set(FACTORS)
+        if unknown:
+            parser.error(f"unknown factors: {', '.join(sorted(unknown))}")
+        weights.update(overrides)
+
+    z_levels = Z_LEVELS
+    if args.z_levels:
+        thresholds = [float(value) for value in args.z_levels.split(",")]
+        if len(thresholds) != 3:
+            parser.error("--z-levels takes three values: elevated,high,critical")
+        z_levels = tuple(
+            sorted(
+                zip(
+                    thresholds,
+                    (AlertLevel.ELEVATED, AlertLevel.HIGH, AlertLevel.CRITICAL),
+                    strict=True,
+                ),
+                key=lambda pair: pair[0],
+                reverse=True,
+            )
+        )
+
+    lines = read_snapshots(
+        args.snapshots,
+        since=_timestamp(args.since) if args.since else None,
+        until=_timestamp(args.until) if args.until else None,
+    )
+    result = replay(lines, weights, z_levels)
+    summary = result.summary()
+
+    if args.series:
+        with open(args.series, "w") as f:
+            json.dump(result.series(), f)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    if not summary["ticks"]:
+        print("No snapshots in range")
+        return 0
+    print(
+        f"{summary['ticks']} ticks, {summary['start']} -> {summary['end']} "
+        f"in {summary['elapsed_seconds']}s ({summary['ticks_per_second']} ticks/s)"
+    )
+    for region, stats in summary["regions"].items():
+        print(
+            f"  {region:<18} hotspot {stats['hotspot_share']:>6.1%}  "
+            f"mean {stats['mean_score']:>5}  max {stats['max_score']:>5}  "
+            f"alerts {stats['alert_ticks']}"
+        )
+    print(f"{len(summary['switches'])} hotspot switches")
+    for switch in summary["switches"][:20]:
+        print(
+            f"  {switch['timestamp']}  {switch['from']} -> {switch['to']} "
+            f"({switch['total_score']}, {switch['alert_level']})"
+        )
+    if len(summary["switches"]) > 20:
+        print("  ...")
+    if args.series:
+        print(f"Series written to {args.series}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Hotspot Refresh Scheduler
+Refreshes HotspotDetector in the background so API requests only read snapshots
+"""
+
+import asyncio
+from typing import Optional
+
+from app.core.config import settings
+from app.services.broadcast import hotspot_broadcaster, Broadcaster
+from app.services.hotspot_detector import detector, HotspotDetector
+
+
+class HotspotScheduler:
+    """Periodically runs detector.update_scores() on its own cadence
+    and publishes each new snapshot to the broadcaster once per tick"""
+
+    def __init__(
+        self,
+        hotspot_detector: HotspotDetector,
+        broadcaster: Broadcaster,
+        interval: float,
+        ready_timeout: Optional[float] = None,
+    ):
+        self.detector = hotspot_detector
+        self.broadcaster = broadcaster
+        self.interval = interval
+        self.ready_timeout = ready_timeout
+        # Set once a refresh has succeeded
+        self.ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background refresh loop (called from the app lifespan)"""
+        if self.is_running():
+            return
+        self._task = asyncio.create_task(self._run(), name="hotspot-scheduler")
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and any in-flight refresh"""
+        for task in (self._task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    print(f"Hotspot scheduler stopped with error: {e}")
+        self._task = None
+        self._refresh_task = None
+
+    async def refresh_now(self) -> None:
+        """Run a refresh immediately, joining one that is already in flight;
+        raises if the refresh fails"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        await asyncio.shield(self._refresh_task)
+        self.ready.set()
+
+    async def _refresh(self) -> None:
+        await self.detector.update_scores()
+        self.broadcaster.publish(self.detector.get_update_payload())
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the first snapshot is available; False if none is
+        within timeout (default: ready_timeout)"""
+        if self.ready.is_set():
+            return True
+        timeout = self.ready_timeout if timeout is None else timeout
+        try:
+            if self.is_running():
+                await asyncio.wait_for(self.ready.wait(), timeout)
+            else:
+                # No background loop (e.g. scripts/tests) - refresh inline
+                await asyncio.wait_for(self.refresh_now(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        except Exception as e:
+            print(f"Hotspot refresh error: {e}")
+            return False
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_now()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Hotspot scheduler refresh error: {e}")
+
+            await asyncio.sleep(self.interval)
+
+
+# Global instance
+hotspot_scheduler = HotspotScheduler(
+    detector,
+    hotspot_broadcaster,
+    settings.HOTSPOT_REFRESH_INTERVAL,
+    settings.HOTSPOT_READY_TIMEOUT,
+)
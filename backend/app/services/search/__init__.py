@@ -0,0 +1,3 @@
+from .index import search_index, InvertedIndex, SearchDocument, SearchHit
+
+__all__ = ["search_index", "InvertedIndex", "SearchDocument", "SearchHit"]
@@ -0,0 +1,336 @@
+"""
+Search Index
+In-process inverted index with BM25 ranking over ingested news and social posts
+"""
+
+import math
+import re
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from app.services import ingest
+
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Oldest documents (by insertion) are evicted past this size
+MAX_DOCUMENTS = 300_000
+
+INITIAL_CAPACITY = 1024
+# Tombstones tolerated before postings are compacted
+COMPACT_MIN_DEAD = 1000
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+STOPWORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "has",
+        "have",
+        "in",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "were",
+        "will",
+        "with",
+    ]
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and len(t) > 1
+    ]
+
+
+@dataclass
+class SearchDocument:
+    id: str  # "<kind>:<item id>"
+    kind: str
+    title: str
+    text: str
+    source: str
+    url: Optional[str]
+    region: Optional[str]
+    published: float  # unix timestamp
+
+
+@dataclass
+class SearchHit:
+    document: SearchDocument
+    score: float
+
+
+class InvertedIndex:
+    """Term -> (docnos, term frequencies) postings, maintained incrementally
+
+    Postings are append-only typed arrays scored with numpy; removed documents
+    are tombstoned and the postings are compacted once tombstones outnumber
+    live documents.
+    """
+
+    def __init__(self, max_documents: int = MAX_DOCUMENTS):
+        self.max_documents = max_documents
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._docs: dict[int, SearchDocument] = {}
+        self._doc_terms: dict[int, dict[str, int]] = {}
+        self._docnos: dict[str, int] = {}
+        self._size = 0
+        self._dead = 0
+        self._total_length = 0
+        # Per-docno columns used for scoring and filtering
+        self._alive = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        self._lengths = np.zeros(INITIAL_CAPACITY, dtype=np.float32)
+        self._published = np.zeros(INITIAL_CAPACITY, dtype=np.float64)
+        self._region = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._kind = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        # Small integer codes for region / kind (0 = none)
+        self._codes: dict[Optional[str], int] = {None: 0}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _code(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._codes)
+        return code
+
+    def _grow(self) -> None:
+        capacity = len(self._alive) * 2
+        for name in ("_alive", "_lengths", "_published", "_region", "_kind"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def _set_metadata(self, docno: int, doc: SearchDocument) -> None:
+        self._published[docno] = doc.published
+        self._region[docno] = self._code(doc.region)
+        self._kind[docno] = self._code(doc.kind)
+
+    def add(self, doc: SearchDocument) -> None:
+        """Index a document, replacing an earlier version with the same id"""
+        docno = self._docnos.get(doc.id)
+        if docno is not None:
+            old = self._docs[docno]
+            if old.title == doc.title and old.text == doc.text:
+                # Same text - only metadata (region, counts...) may have moved
+                self._docs[docno] = doc
+                self._set_metadata(docno, doc)
+                return
+            self.remove(doc.id)
+
+        tokens = tokenize(f"{doc.title} {doc.text}")
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        if self._size == len(self._alive):
+            self._grow()
+        docno = self._size
+        self._size += 1
+        self._index(docno, counts)
+
+        self._docs[docno] = doc
+        self._doc_terms[docno] = counts
+        self._docnos[doc.id] = docno
+        self._alive[docno] = True
+        self._lengths[docno] = len(tokens)
+        self._set_metadata(docno, doc)
+        self._total_length += len(tokens)
+
+        while len(self._docs) > self.max_documents:
+            # dicts keep insertion order: the first docno is the oldest
+            self.remove(self._docs[next(iter(self._docs))].id)
+
+    def _index(self, docno: int, counts: dict[str, int]) -> None:
+        for term, tf in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("i"), array("i"))
+            postings[0].append(docno)
+            postings[1].append(tf)
+
+    def add_many(self, docs: list[SearchDocument]) -> None:
+        for doc in docs:
+            self.add(doc)
+
+    def remove(self, doc_id: str) -> None:
+        docno = self._docnos.pop(doc_id, None)
+        if docno is None:
+            return
+        del self._docs[docno]
+        del self._doc_terms[docno]
+        self._alive[docno] = False
+        self._total_length -= int(self._lengths[docno])
+        self._dead += 1
+        if self._dead > max(len(self._docs), COMPACT_MIN_DEAD):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Renumber live documents densely and rebuild the postings"""
+        docs, doc_terms = self._docs, self._doc_terms
+        old_lengths = self._lengths
+        self._postings = {}
+        self._docs, self._doc_terms, self._docnos = {}, {}, {}
+
+        capacity = max(INITIAL_CAPACITY, len(docs) * 2)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._lengths = np.zeros(capacity, dtype=np.float32)
+        self._published = np.zeros(capacity, dtype=np.float64)
+        self._region = np.zeros(capacity, dtype=np.int32)
+        self._kind = np.zeros(capacity, dtype=np.int32)
+
+        for new_docno, (old_docno, doc) in enumerate(docs.items()):
+            counts = doc_terms[old_docno]
+            self._index(new_docno, counts)
+            self._docs[new_docno] = doc
+            self._doc_terms[new_docno] = counts
+            self._docnos[doc.id] = new_docno
+            self._alive[new_docno] = True
+            self._lengths[new_docno] = old_lengths[old_docno]
+            self._set_metadata(new_docno, doc)
+
+        self._size = len(docs)
+        self._dead = 0
+
+    def search(
+        self,
+        query: str,
+        region: Optional[str] = None,
+        since: Optional[datetime] = None,
+        kinds: Optional[set[str]] = None,
+        limit: int = 20,
+    ) -> tuple[list[SearchHit], int]:
+        """BM25 top-k for the query terms (OR semantics) and the number of
+        matching documents after filtering"""
+        terms = set(tokenize(query))
+        if not terms or not self._docs:
+            return [], 0
+
+        region_code = kind_codes = None
+        if region:
+            region_code = self._codes.get(region)
+            if region_code is None:
+                return [], 0
+        if kinds:
+            kind_codes = [self._codes[k] for k in kinds if k in self._codes]
+            if not kind_codes:
+                return [], 0
+        since_ts = since.timestamp() if since else None
+
+        n = len(self._docs)
+        avg_length = self._total_length / n or 1.0
+        scores = np.zeros(self._size, dtype=np.float32)
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            docnos = np.frombuffer(postings[0], dtype=np.int32)
+            tfs = np.frombuffer(postings[1], dtype=np.int32)
+
+            keep = self._alive[docnos]
+            df = int(keep.sum())
+            if not df:
+                continue
+            if region_code is not None:
+                keep &= self._region[docnos] == region_code
+            if kind_codes is not None:
+                keep &= np.isin(self._kind[docnos], kind_codes)
+            if since_ts is not None:
+                keep &= self._published[docnos] >= since_ts
+            docnos = docnos[keep]
+            tfs = tfs[keep].astype(np.float32)
+
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            norm = K1 * (1 - B + B * self._lengths[docnos] / avg_length)
+            scores[docnos] += idf * tfs * (K1 + 1) / (tfs + norm)
+
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(scores[matched], -limit)[-limit:]]
+        top = sorted(
+            matched.tolist(),
+            key=lambda d: (scores[d], self._published[d]),
+            reverse=True,
+        )
+        hits = [SearchHit(self._docs[d], float(scores[d])) for d in top]
+        return hits, int(np.count_nonzero(scores))
+
+    def get_status(self) -> dict:
+        by_kind: dict[str, int] = {}
+        for doc in self._docs.values():
+            by_kind[doc.kind] = by_kind.get(doc.kind, 0) + 1
+        return {
+            "documents": len(self._docs),
+            "terms": len(self._postings),
+            "by_kind": by_kind,
+        }
+
+    # ========== Ingest ==========
+
+    def on_ingest(self, kind: str, items: list) -> None:
+        """IngestHub listener: index a batch of news items or social posts
+
+        Services publish only new or changed items, so indexing cost follows
+        what was ingested, not the size of their fetch windows.
+        """
+        if kind == ingest.NEWS:
+            docs = [
+                SearchDocument(
+                    id=f"{kind}:{item.id}",
+                    kind=kind,
+                    title=item.title,
+                    text=item.summary,
+                    source=item.source,
+                    url=item.url,
+                    region=item.region,
+                    published=item.published.timestamp(),
+                )
+                for item in items
+            ]
+        else:
+            docs = [
+                SearchDocument(
+                    id=f"{kind}:{post.id}",
+                    kind=kind,
+                    title="",
+                    text=post.text,
+                    source=post.handle,
+                    url=post.url,
+                    region=post.region,
+                    published=post.created_at.timestamp(),
+                )
+                for post in items
+            ]
+        self.add_many(docs)
+
+
+# Global instance
+search_index = InvertedIndex()
@@ -6,12 +6,13 @@ https://jina.ai/embeddings/
 
 import os
 import asyncio
-import aiohttp
 import numpy as np
 from typing import Optional
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 
+from app.core.http import http_client
+
 load_dotenv()
 
 JINA_API_KEY = os.getenv("JINA_API_KEY", "")
@@ -46,28 +47,28 @@ class JinaSemanticMatcher:
             return []
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    JINA_API_URL,
-                    headers={
-                        "Authorization": f"Bearer {JINA_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": JINA_MODEL,
-                        "input": texts,
-                        "task": "text-matching"  # Optimized for similarity
-                    },
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        embeddings = [item["embedding"] for item in data.get("data", [])]
-                        return embeddings
-                    else:
-                        error = await response.text()
-                        print(f"Jina API error {response.status}: {error[:200]}")
-                        return []
+            session = http_client.get_session()
+            async with session.post(
+                JINA_API_URL,
+                headers={
+                    "Authorization": f"Bearer {JINA_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": JINA_MODEL,
+                    "input": texts,
+                    "task": "text-matching"  # Optimized for similarity
+                },
+                timeout=http_client.timeout("jina")
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    embeddings = [item["embedding"] for item in data.get("data", [])]
+                    return embeddings
+                else:
+                    error = await response.text()
+                    print(f"Jina API error {response.status}: {error[:200]}")
+                    return []
         except Exception as e:
             print(f"Jina embedding error: {e}")
             return []
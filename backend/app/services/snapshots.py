@@ -0,0 +1,131 @@
+"""
+Scoring Snapshots
+Append-only JSONL record of the inputs HotspotDetector scores on every tick,
+replayed offline by app/services/replay.py
+
+Each line is one tick: {"ts": unix seconds} plus only what changed since
+the previous line. Item lists are delta-encoded - "order" lists every id,
+"new" carries the items not written before or whose content changed (an
+edited headline under the same id) - so a sweep that returns the same
+articles costs a list of ids.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Iterator, Optional
+
+
+FLUSH_INTERVAL = 60.0  # seconds between appends to the file
+
+# Source -> ScoringInputs list it fills
+LIST_SOURCES = {
+    "news": "news_items",
+    "bluesky": "bsky_posts",
+    "truthsocial": "truth_posts",
+}
+# Per-region score dicts, written when their values change
+SCORE_FIELDS = ("trends", "news_velocity", "prediction_volatility", "market_movement")
+
+_UNSEEN = object()
+
+
+def encode_news(item) -> list:
+    return [item.id, item.region, item.title, item.summary]
+
+
+def encode_post(post) -> list:
+    return [post.id, post.region, post.text, post.likes, post.reposts]
+
+
+class SnapshotRecorder:
+    """Buffers one line per tick and appends them from a worker thread"""
+
+    def __init__(self, path: str, flush_interval: float = FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._versions: dict[str, object] = {}
+        # source -> id -> hash of the encoded item last written
+        self._written: dict[str, dict[str, int]] = {}
+        self._scores: dict[str, dict] = {}
+        self._lines: list[str] = []
+        self._flushed_at = time.monotonic()
+
+    def record(self, ts: float, versions: dict, inputs) -> None:
+        """Add one tick (inputs: the ScoringInputs that were scored)"""
+        line: dict = {"ts": round(ts, 3)}
+
+        for source, attr in LIST_SOURCES.items():
+            if self._versions.get(source, _UNSEEN) == versions.get(source):
+                continue
+            items = getattr(inputs, attr)
+            if source == "news":
+                # Unclassified articles never reach a factor
+                items = [item for item in items if item.region]
+                encode = encode_news
+            else:
+                encode = encode_post
+            written = self._written.get(source, {})
+            current: dict[str, int] = {}
+            new = []
+            for item in items:
+                row = encode(item)
+                digest = hash(tuple(row))
+                if written.get(item.id) != digest:
+                    new.append(row)
+                current[item.id] = digest
+            line[source] = {"order": [item.id for item in items], "new": new}
+            self._written[source] = current
+        self._versions = dict(versions)
+
+        # Empty when the detector skipped a factor that did not change
+        for name in SCORE_FIELDS:
+            values = getattr(inputs, name)
+            if values and values != self._scores.get(name):
+                line[name] = values
+                self._scores[name] = dict(values)
+
+        self._lines.append(json.dumps(line, separators=(",", ":")))
+
+    def _write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def _take(self) -> list[str]:
+        lines, self._lines = self._lines, []
+        self._flushed_at = time.monotonic()
+        return lines
+
+    async def flush_if_due(self) -> None:
+        """Append buffered lines in a worker thread once flush_interval passed"""
+        if self._lines and time.monotonic() - self._flushed_at >= self.flush_interval:
+            await asyncio.to_thread(self._write, self._take())
+
+    def close(self) -> None:
+        self._write(self._take())
+
+
+def read_snapshots(
+    path: str, since: Optional[float] = None, until: Optional[float] = None
+) -> Iterator[dict]:
+    """Yield snapshot lines in order
+
+    Lines before since are still yielded (flagged "warmup": True) since the
+    deltas build on them; lines after until end the iteration.
+    """
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            if not raw.strip():
+                continue
+            line = json.loads(raw)
+            if until is not None and line["ts"] > until:
+                return
+            if since is not None and line["ts"] < since:
+                line["warmup"] = True
+            yield line
@@ -10,12 +10,21 @@ from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
 
+from app.core.cache import TTLCache
+from app.core.http import http_client
+from app.core.metrics import track_upstream
+from app.services.ingest import ingest_hub, BLUESKY
 from app.core.proxy import get_proxy
+from app.services.social.timeline import PostTimeline
+from app.services.text.keywords import KeywordMatcher
 
 
 # Rate limiting
 MAX_CONCURRENT = 3
 REQUEST_DELAY = 0.3
+REQUEST_JITTER = 0.2
+# Pause between resolving a handle and fetching its feed
+RESOLVE_DELAY = 0.2
 
 
 @dataclass
@@ -83,6 +92,8 @@ SEARCH_TERMS = {
     ],
 }
 
+REGION_MATCHER = KeywordMatcher(SEARCH_TERMS)
+
 # OSINT accounts to monitor (handles without @)
 # Updated Feb 2026 with active accounts
 OSINT_ACCOUNTS = [
@@ -104,18 +115,21 @@ OSINT_ACCOUNTS = [
 class BlueskyService:
     def __init__(self):
         self.cache: dict[str, list[SocialPost]] = {}
+        # Retained history for cursor pagination
+        self.timeline = PostTimeline("bluesky")
         self.last_fetch: Optional[datetime] = None
         self.fetch_interval = timedelta(minutes=3)
+        self._posts_cache = TTLCache(
+            "bluesky",
+            self._refresh,
+            soft_ttl=self.fetch_interval,
+            hard_ttl=timedelta(minutes=30),
+            cache_empty=True,
+        )
 
     def _classify_region(self, text: str) -> Optional[str]:
         """Classify post by region"""
-        text_lower = text.lower()
-
-        for region, terms in SEARCH_TERMS.items():
-            for term in terms:
-                if term.lower() in text_lower:
-                    return region
-        return None
+        return REGION_MATCHER.first_label(text)
 
     async def _search_posts(
         self,
@@ -129,21 +143,26 @@ class BlueskyService:
 
         async def do_request():
             nonlocal posts
-            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, 0.2))
+            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, REQUEST_JITTER))
 
             for attempt in range(2):
                 try:
                     url = f"{BSKY_API}/xrpc/app.bsky.feed.searchPosts"
                     params = {"q": query, "limit": limit, "sort": "latest"}
 
-                    async with session.get(
-                        url,
-                        params=params,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                        proxy=get_proxy(),
-                    ) as response:
+                    async with (
+                        track_upstream("bluesky_search", query) as call,
+                        session.get(
+                            url,
+                            params=params,
+                            timeout=http_client.timeout("bluesky"),
+                            proxy=get_proxy(),
+                        ) as response,
+                    ):
+                        call.status = response.status
                         if response.status == 200:
                             data = await response.json()
+                            call.done()
                             for post in data.get("posts", []):
                                 try:
                                     author = post.get("author", {})
@@ -220,19 +239,23 @@ class BlueskyService:
 
         async def do_request():
             nonlocal posts
-            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, 0.2))
+            await asyncio.sleep(REQUEST_DELAY + random.uniform(0, REQUEST_JITTER))
 
             try:
                 # First resolve handle to DID
                 url = f"{BSKY_API}/xrpc/com.atproto.identity.resolveHandle"
                 params = {"handle": handle}
 
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=5),
-                    proxy=get_proxy(),
-                ) as response:
+                async with (
+                    track_upstream("bluesky_resolve", handle) as call,
+                    session.get(
+                        url,
+                        params=params,
+                        timeout=http_client.timeout("bluesky_resolve"),
+                        proxy=get_proxy(),
+                    ) as response,
+                ):
+                    call.status = response.status
                     if response.status != 200:
                         return
                     data = await response.json()
@@ -241,20 +264,25 @@ class BlueskyService:
                 if not did:
                     return
 
-                await asyncio.sleep(0.2)  # Brief pause between requests
+                await asyncio.sleep(RESOLVE_DELAY)  # Brief pause between requests
 
                 # Get author feed
                 url = f"{BSKY_API}/xrpc/app.bsky.feed.getAuthorFeed"
                 params = {"actor": did, "limit": limit}
 
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                    proxy=get_proxy(),
-                ) as response:
+                async with (
+                    track_upstream("bluesky_feed", handle) as call,
+                    session.get(
+                        url,
+                        params=params,
+                        timeout=http_client.timeout("bluesky"),
+                        proxy=get_proxy(),
+                    ) as response,
+                ):
+                    call.status = response.status
                     if response.status == 200:
                         data = await response.json()
+                        call.done()
 
                         for item in data.get("feed", []):
                             post = item.get("post", {})
@@ -306,52 +334,51 @@ class BlueskyService:
         return posts
 
     async def fetch_all(self, force: bool = False) -> list[SocialPost]:
-        """Fetch posts from searches and monitored accounts with rate limiting"""
-        now = datetime.now()
+        """Fetch posts from searches and monitored accounts (stale-while-revalidate)"""
+        return await self._posts_cache.get(force=force)
 
-        # Use cache if recent
-        if (
-            not force
-            and self.last_fetch
-            and (now - self.last_fetch) < self.fetch_interval
-        ):
-            all_posts = []
-            for posts in self.cache.values():
-                all_posts.extend(posts)
-            return sorted(all_posts, key=lambda x: x.created_at, reverse=True)
+    @property
+    def version(self) -> int:
+        """Bumped after every completed refresh"""
+        return self._posts_cache.version
 
+    def peek(self) -> list[SocialPost]:
+        """Posts from the last refresh without triggering one"""
+        return self._posts_cache.peek() or []
+
+    async def _refresh(self) -> list[SocialPost]:
+        """Fetch account feeds and searches and rebuild the cache"""
+        now = datetime.now()
         all_posts = []
         semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-        async with aiohttp.ClientSession() as session:
-            # OSINT account feeds are more reliable (search API often returns 403)
-            # Increase limit since search might not work
-            account_tasks = [
-                self._get_account_feed(session, handle, limit=15, semaphore=semaphore)
-                for handle in OSINT_ACCOUNTS
-            ]
-
-            # Try search as well (may fail with 403)
-            search_tasks = []
-            for region, terms in SEARCH_TERMS.items():
-                for term in terms[:1]:
-                    search_tasks.append(
-                        self._search_posts(session, term, limit=10, semaphore=semaphore)
-                    )
-
-            # Execute account feeds first (more reliable)
-            account_results = await asyncio.gather(
-                *account_tasks, return_exceptions=True
-            )
-            for result in account_results:
-                if isinstance(result, list):
-                    all_posts.extend(result)
-
-            # Then try search (might fail)
-            search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
-            for result in search_results:
-                if isinstance(result, list):
-                    all_posts.extend(result)
+        session = http_client.get_session()
+        # OSINT account feeds are more reliable (search API often returns 403)
+        # Increase limit since search might not work
+        account_tasks = [
+            self._get_account_feed(session, handle, limit=15, semaphore=semaphore)
+            for handle in OSINT_ACCOUNTS
+        ]
+
+        # Try search as well (may fail with 403)
+        search_tasks = []
+        for region, terms in SEARCH_TERMS.items():
+            for term in terms[:1]:
+                search_tasks.append(
+                    self._search_posts(session, term, limit=10, semaphore=semaphore)
+                )
+
+        # Execute account feeds first (more reliable)
+        account_results = await asyncio.gather(*account_tasks, return_exceptions=True)
+        for result in account_results:
+            if isinstance(result, list):
+                all_posts.extend(result)
+
+        # Then try search (might fail)
+        search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        for result in search_results:
+            if isinstance(result, list):
+                all_posts.extend(result)
 
         # Deduplicate by ID
         seen_ids = set()
@@ -370,6 +397,8 @@ class BlueskyService:
             self.cache[region].append(post)
 
         self.last_fetch = now
+        # Only new or edited posts; the window is re-delivered every refresh
+        ingest_hub.publish(BLUESKY, self.timeline.add(unique_posts))
 
         return sorted(unique_posts, key=lambda x: x.created_at, reverse=True)
 
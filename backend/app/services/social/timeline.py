@@ -0,0 +1,96 @@
+"""
+Post Timelines
+Retained, newest-first post history of one social service (overall and per
+region), kept sorted as refreshes add posts so a cursor page is a bisect
+instead of a sort of everything fetched
+"""
+
+import time
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.core.pagination import TimelineKey, timeline_key
+from app.services.news.ranking import RankedList
+
+# Hard cap per service; the oldest posts go first
+MAX_POSTS = 5000
+
+
+def _content(post) -> tuple:
+    return post.text, post.region
+
+
+class PostTimeline:
+    """Posts seen within the retention window, newest first
+
+    Refreshes re-deliver their whole window: a post already retained is
+    replaced (engagement counts move) and its last-seen time refreshed. Posts
+    not seen for `retention_hours` are dropped.
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        retention_hours: float = settings.SOCIAL_RETENTION_HOURS,
+        max_posts: int = MAX_POSTS,
+    ):
+        self.platform = platform
+        self.retention = retention_hours * 3600
+        self.max_posts = max_posts
+        self.timeline = RankedList(key=self.key)
+        self.by_region: dict[str, RankedList] = {}
+        self.posts: dict[str, object] = {}
+        self.last_seen: dict[str, float] = {}
+
+    def key(self, post) -> TimelineKey:
+        """Cursor key; ids are prefixed so platforms never collide"""
+        return timeline_key(post.created_at.timestamp(), f"{self.platform}:{post.id}")
+
+    def __len__(self) -> int:
+        return len(self.timeline)
+
+    def _lists(self, post) -> tuple[RankedList, RankedList]:
+        region = post.region or "global"
+        ranked = self.by_region.get(region)
+        if ranked is None:
+            ranked = self.by_region[region] = RankedList(key=self.key)
+        return self.timeline, ranked
+
+    def _remove(self, post) -> None:
+        for ranked in self._lists(post):
+            ranked.remove(post)
+        del self.posts[post.id]
+        del self.last_seen[post.id]
+
+    def add(self, posts: Iterable, now: Optional[float] = None) -> list:
+        """Merge one refresh's posts, then drop expired and excess ones
+
+        Returns the posts that are new or whose text or region changed - what
+        ingest listeners need; engagement-only changes are just retained.
+        """
+        now = time.time() if now is None else now
+        fresh = []
+        for post in posts:
+            previous = self.posts.get(post.id)
+            if previous is not None:
+                self._remove(previous)
+            if previous is None or _content(previous) != _content(post):
+                fresh.append(post)
+            for ranked in self._lists(post):
+                ranked.insert(post)
+            self.posts[post.id] = post
+            self.last_seen[post.id] = now
+
+        cutoff = now - self.retention
+        for post_id, seen in list(self.last_seen.items()):
+            if seen < cutoff:
+                self._remove(self.posts[post_id])
+        while len(self.timeline) > self.max_posts:
+            self._remove(self.timeline.items[-1])
+        return fresh
+
+    def get(self, region: Optional[str] = None) -> RankedList:
+        """The overall timeline, or one region's ("global" = unclassified)"""
+        if region:
+            return self.by_region.get(region) or RankedList(key=self.key)
+        return self.timeline
@@ -3,12 +3,17 @@ Truth Social Service
 Fetches real posts from Truth Social via CNN archive (updated every 5 minutes)
 """
 
-import aiohttp
 from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
-import re
-import html
+
+from app.core.cache import TTLCache
+from app.core.http import http_client
+from app.core.metrics import track_upstream
+from app.services.ingest import ingest_hub, TRUTHSOCIAL
+from app.services.social.timeline import PostTimeline
+from app.services.text.keywords import KeywordMatcher
+from app.services.text.normalize import clean_text
 
 
 @dataclass
@@ -57,96 +62,107 @@ REGION_KEYWORDS = {
     "korea": ["north korea", "kim jong", "korea", "pyongyang", "korean"],
 }
 
+REGION_MATCHER = KeywordMatcher(REGION_KEYWORDS)
+
 
 class TruthSocialService:
     def __init__(self):
         self.cache: list[TruthPost] = []
+        # Retained history for cursor pagination
+        self.timeline = PostTimeline("truthsocial")
         self.last_fetch: Optional[datetime] = None
         self.fetch_interval = timedelta(minutes=5)
+        self._posts_cache = TTLCache(
+            "truthsocial",
+            self._refresh,
+            soft_ttl=self.fetch_interval,
+            hard_ttl=timedelta(minutes=30),
+        )
 
     def _classify_region(self, text: str) -> Optional[str]:
         """Classify post by region"""
-        text_lower = text.lower()
-        for region, keywords in REGION_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                return region
-        return None
+        return REGION_MATCHER.first_label(text)
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags and decode entities"""
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-        # Decode HTML entities
-        text = html.unescape(text)
-        return text.strip()
+        return clean_text(text)
 
     async def fetch_all(self, force: bool = False) -> list[TruthPost]:
-        """Fetch Truth Social posts from CNN archive"""
-        now = datetime.now()
+        """Fetch Truth Social posts from CNN archive (stale-while-revalidate)"""
+        return await self._posts_cache.get(force=force)
 
-        if (
-            not force
-            and self.cache
-            and self.last_fetch
-            and (now - self.last_fetch) < self.fetch_interval
-        ):
-            return self.cache
+    @property
+    def version(self) -> int:
+        """Bumped after every completed refresh"""
+        return self._posts_cache.version
 
+    def peek(self) -> list[TruthPost]:
+        """Posts from the last refresh without triggering one"""
+        return self._posts_cache.peek() or []
+
+    async def _refresh(self) -> list[TruthPost]:
+        """Download the archive and rebuild the cache"""
+        now = datetime.now()
         posts = []
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
+            session = http_client.get_session()
+            async with (
+                track_upstream("truthsocial", "archive") as call,
+                session.get(
                     TRUTH_ARCHIVE_URL,
-                    timeout=aiohttp.ClientTimeout(total=15),
+                    timeout=http_client.timeout("truthsocial"),
                     headers={"User-Agent": "Mozilla/5.0"},
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
+                ) as response,
+            ):
+                call.status = response.status
+                if response.status == 200:
+                    data = await response.json()
+                    call.done()
+
+                    # Get recent posts (last 50)
+                    for item in data[:50]:
+                        try:
+                            content = self._clean_html(item.get("content", ""))
+
+                            # Skip empty posts or media-only posts
+                            if not content or len(content) < 10:
+                                continue
 
-                        # Get recent posts (last 50)
-                        for item in data[:50]:
+                            # Parse datetime
+                            created_str = item.get("created_at", "")
                             try:
-                                content = self._clean_html(item.get("content", ""))
-
-                                # Skip empty posts or media-only posts
-                                if not content or len(content) < 10:
-                                    continue
-
-                                # Parse datetime
-                                created_str = item.get("created_at", "")
-                                try:
-                                    created_at = datetime.fromisoformat(
-                                        created_str.replace("Z", "+00:00")
-                                    )
-                                except Exception:
-                                    created_at = datetime.now()
-
-                                region = self._classify_region(content)
-
-                                post = TruthPost(
-                                    id=item.get("id", ""),
-                                    author="Donald J. Trump",
-                                    handle="@realDonaldTrump",
-                                    text=content[:500],
-                                    created_at=created_at,
-                                    likes=item.get("favourites_count", 0),
-                                    reposts=item.get("reblogs_count", 0),
-                                    replies=item.get("replies_count", 0),
-                                    region=region,
-                                    platform="truthsocial",
-                                    url=item.get("url", ""),
-                                    media=item.get("media", []),
+                                created_at = datetime.fromisoformat(
+                                    created_str.replace("Z", "+00:00")
                                 )
-                                posts.append(post)
-
-                            except Exception as e:
-                                print(f"Error parsing Truth Social post: {e}")
-                                continue
-
-                        print(
-                            f"✅ Fetched {len(posts)} Truth Social posts with real engagement data"
-                        )
+                            except Exception:
+                                created_at = datetime.now()
+
+                            region = self._classify_region(content)
+
+                            post = TruthPost(
+                                id=item.get("id", ""),
+                                author="Donald J. Trump",
+                                handle="@realDonaldTrump",
+                                text=content,
+                                created_at=created_at,
+                                likes=item.get("favourites_count", 0),
+                                reposts=item.get("reblogs_count", 0),
+                                replies=item.get("replies_count", 0),
+                                region=region,
+                                platform="truthsocial",
+                                url=item.get("url", ""),
+                                media=item.get("media", []),
+                            )
+                            posts.append(post)
+
+                        except Exception as e:
+                            print(f"Error parsing Truth Social post: {e}")
+                            continue
+
+                    print(
+                        f"✅ Fetched {len(posts)} Truth Social posts with real engagement data"
+                    )
 
         except Exception as e:
             print(f"Error fetching Truth Social archive: {e}")
@@ -157,6 +173,8 @@ class TruthSocialService:
         if posts:
             self.cache = posts
             self.last_fetch = now
+            # Only new or edited posts; the window is re-delivered every refresh
+            ingest_hub.publish(TRUTHSOCIAL, self.timeline.add(posts))
 
         return self.cache if self.cache else []
 
@@ -6,12 +6,17 @@ Twitter/X Service - Hybrid API
 
 import asyncio
 import os
-import aiohttp
 from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from app.core.cache import TTLCache
+from app.core.http import http_client
+from app.services.ingest import ingest_hub, TWITTER
+from app.services.social.timeline import PostTimeline
+from app.services.text.keywords import KeywordMatcher
+
 load_dotenv()
 
 # API Keys
@@ -66,6 +71,17 @@ TWITTER_SEARCH_TERMS = {
     "korea": ["North Korea"],
 }
 
+# Region classification keywords
+TWITTER_REGION_KEYWORDS = {
+    "iran": ["iran", "tehran", "irgc", "ayatollah"],
+    "israel-palestine": ["gaza", "israel", "idf", "hamas", "hezbollah"],
+    "russia-ukraine": ["ukraine", "russia", "kyiv", "putin", "zelensky"],
+    "taiwan-strait": ["taiwan", "pla", "taipei", "chinese military"],
+    "korea": ["north korea", "pyongyang", "kim jong", "dprk"],
+}
+
+REGION_MATCHER = KeywordMatcher(TWITTER_REGION_KEYWORDS)
+
 # OSINT accounts
 TWITTER_OSINT_ACCOUNTS = [
     "sentdefender",
@@ -80,29 +96,24 @@ class TwitterService:
 
     def __init__(self):
         self.tweet_cache: list[Tweet] = []
+        # Retained history for cursor pagination
+        self.timeline = PostTimeline("twitter")
         self.trend_cache: dict[str, list[Trend]] = {}
         self.last_tweet_fetch: Optional[datetime] = None
         self.last_trend_fetch: Optional[datetime] = None
         self.tweet_interval = timedelta(minutes=10)
         self.trend_interval = timedelta(minutes=15)
         self.request_count = {"getxapi": 0, "scrapebadger": 0}
+        self._tweets_cache = TTLCache(
+            "twitter",
+            self._refresh_tweets,
+            soft_ttl=self.tweet_interval,
+            hard_ttl=timedelta(minutes=60),
+        )
 
     def _classify_region(self, text: str) -> Optional[str]:
         """Classify tweet by region"""
-        text_lower = text.lower()
-
-        keywords = {
-            "iran": ["iran", "tehran", "irgc", "ayatollah"],
-            "israel-palestine": ["gaza", "israel", "idf", "hamas", "hezbollah"],
-            "russia-ukraine": ["ukraine", "russia", "kyiv", "putin", "zelensky"],
-            "taiwan-strait": ["taiwan", "pla", "taipei", "chinese military"],
-            "korea": ["north korea", "pyongyang", "kim jong", "dprk"],
-        }
-
-        for region, words in keywords.items():
-            if any(w in text_lower for w in words):
-                return region
-        return None
+        return REGION_MATCHER.first_label(text)
 
     # ========== GetXAPI (Tweets) ==========
 
@@ -155,23 +166,23 @@ class TwitterService:
         headers = {"Authorization": f"Bearer {GETXAPI_KEY}"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    self.request_count["getxapi"] += 1
-
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for item in data.get("tweets", [])[:count]:
-                            tweet = self._parse_getxapi_tweet(item)
-                            if tweet:
-                                tweets.append(tweet)
-                    else:
-                        print(f"GetXAPI search error: {resp.status}")
+            session = http_client.get_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=http_client.timeout("getxapi"),
+            ) as resp:
+                self.request_count["getxapi"] += 1
+
+                if resp.status == 200:
+                    data = await resp.json()
+                    for item in data.get("tweets", [])[:count]:
+                        tweet = self._parse_getxapi_tweet(item)
+                        if tweet:
+                            tweets.append(tweet)
+                else:
+                    print(f"GetXAPI search error: {resp.status}")
         except Exception as e:
             print(f"GetXAPI error: {e}")
 
@@ -188,23 +199,23 @@ class TwitterService:
         headers = {"Authorization": f"Bearer {GETXAPI_KEY}"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    self.request_count["getxapi"] += 1
-
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for item in data.get("tweets", [])[:count]:
-                            tweet = self._parse_getxapi_tweet(item)
-                            if tweet:
-                                tweets.append(tweet)
-                    else:
-                        print(f"GetXAPI user error: {resp.status}")
+            session = http_client.get_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=http_client.timeout("getxapi"),
+            ) as resp:
+                self.request_count["getxapi"] += 1
+
+                if resp.status == 200:
+                    data = await resp.json()
+                    for item in data.get("tweets", [])[:count]:
+                        tweet = self._parse_getxapi_tweet(item)
+                        if tweet:
+                            tweets.append(tweet)
+                else:
+                    print(f"GetXAPI user error: {resp.status}")
         except Exception as e:
             print(f"GetXAPI error: {e}")
 
@@ -224,28 +235,28 @@ class TwitterService:
         headers = {"x-api-key": SCRAPEBADGER_KEY}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)
-                ) as resp:
-                    self.request_count["scrapebadger"] += 1
-
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for item in data.get("data", data.get("trends", [])):
-                            trends.append(
-                                Trend(
-                                    name=item.get("name", ""),
-                                    url=item.get("url", ""),
-                                    tweet_volume=item.get("tweet_volume"),
-                                    location=location,
-                                    woeid=woeid,
-                                )
+            session = http_client.get_session()
+            async with session.get(
+                url, headers=headers, timeout=http_client.timeout("scrapebadger")
+            ) as resp:
+                self.request_count["scrapebadger"] += 1
+
+                if resp.status == 200:
+                    data = await resp.json()
+                    for item in data.get("data", data.get("trends", [])):
+                        trends.append(
+                            Trend(
+                                name=item.get("name", ""),
+                                url=item.get("url", ""),
+                                tweet_volume=item.get("tweet_volume"),
+                                location=location,
+                                woeid=woeid,
                             )
-                    elif resp.status == 429:
-                        print("ScrapeBadger: Rate limited (5/15min)")
-                    else:
-                        print(f"ScrapeBadger trends error: {resp.status}")
+                        )
+                elif resp.status == 429:
+                    print("ScrapeBadger: Rate limited (5/15min)")
+                else:
+                    print(f"ScrapeBadger trends error: {resp.status}")
         except Exception as e:
             print(f"ScrapeBadger error: {e}")
 
@@ -281,21 +292,16 @@ class TwitterService:
     # ========== Combined Methods ==========
 
     async def fetch_all(self, force: bool = False) -> list[Tweet]:
-        """Fetch all tweets (OSINT accounts + search)"""
-        now = datetime.now()
-
-        if (
-            not force
-            and self.last_tweet_fetch
-            and (now - self.last_tweet_fetch) < self.tweet_interval
-            and self.tweet_cache
-        ):
-            return self.tweet_cache
-
+        """Fetch all tweets (OSINT accounts + search), stale-while-revalidate"""
         if not GETXAPI_KEY:
             print("Twitter: GetXAPI key not configured")
             return []
 
+        return await self._tweets_cache.get(force=force)
+
+    async def _refresh_tweets(self) -> list[Tweet]:
+        """Fetch OSINT accounts and search, rebuild the tweet cache"""
+        now = datetime.now()
         all_tweets = []
 
         # OSINT accounts (3 accounts, 5 tweets each)
@@ -322,6 +328,8 @@ class TwitterService:
 
         self.tweet_cache = unique
         self.last_tweet_fetch = now
+        # Only new or edited tweets; the window is re-delivered every refresh
+        ingest_hub.publish(TWITTER, self.timeline.add(unique))
 
         print(
             f"Twitter: {len(unique)} tweets (GetXAPI: {self.request_count['getxapi']} reqs)"
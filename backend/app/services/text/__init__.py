@@ -0,0 +1,4 @@
+from .keywords import KeywordMatcher, KeywordHit
+from .normalize import clean_text
+
+__all__ = ["KeywordMatcher", "KeywordHit", "clean_text"]
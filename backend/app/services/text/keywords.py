@@ -0,0 +1,173 @@
+"""
+Keyword Matcher
+Aho-Corasick automaton that finds every keyword of a labelled keyword table in
+one pass over the text, instead of one substring scan per keyword
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping, Optional, Union
+
+
+# Keywords up to this length (acronyms like "idf", "pla", "war") only match
+# whole words; longer keywords keep substring semantics so inflections
+# ("israeli", "hostages") still count
+WHOLE_WORD_MAX_LEN = 4
+
+# Up to this many substring-only keywords, the distinct-match queries scan
+# with str.__contains__ per keyword (C speed) instead of walking the automaton
+SCAN_MAX_PATTERNS = 64
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    keyword: str
+    labels: tuple[str, ...]
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    keyword: str
+    labels: tuple[str, ...]
+    check_left: bool
+    check_right: bool
+
+
+class KeywordMatcher:
+    """Compiled multi-pattern matcher built once from a {label: keywords} table"""
+
+    def __init__(
+        self,
+        table: Mapping[str, Iterable[str]],
+        whole_word_max_len: int = WHOLE_WORD_MAX_LEN,
+    ):
+        self.label_order = {label: i for i, label in enumerate(table)}
+
+        labels_by_keyword: dict[str, list[str]] = {}
+        for label, keywords in table.items():
+            for kw in keywords:
+                kw = kw.lower()
+                if not kw:
+                    continue
+                owners = labels_by_keyword.setdefault(kw, [])
+                if label not in owners:
+                    owners.append(label)
+
+        self._patterns: list[_Pattern] = []
+        for kw, owners in labels_by_keyword.items():
+            whole_word = len(kw.strip()) <= whole_word_max_len
+            self._patterns.append(
+                _Pattern(
+                    keyword=kw,
+                    labels=tuple(owners),
+                    check_left=whole_word and kw[0].isalnum(),
+                    check_right=whole_word and kw[-1].isalnum(),
+                )
+            )
+
+        self._scan = len(self._patterns) <= SCAN_MAX_PATTERNS and not any(
+            p.check_left or p.check_right for p in self._patterns
+        )
+        self._build()
+
+    def _build(self) -> None:
+        """Build goto / fail / output tables"""
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+
+        for pid, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern.keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pid)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out: list[tuple[int, ...]] = [tuple(o) for o in out]
+
+    def iter_hits(self, text: str) -> Iterator[KeywordHit]:
+        """Yield every keyword occurrence (overlaps included) in text order.
+        Positions refer to the lowercased text."""
+        if not text:
+            return
+        text = text.lower()
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        last = len(text) - 1
+        state = 0
+
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+
+            for pid in out[state]:
+                pattern = patterns[pid]
+                start = i - len(pattern.keyword) + 1
+                if pattern.check_left and start > 0 and text[start - 1].isalnum():
+                    continue
+                if pattern.check_right and i < last and text[i + 1].isalnum():
+                    continue
+                yield KeywordHit(pattern.keyword, pattern.labels, start, i + 1)
+
+    def find_all(self, text: str) -> list[KeywordHit]:
+        """All keyword hits with positions"""
+        return list(self.iter_hits(text))
+
+    def _matched(self, text: str) -> Iterable[Union[_Pattern, KeywordHit]]:
+        """Matches carrying .keyword and .labels; a keyword may repeat"""
+        if self._scan:
+            text = text.lower()
+            return [p for p in self._patterns if p.keyword in text]
+        return self.iter_hits(text)
+
+    def contains_any(self, text: str) -> bool:
+        """True as soon as any keyword matches"""
+        if self._scan:
+            text = text.lower()
+            return any(p.keyword in text for p in self._patterns)
+        return next(self.iter_hits(text), None) is not None
+
+    def keywords(self, text: str) -> set[str]:
+        """Distinct matched keywords"""
+        return {p.keyword for p in self._matched(text)}
+
+    def keywords_by_label(self, text: str) -> dict[str, set[str]]:
+        """Distinct matched keywords grouped by label"""
+        result: dict[str, set[str]] = {}
+        for pattern in self._matched(text):
+            for label in pattern.labels:
+                result.setdefault(label, set()).add(pattern.keyword)
+        return result
+
+    def labels(self, text: str) -> set[str]:
+        """Labels with at least one matching keyword"""
+        return {label for p in self._matched(text) for label in p.labels}
+
+    def first_label(self, text: str) -> Optional[str]:
+        """Matched label that comes first in the table's order"""
+        matched = self.labels(text)
+        if not matched:
+            return None
+        return min(matched, key=self.label_order.__getitem__)
@@ -0,0 +1,80 @@
+"""
+Text Normalization
+Shared HTML cleanup for ingested text: strips tags, decodes entities,
+collapses whitespace and truncates, touching only as much of the input as
+the length cap needs
+"""
+
+import html
+import re
+from functools import lru_cache
+
+
+MAX_LEN = 500
+
+# Input characters examined per output character before the window grows;
+# feed markup rarely runs past 4:1
+WINDOW_RATIO = 4
+
+TAG_RE = re.compile(r"<[^>]+>")
+# Same entity grammar as html.unescape
+ENTITY_RE = re.compile(r"&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)")
+
+
+# Feeds reuse a handful of entities (&amp; &#8217; &nbsp;...); decode each once
+_decode_entity = lru_cache(maxsize=1024)(html.unescape)
+
+
+def _unescape(match: re.Match) -> str:
+    return _decode_entity(match.group())
+
+
+def _normalize(text: str) -> str:
+    if "<" in text:
+        text = TAG_RE.sub("", text)
+    if "&" in text:
+        text = ENTITY_RE.sub(_unescape, text)
+    return " ".join(text.split())
+
+
+def _safe_cut(text: str, pos: int) -> int:
+    """First space at or after pos that is outside any tag
+
+    Neither a tag nor an entity (including one joined up by removing a tag,
+    e.g. "&amp<b>;") can span a space, so normalizing text[:cut] yields a
+    prefix of normalizing the whole text.
+    """
+    while True:
+        pos = text.find(" ", pos)
+        if pos == -1:
+            return len(text)
+        if text.rfind("<", 0, pos) <= text.rfind(">", 0, pos):
+            return pos
+        gt = text.find(">", pos)
+        if gt == -1:
+            # A "<" with no closing ">" never starts a tag
+            return pos
+        pos = gt + 1
+
+
+def clean_text(text: str, max_len: int = MAX_LEN) -> str:
+    """Remove HTML tags, decode entities, collapse whitespace, cap the length
+
+    Same result as normalizing the whole string and slicing it, but long
+    inputs (full-article descriptions) are only normalized up to a prefix
+    window large enough to fill max_len.
+    """
+    if not text:
+        return ""
+
+    window = max_len * WINDOW_RATIO
+    while window < len(text):
+        end = _safe_cut(text, window)
+        if end >= len(text):
+            break
+        clean = _normalize(text[:end])
+        if len(clean) >= max_len:
+            return clean[:max_len]
+        window *= WINDOW_RATIO
+
+    return _normalize(text)[:max_len]
@@ -4,10 +4,13 @@ Fetches real-time search trend data for geopolitical keywords
 """
 
 import asyncio
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 from dataclasses import dataclass, field
 
+from app.core.cache import SingleFlight
+
 try:
     from pytrends.request import TrendReq
     PYTRENDS_AVAILABLE = True
@@ -16,6 +19,11 @@ except ImportError:
     print("⚠️ pytrends not installed. Run: uv pip install pytrends")
 
 
+# Rate limiting - Google throttles aggressive pytrends clients
+MAX_CONCURRENT = 2
+MIN_REQUEST_INTERVAL = 1.0  # seconds between request starts
+
+
 @dataclass
 class TrendData:
     keyword: str
@@ -39,6 +47,13 @@ class GoogleTrendsService:
         self.pytrends = None
         self.cache: dict[str, dict] = {}  # region -> {interest, timestamp}
         self.cache_duration = timedelta(minutes=30)
+        # Pool of pytrends clients (TrendReq is stateful, one per thread)
+        self._idle_clients: list = []
+        self._client_count = 0
+        self._limiter = asyncio.Semaphore(MAX_CONCURRENT)
+        self._spacing_lock = asyncio.Lock()
+        self._last_request = 0.0
+        self._flight = SingleFlight()
         self._init_client()
 
     def _init_client(self):
@@ -46,6 +61,8 @@ class GoogleTrendsService:
         if PYTRENDS_AVAILABLE:
             try:
                 self.pytrends = TrendReq(hl='en-US', tz=0, timeout=(10, 25))
+                self._idle_clients.append(self.pytrends)
+                self._client_count = 1
                 print("✅ Google Trends client initialized")
             except Exception as e:
                 print(f"⚠️ Failed to initialize Google Trends: {e}")
@@ -70,35 +87,71 @@ class GoogleTrendsService:
         if not keywords:
             return 50.0
 
-        try:
-            # Run in thread pool to avoid blocking
-            interest = await asyncio.to_thread(
-                self._fetch_interest, keywords[:5]  # Max 5 keywords per request
-            )
-            
-            # Cache result
-            self.cache[region] = {
-                "interest": interest,
-                "timestamp": now
-            }
-            
-            return interest
+        # Concurrent misses for the same region share one lookup
+        return await self._flight.do(
+            region, lambda: self._lookup(region, keywords[:5])  # Max 5 keywords
+        )
 
-        except Exception as e:
-            print(f"Google Trends error for {region}: {e}")
-            return self.cache.get(region, {}).get("interest", 50.0)
+    async def _lookup(self, region: str, keywords: list[str]) -> float:
+        """Run one rate-limited pytrends lookup and cache the result"""
+        async with self._limiter:
+            await self._wait_for_slot()
+            client = await self._acquire_client()
+            try:
+                # Run in thread pool to avoid blocking
+                interest = await asyncio.to_thread(
+                    self._fetch_interest, keywords, client
+                )
 
-    def _fetch_interest(self, keywords: list[str]) -> float:
+                # Cache result
+                self.cache[region] = {
+                    "interest": interest,
+                    "timestamp": datetime.now(timezone.utc),
+                }
+
+                return interest
+
+            except Exception as e:
+                print(f"Google Trends error for {region}: {e}")
+                return self.cache.get(region, {}).get("interest", 50.0)
+            finally:
+                if client is not None:
+                    self._idle_clients.append(client)
+
+    async def _wait_for_slot(self) -> None:
+        """Space request starts at least MIN_REQUEST_INTERVAL apart"""
+        async with self._spacing_lock:
+            wait = self._last_request + MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
+
+    async def _acquire_client(self):
+        """Borrow an idle pytrends client, creating one up to MAX_CONCURRENT"""
+        if self._idle_clients:
+            return self._idle_clients.pop()
+        if self._client_count < MAX_CONCURRENT:
+            self._client_count += 1
+            try:
+                return await asyncio.to_thread(
+                    TrendReq, hl="en-US", tz=0, timeout=(10, 25)
+                )
+            except Exception as e:
+                self._client_count -= 1
+                print(f"⚠️ Failed to create Google Trends client: {e}")
+        return None
+
+    def _fetch_interest(self, keywords: list[str], client=None) -> float:
         """Fetch interest from Google Trends (blocking call)"""
-        if not self.pytrends:
+        if client is None:
             return 50.0
 
         try:
             # Build payload for interest over time (last 7 days)
-            self.pytrends.build_payload(keywords, timeframe='now 7-d', geo='')
+            client.build_payload(keywords, timeframe='now 7-d', geo='')
             
             # Get interest over time
-            interest_df = self.pytrends.interest_over_time()
+            interest_df = client.interest_over_time()
             
             if interest_df.empty:
                 return 50.0
@@ -119,15 +172,23 @@ class GoogleTrendsService:
             return 50.0
 
     async def get_all_regions_interest(self) -> dict[str, float]:
-        """Get trend interest for all tracked regions"""
-        results = {}
-        
-        for region in REGION_KEYWORDS.keys():
-            results[region] = await self.get_trend_interest(region)
-            # Small delay to avoid rate limiting
-            await asyncio.sleep(0.5)
-        
-        return results
+        """Get trend interest for all tracked regions concurrently
+
+        Cache misses are bounded by MAX_CONCURRENT and MIN_REQUEST_INTERVAL.
+        """
+        regions = list(REGION_KEYWORDS.keys())
+        values = await asyncio.gather(
+            *(self.get_trend_interest(region) for region in regions)
+        )
+        return dict(zip(regions, values, strict=True))
+
+    def get_cached_interest(self) -> dict[str, float]:
+        """Last known interest per region without any lookup (may be stale),
+        50.0 where there is none, like get_trend_interest"""
+        return {
+            region: self.cache.get(region, {}).get("interest", 50.0)
+            for region in REGION_KEYWORDS
+        }
 
     def get_status(self) -> dict:
         return {
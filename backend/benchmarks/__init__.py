@@ -0,0 +1,4 @@
+"""
+Benchmarks
+Run from backend/: python -m benchmarks.<name>
+"""
@@ -0,0 +1,190 @@
+"""
+Replay Benchmark
+Backtest throughput: synthesizes weeks of scoring snapshots (one tick per
+HOTSPOT_REFRESH_INTERVAL, sources churning at their own pace) and replays
+them through an offline HotspotDetector
+
+Run from backend/: python -m benchmarks.bench_replay [--days N] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from app.core.config import settings
+from app.services.hotspot_detector import REGIONS, SOURCES, ScoringInputs
+from app.services.replay import RecordedNews, RecordedPost, replay
+from app.services.snapshots import SnapshotRecorder, read_snapshots
+from benchmarks.fixtures.generate import BASE_TIME, SEED, _sentence
+
+NEWS_ITEMS = 300
+POSTS = 50
+
+# Ticks between updates per input, and items replaced per update
+CHURN = {
+    "news": (10, 12),
+    "bluesky": (2, 5),
+    "truthsocial": (10, 2),
+    "clock": (2, 0),
+    "polymarket": (10, 0),
+    "commodities": (4, 0),
+    "trends": (120, 0),
+}
+
+
+class Synthesizer:
+    """Random-walk inputs with realistic churn, advanced one tick at a time"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.regions = [*REGIONS, None]
+        self.serial = 0
+        self.inputs = ScoringInputs(
+            news_items=[self._news() for _ in range(NEWS_ITEMS)],
+            bsky_posts=[self._post() for _ in range(POSTS)],
+            truth_posts=[self._post() for _ in range(POSTS)],
+            trends=self._walk({}, 50.0),
+            news_velocity=self._walk({}, 20.0),
+            prediction_volatility=self._walk({}, 30.0),
+            market_movement=self._walk({}, 30.0),
+        )
+        self.versions = {name: 0 for name in CHURN}
+
+    def _id(self) -> str:
+        self.serial += 1
+        return str(self.serial)
+
+    def _news(self) -> RecordedNews:
+        return RecordedNews(
+            self._id(),
+            self.rng.choice(self.regions),
+            _sentence(self.rng, 10),
+            _sentence(self.rng, 30),
+        )
+
+    def _post(self) -> RecordedPost:
+        return RecordedPost(
+            self._id(),
+            self.rng.choice(self.regions),
+            _sentence(self.rng, 20),
+            self.rng.randrange(500),
+            self.rng.randrange(100),
+        )
+
+    def _walk(self, values: dict, start: float) -> dict:
+        return {
+            region: round(
+                min(100.0, max(0.0, values.get(region, start) + self.rng.gauss(0, 5))),
+                1,
+            )
+            for region in REGIONS
+        }
+
+    def _churn(self, items: list, make, replaced: int) -> list:
+        # Newest first, as the services return them
+        return [make() for _ in range(replaced)] + items[:-replaced]
+
+    def advance(self, tick: int) -> None:
+        inputs = self.inputs
+        for name, (every, replaced) in CHURN.items():
+            if tick % every:
+                continue
+            self.versions[name] += 1
+            if name == "news":
+                inputs.news_items = self._churn(inputs.news_items, self._news, replaced)
+            elif name == "bluesky":
+                inputs.bsky_posts = self._churn(inputs.bsky_posts, self._post, replaced)
+            elif name == "truthsocial":
+                inputs.truth_posts = self._churn(
+                    inputs.truth_posts, self._post, replaced
+                )
+            elif name == "clock":
+                inputs.news_velocity = self._walk(inputs.news_velocity, 20.0)
+            elif name == "polymarket":
+                inputs.prediction_volatility = self._walk(
+                    inputs.prediction_volatility, 30.0
+                )
+            elif name == "commodities":
+                inputs.market_movement = self._walk(inputs.market_movement, 30.0)
+            else:
+                inputs.trends = self._walk(inputs.trends, 50.0)
+
+
+def record(path: str, days: float) -> int:
+    """Write days of synthetic ticks with the live recorder; returns ticks"""
+    step = settings.HOTSPOT_REFRESH_INTERVAL
+    ticks = int(days * 86400 / step)
+    synth = Synthesizer(random.Random(SEED))
+    recorder = SnapshotRecorder(path)
+    start = BASE_TIME.timestamp()
+    for tick in range(ticks):
+        synth.advance(tick)
+        versions = {name: synth.versions[name] for name in (*SOURCES, "clock")}
+        recorder.record(start + tick * step, versions, synth.inputs)
+    recorder.close()
+    return ticks
+
+
+def run(days: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "snapshots.jsonl")
+        started = time.perf_counter()
+        ticks = record(path, days)
+        recorded = time.perf_counter() - started
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        result = replay(read_snapshots(path))
+        elapsed = time.perf_counter() - started
+
+    summary = result.summary()
+    return {
+        "days": days,
+        "ticks": ticks,
+        "file_mb": round(size / 2**20, 1),
+        "bytes_per_tick": round(size / ticks),
+        "record_seconds": round(recorded, 2),
+        "replay_seconds": round(elapsed, 2),
+        "ticks_per_second": round(ticks / elapsed),
+        "days_per_second": round(days / elapsed, 2),
+        "switches": len(summary["switches"]),
+        "hotspot_share": {
+            region: stats["hotspot_share"]
+            for region, stats in summary["regions"].items()
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=float, default=14)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    result = run(args.days)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(
+        f"{result['days']:g} days, {result['ticks']:,} ticks, "
+        f"{result['file_mb']} MB ({result['bytes_per_tick']} B/tick)"
+    )
+    print(f"record  {result['record_seconds']:>7}s")
+    print(
+        f"replay  {result['replay_seconds']:>7}s  "
+        f"{result['ticks_per_second']:,} ticks/s  "
+        f"{result['days_per_second']} days/s"
+    )
+    print(f"{result['switches']} hotspot switches")
+    for region, share in result["hotspot_share"].items():
+        print(f"  {region:<18}{share:>7.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+"""
+Fixture Generator
+Writes the synthetic upstream responses replayed by the benchmarks
+
+The documents are generated, not recorded: they reproduce the shape of the
+real responses (RSS markup with CDATA titles, WordPress-style HTML with
+typographic entities, full-article descriptions, Atom html summaries; the
+Bluesky, Truth Social archive, Polymarket Gamma/CLOB and Yahoo chart JSON)
+with filler text, so the benchmarks are deterministic and the repo ships no
+third-party content.
+
+Run from backend/: python -m benchmarks.fixtures.generate
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent
+SEED = 20260301
+# Base time of the generated documents; benchmarks only compare relative times
+BASE_TIME = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+WORDS = [
+    "officials",
+    "said",
+    "talks",
+    "military",
+    "ceasefire",
+    "border",
+    "government",
+    "minister",
+    "president",
+    "election",
+    "sanctions",
+    "troops",
+    "forces",
+    "report",
+    "security",
+    "council",
+    "spokesperson",
+    "statement",
+    "crisis",
+    "regional",
+    "economy",
+    "markets",
+    "oil",
+    "prices",
+    "protest",
+    "parliament",
+    "agreement",
+    "negotiations",
+    "delegation",
+    "summit",
+    "attack",
+    "humanitarian",
+    "aid",
+    "refugees",
+    "capital",
+    "province",
+    "strike",
+    "drone",
+    "missile",
+    "navy",
+    "tariffs",
+    "trade",
+    "investors",
+    "central",
+    "bank",
+    "inflation",
+    "growth",
+    "energy",
+    "supply",
+]
+
+PLACES = [
+    "Taiwan",
+    "Beijing",
+    "Washington",
+    "Kyiv",
+    "Moscow",
+    "Tehran",
+    "Gaza",
+    "Israel",
+    "Caracas",
+    "Venezuela",
+    "Ukraine",
+    "Russia",
+    "China",
+    "Iran",
+    "Brussels",
+]
+
+FIGURE = '<figure><img src="https://example.com/img.jpg" alt=""/></figure>'
+
+ENTITIES = ["&#8217;", "&#8220;", "&#8221;", "&#8212;", "&amp;", "&nbsp;", "&quot;"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    picked = [rng.choice(WORDS) for _ in range(words)]
+    picked[rng.randrange(words)] = rng.choice(PLACES)
+    return " ".join(picked).capitalize() + "."
+
+
+def _html_paragraph(rng: random.Random, sentences: int) -> str:
+    parts = []
+    for _ in range(sentences):
+        text = _sentence(rng, rng.randint(8, 22))
+        words = text.split(" ")
+        # Typographic entities and inline markup as CMS feeds emit them
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(words))
+            words[i] = f"{words[i]}{rng.choice(ENTITIES)}"
+        if rng.random() < 0.5:
+            i = rng.randrange(len(words))
+            words[i] = (
+                f'<a href="https://example.com/{rng.randrange(10**6)}">{words[i]}</a>'
+            )
+        if rng.random() < 0.3:
+            i = rng.randrange(len(words))
+            words[i] = f"<strong>{words[i]}</strong>"
+        parts.append(" ".join(words))
+    return "<p>" + " ".join(parts) + "</p>"
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _rss(title: str, items: list[str]) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">\n'
+        f"<channel>\n<title>{title}</title>\n<link>https://example.com/</link>\n"
+        + "".join(items)
+        + "</channel>\n</rss>\n"
+    )
+
+
+def _pub_date(i: int) -> str:
+    return format_datetime(BASE_TIME - timedelta(minutes=7 * i))
+
+
+def short_rss(rng: random.Random, count: int = 60) -> str:
+    """Broadcaster style: CDATA titles, one-sentence plain descriptions"""
+    items = []
+    for i in range(count):
+        title = _sentence(rng, rng.randint(6, 12))
+        description = _sentence(rng, rng.randint(15, 30))
+        items.append(
+            "<item>\n"
+            f"<title><![CDATA[{title}]]></title>\n"
+            f"<description><![CDATA[{description}]]></description>\n"
+            f"<link>https://example.com/news/{i}</link>\n"
+            f"<guid>https://example.com/news/{i}</guid>\n"
+            f"<pubDate>{_pub_date(i)}</pubDate>\n"
+            "</item>\n"
+        )
+    return _rss("Short descriptions", items)
+
+
+def wordpress_rss(rng: random.Random, count: int = 40) -> str:
+    """WordPress style: escaped HTML teaser plus content:encoded article"""
+    items = []
+    for i in range(count):
+        teaser = (
+            _html_paragraph(rng, 2) + '<p>The post <a href="#">appeared first</a>.</p>'
+        )
+        article = "".join(_html_paragraph(rng, rng.randint(3, 6)) for _ in range(8))
+        title = _escape(_sentence(rng, rng.randint(8, 14)))
+        items.append(
+            "<item>\n"
+            f"<title>{title} &#8211; Live</title>\n"
+            f"<description>{_escape(teaser)}</description>\n"
+            f"<content:encoded><![CDATA[{article}]]></content:encoded>\n"
+            f"<link>https://example.com/{i}/</link>\n"
+            f'<guid isPermaLink="false">https://example.com/?p={1000 + i}</guid>\n'
+            f"<pubDate>{_pub_date(i)}</pubDate>\n"
+            "</item>\n"
+        )
+    return _rss("WordPress", items)
+
+
+def full_article_rss(rng: random.Random, count: int = 25) -> str:
+    """Feeds that put the whole article (images, figures) in <description>"""
+    items = []
+    for i in range(count):
+        body = FIGURE
+        body += "".join(_html_paragraph(rng, rng.randint(3, 6)) for _ in range(14))
+        items.append(
+            "<item>\n"
+            f"<title>{_escape(_sentence(rng, rng.randint(8, 14)))}</title>\n"
+            f"<description><![CDATA[{body}]]></description>\n"
+            f"<link>https://example.com/article/{i}</link>\n"
+            f"<guid>https://example.com/article/{i}</guid>\n"
+            f"<pubDate>{_pub_date(i)}</pubDate>\n"
+            "</item>\n"
+        )
+    return _rss("Full articles", items)
+
+
+def atom(rng: random.Random, count: int = 40) -> str:
+    """Atom with type="html" summaries"""
+    entries = []
+    for i in range(count):
+        updated = (BASE_TIME - timedelta(minutes=11 * i)).isoformat()
+        summary = _html_paragraph(rng, rng.randint(2, 4))
+        entries.append(
+            "<entry>\n"
+            f"<title>{_escape(_sentence(rng, rng.randint(6, 12)))}</title>\n"
+            f'<link href="https://example.com/atom/{i}"/>\n'
+            f"<id>tag:example.com,2026:{i}</id>\n"
+            f"<published>{updated}</published>\n<updated>{updated}</updated>\n"
+            f'<summary type="html">{_escape(summary)}</summary>\n'
+            "</entry>\n"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        "<title>Atom</title>\n<id>tag:example.com,2026:feed</id>\n"
+        f"<updated>{BASE_TIME.isoformat()}</updated>\n" + "".join(entries) + "</feed>\n"
+    )
+
+
+RSS_FIXTURES = {
+    "short.xml": short_rss,
+    "wordpress.xml": wordpress_rss,
+    "full_article.xml": full_article_rss,
+    "atom.xml": atom,
+}
+
+
+# ========== JSON APIs ==========
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _bsky_post(rng: random.Random, i: int) -> dict:
+    return {
+        # The mock server swaps "did:plc:fixture" for the requested actor
+        "uri": f"at://did:plc:fixture/app.bsky.feed.post/3k{i:08d}",
+        "cid": f"bafyrei{rng.getrandbits(128):032x}",
+        "author": {
+            "did": "did:plc:fixture",
+            "handle": "fixture.bsky.social",
+            "displayName": "Fixture OSINT",
+        },
+        "record": {
+            "$type": "app.bsky.feed.post",
+            "text": " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(2)),
+            "createdAt": _iso(BASE_TIME - timedelta(minutes=13 * i)),
+            "langs": ["en"],
+        },
+        "replyCount": rng.randint(0, 40),
+        "repostCount": rng.randint(0, 200),
+        "likeCount": rng.randint(0, 900),
+        "indexedAt": _iso(BASE_TIME - timedelta(minutes=13 * i)),
+    }
+
+
+def bluesky_author_feed(rng: random.Random, count: int = 15) -> dict:
+    return {"feed": [{"post": _bsky_post(rng, i)} for i in range(count)]}
+
+
+def bluesky_search(rng: random.Random, count: int = 10) -> dict:
+    return {"posts": [_bsky_post(rng, i) for i in range(count)]}
+
+
+def truth_archive(rng: random.Random, count: int = 1000) -> list:
+    """The archive is one large array, newest first"""
+    posts = []
+    for i in range(count):
+        posts.append(
+            {
+                "id": str(114000000000000000 + count - i),
+                "created_at": _iso(BASE_TIME - timedelta(minutes=37 * i)),
+                "content": "".join(
+                    _html_paragraph(rng, rng.randint(1, 3))
+                    for _ in range(rng.randint(1, 2))
+                ),
+                "url": f"https://truthsocial.com/@realDonaldTrump/{i}",
+                "media": [],
+                "replies_count": rng.randint(100, 20000),
+                "reblogs_count": rng.randint(100, 30000),
+                "favourites_count": rng.randint(1000, 100000),
+            }
+        )
+    return posts
+
+
+QUESTIONS = [
+    "Will Russia and Ukraine agree to a ceasefire by {month}?",
+    "Will Israel strike Iran before {month}?",
+    "Will China invade Taiwan by {month}?",
+    "Will Netanyahu remain prime minister through {month}?",
+    "Will North Korea conduct an ICBM test by {month}?",
+    "Will the US and Iran sign a nuclear deal by {month}?",
+    "Will Hamas release all hostages by {month}?",
+    "Will NATO deploy troops to Ukraine by {month}?",
+    "Will the Lakers win the NBA championship in {month}?",
+    "Will Bitcoin reach $150k by {month}?",
+    "Will the Fed cut rates in {month}?",
+]
+
+MONTHS = ["March", "April", "June", "September", "December 31"]
+
+
+def gamma_markets(rng: random.Random, count: int) -> list:
+    markets = []
+    for _ in range(count):
+        question = rng.choice(QUESTIONS).format(month=rng.choice(MONTHS))
+        yes = round(rng.uniform(0.02, 0.98), 3)
+        market_id = rng.randrange(500000, 900000)
+        markets.append(
+            {
+                "id": str(market_id),
+                "question": question,
+                "conditionId": f"0x{rng.getrandbits(256):064x}",
+                "slug": f"market-{market_id}",
+                "description": " ".join(_sentence(rng, 20) for _ in range(6)),
+                "endDate": _iso(BASE_TIME + timedelta(days=rng.randint(10, 300))),
+                "outcomes": json.dumps(["Yes", "No"]),
+                "outcomePrices": json.dumps([str(yes), str(round(1 - yes, 3))]),
+                "volume": str(round(rng.uniform(1e3, 5e7), 2)),
+                "volume24hr": round(rng.uniform(0, 2e6), 2),
+                "liquidity": str(round(rng.uniform(1e3, 2e6), 2)),
+                "active": True,
+                "closed": False,
+                "clobTokenIds": json.dumps(
+                    [str(rng.getrandbits(250)), str(rng.getrandbits(250))]
+                ),
+            }
+        )
+    return markets
+
+
+def clob_prices_history(rng: random.Random, points: int = 50) -> dict:
+    start = int(BASE_TIME.timestamp()) - points * 1800
+    price = rng.uniform(0.2, 0.8)
+    history = []
+    for i in range(points):
+        price = min(max(price + rng.gauss(0, 0.01), 0.01), 0.99)
+        history.append({"t": start + i * 1800, "p": round(price, 4)})
+    return {"history": history}
+
+
+CHART_BASES = {"CL=F": 70.0, "BZ=F": 75.0, "GC=F": 2650.0, "SI=F": 30.0, "NG=F": 3.5}
+
+
+def yahoo_chart(rng: random.Random, symbol: str, points: int = 120) -> dict:
+    """v8 chart response for range=5d interval=1h"""
+    start = int(BASE_TIME.timestamp()) - points * 3600
+    price = CHART_BASES[symbol]
+    closes = []
+    for _ in range(points):
+        price *= 1 + rng.gauss(0, 0.003)
+        closes.append(round(price, 4))
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {
+                        "currency": "USD",
+                        "symbol": symbol,
+                        "regularMarketPrice": closes[-1],
+                        "chartPreviousClose": closes[-25],
+                        "previousClose": closes[-25],
+                        "dataGranularity": "1h",
+                        "range": "5d",
+                    },
+                    "timestamp": [start + i * 3600 for i in range(points)],
+                    "indicators": {
+                        "quote": [
+                            {
+                                "close": closes,
+                                "open": closes,
+                                "high": [round(c * 1.002, 4) for c in closes],
+                                "low": [round(c * 0.998, 4) for c in closes],
+                                "volume": [rng.randint(100, 50000) for _ in closes],
+                            }
+                        ]
+                    },
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+def chart_fixture_name(symbol: str) -> str:
+    return f"chart_{symbol.replace('=', '_')}.json"
+
+
+JSON_FIXTURES = {
+    "bluesky/author_feed.json": bluesky_author_feed,
+    "bluesky/search_posts.json": bluesky_search,
+    "truthsocial/truth_archive.json": truth_archive,
+    "polymarket/markets_geopolitics.json": lambda rng: gamma_markets(rng, 100),
+    "polymarket/markets_politics.json": lambda rng: gamma_markets(rng, 100),
+    "polymarket/markets_general.json": lambda rng: gamma_markets(rng, 200),
+    "polymarket/prices_history.json": clob_prices_history,
+    **{
+        f"yahoo/{chart_fixture_name(symbol)}": (
+            lambda rng, symbol=symbol: yahoo_chart(rng, symbol)
+        )
+        for symbol in CHART_BASES
+    },
+}
+
+
+def main() -> None:
+    rss_dir = FIXTURES_DIR / "rss"
+    rss_dir.mkdir(exist_ok=True)
+    for name, build in RSS_FIXTURES.items():
+        (rss_dir / name).write_text(build(random.Random(f"{SEED}:{name}")))
+        print(f"wrote rss/{name}")
+
+    for name, build in JSON_FIXTURES.items():
+        path = FIXTURES_DIR / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(build(random.Random(f"{SEED}:{name}"))))
+        print(f"wrote {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Mock Upstream
+Local aiohttp stand-in for every upstream the refresh paths call, replaying
+the fixtures in benchmarks/fixtures with a fixed simulated network latency
+"""
+
+import asyncio
+import hashlib
+import importlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+
+from app.services.markets import finance, polymarket, stocks_service
+from app.services.news import aggregator
+from app.services.social import bluesky, truthsocial, twitter
+from app.services.trends.google_trends import google_trends_service
+
+# The package re-exports the service instance under the module's name
+commodities = importlib.import_module("app.services.markets.commodities_service")
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+RSS_FIXTURES = ["short.xml", "wordpress.xml", "full_article.xml", "atom.xml"]
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.md5(body).hexdigest() + '"'
+
+
+class MockUpstream:
+    """Serves RSS feeds (with ETag / 304 support), Bluesky XRPC, the Truth
+    Social archive, Polymarket Gamma/CLOB and Yahoo chart endpoints"""
+
+    def __init__(self, latency_ms: float = 20.0, port: int = 0):
+        self.latency = latency_ms / 1000
+        self.port = port
+        self.requests = 0
+        self.not_modified = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._feeds: dict[str, bytes] = {}
+        self._json: dict[str, bytes] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    # ========== Fixtures ==========
+
+    def _load(self) -> None:
+        rss = {name: (FIXTURES_DIR / "rss" / name).read_text() for name in RSS_FIXTURES}
+        for i, feed_key in enumerate(aggregator.RSS_FEEDS):
+            # Each feed replays one of the fixture styles under its own host,
+            # so ids are unique per feed while the stories overlap
+            text = rss[RSS_FIXTURES[i % len(RSS_FIXTURES)]]
+            host = feed_key.replace("_", "-")
+            self._feeds[feed_key] = text.replace(
+                "example.com", f"{host}.example.com"
+            ).encode()
+
+        for path in FIXTURES_DIR.glob("*/*.json"):
+            self._json[f"{path.parent.name}/{path.name}"] = path.read_bytes()
+
+    def _json_response(self, name: str, replace: Optional[tuple[str, str]] = None):
+        body = self._json[name]
+        if replace:
+            body = body.replace(replace[0].encode(), replace[1].encode())
+        return web.Response(body=body, content_type="application/json")
+
+    # ========== Handlers ==========
+
+    @web.middleware
+    async def _latency(self, request: web.Request, handler):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def _rss(self, request: web.Request) -> web.Response:
+        body = self._feeds.get(request.match_info["feed"])
+        if body is None:
+            raise web.HTTPNotFound()
+        etag = _etag(body)
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="application/rss+xml", headers={"ETag": etag}
+        )
+
+    async def _resolve_handle(self, request: web.Request) -> web.Response:
+        handle = request.query.get("handle", "")
+        did = "did:plc:" + hashlib.sha1(handle.encode()).hexdigest()[:24]
+        return web.json_response({"did": did})
+
+    async def _author_feed(self, request: web.Request) -> web.Response:
+        actor = request.query.get("actor", "did:plc:unknown")
+        return self._json_response(
+            "bluesky/author_feed.json", ("did:plc:fixture", actor)
+        )
+
+    async def _search_posts(self, request: web.Request) -> web.Response:
+        query = hashlib.sha1(request.query.get("q", "").encode()).hexdigest()[:24]
+        return self._json_response(
+            "bluesky/search_posts.json", ("did:plc:fixture", f"did:plc:{query}")
+        )
+
+    async def _truth_archive(self, request: web.Request) -> web.Response:
+        return self._json_response("truthsocial/truth_archive.json")
+
+    async def _gamma_markets(self, request: web.Request) -> web.Response:
+        tag = request.query.get("tag", "general")
+        name = f"polymarket/markets_{tag}.json"
+        if name not in self._json:
+            return web.json_response([])
+        return self._json_response(name)
+
+    async def _clob_history(self, request: web.Request) -> web.Response:
+        return self._json_response("polymarket/prices_history.json")
+
+    async def _yahoo_chart(self, request: web.Request) -> web.Response:
+        symbol = request.match_info["symbol"]
+        name = f"yahoo/chart_{symbol.replace('=', '_')}.json"
+        if name not in self._json:
+            return web.json_response(
+                {"chart": {"result": None, "error": {"code": "Not Found"}}},
+                status=404,
+            )
+        return self._json_response(name)
+
+    # ========== Lifecycle ==========
+
+    async def start(self) -> str:
+        """Start serving and return the base URL"""
+        self._load()
+        app = web.Application(middlewares=[self._latency])
+        app.router.add_get("/rss/{feed}", self._rss)
+        app.router.add_get(
+            "/bsky/xrpc/com.atproto.identity.resolveHandle", self._resolve_handle
+        )
+        app.router.add_get("/bsky/xrpc/app.bsky.feed.getAuthorFeed", self._author_feed)
+        app.router.add_get("/bsky/xrpc/app.bsky.feed.searchPosts", self._search_posts)
+        app.router.add_get("/truth/truth_archive.json", self._truth_archive)
+        app.router.add_get("/gamma/markets", self._gamma_markets)
+        app.router.add_get("/clob/prices-history", self._clob_history)
+        app.router.add_get("/yahoo/v8/finance/chart/{symbol}", self._yahoo_chart)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def point_services(self) -> None:
+        """Redirect every service's upstream constants to this server and drop
+        the politeness delays, which exist for the real upstreams and would
+        otherwise dominate every measurement"""
+        base = self.base_url
+        for feed_key, config in aggregator.RSS_FEEDS.items():
+            config["url"] = f"{base}/rss/{feed_key}"
+        bluesky.BSKY_API = f"{base}/bsky"
+        truthsocial.TRUTH_ARCHIVE_URL = f"{base}/truth/truth_archive.json"
+        polymarket.GAMMA_API = f"{base}/gamma"
+        polymarket.CLOB_API = f"{base}/clob"
+        for module in (commodities, finance, stocks_service):
+            module.YAHOO_API = f"{base}/yahoo/v8/finance/chart"
+
+        for module in (aggregator, bluesky, polymarket, commodities):
+            module.REQUEST_DELAY = 0
+            module.REQUEST_JITTER = 0
+        bluesky.RESOLVE_DELAY = 0
+
+        # Not replayed: keep these services offline
+        twitter.GETXAPI_KEY = ""
+        twitter.SCRAPEBADGER_KEY = ""
+        google_trends_service.pytrends = None
+
+
+def fixture_summary() -> dict:
+    """Sizes of the replayed fixtures, recorded with the results"""
+    return {
+        str(path.relative_to(FIXTURES_DIR)): path.stat().st_size
+        for path in sorted(FIXTURES_DIR.glob("*/*"))
+        if path.suffix in (".xml", ".json")
+    }
+
+
+if __name__ == "__main__":
+    # Serve the fixtures standalone, e.g. for profiling the app by hand
+    async def serve() -> None:
+        upstream = MockUpstream(port=8900)
+        print(f"Mock upstream on {await upstream.start()}")
+        print(json.dumps(fixture_summary(), indent=2))
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
@@ -2,18 +2,65 @@
 EdgeSeeker API - 全球军情舆情监控系统
 """
 
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
 # Load environment variables before importing app modules
 load_dotenv()
 
-from fastapi import FastAPI  # noqa: E402
-from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+
+from app.api.v1 import (
+    hotspot,
+    markets,
+    news,
+    regions,
+    search,
+    semantic,
+    social,
+    stream,
+    translate,
+)
+from app.core.http import http_client
+from app.core.metrics import CONTENT_TYPE, loop_lag_sampler, render_metrics
+from app.services.hotspot_detector import detector
+from app.services.ingest import ingest_hub
+from app.services.news.aggregator import news_aggregator
+from app.services.news.parsing import feed_parser
+from app.services.scheduler import hotspot_scheduler
+from app.services.search import search_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """启动/停止共享连接池、解析进程池、文章存储、分数历史、后台刷新任务与事件循环延迟采样"""
+    loop_lag_sampler.start()
+    await http_client.start()
+    feed_parser.start()
+    ingest_hub.subscribe(search_index.on_ingest)
+    # 只推送实时新增, 启动时从存储回填的旧文章不进入 SSE 回放缓冲
+    ingest_hub.subscribe(stream.on_ingest, backfill=False)
+    await news_aggregator.warm_start()
+    hotspot_scheduler.start()
+    yield
+    await hotspot_scheduler.stop()
+    detector.close()
+    await http_client.close()
+    feed_parser.shutdown()
+    news_aggregator.close()
+    ingest_hub.unsubscribe(search_index.on_ingest)
+    ingest_hub.unsubscribe(stream.on_ingest)
+    await loop_lag_sampler.stop()
 
-from app.api.v1 import news, social, markets, regions, hotspot, translate, semantic  # noqa: E402
 
 app = FastAPI(
-    title="EdgeSeeker API", description="全球热点地区军情舆情监控系统", version="0.2.0"
+    title="EdgeSeeker API",
+    description="全球热点地区军情舆情监控系统",
+    version="0.2.0",
+    lifespan=lifespan,
 )
 
 # CORS 配置 (standard FastAPI/Starlette pattern)
@@ -33,6 +80,8 @@ app.include_router(regions.router, prefix="/api/v1/regions", tags=["regions"])
 app.include_router(hotspot.router, prefix="/api/v1/hotspot", tags=["hotspot"])
 app.include_router(translate.router, prefix="/api/v1/translate", tags=["translate"])
 app.include_router(semantic.router, prefix="/api/v1/semantic", tags=["semantic"])
+app.include_router(search.router, prefix="/api/v1/search", tags=["search"])
+app.include_router(stream.router, prefix="/api/v1/stream", tags=["stream"])
 
 
 @app.get("/")
@@ -51,6 +100,9 @@ async def root():
             "regions": "/api/v1/regions - 区域管理",
             "translate": "/api/v1/translate - 翻译服务",
             "semantic": "/api/v1/semantic - 语义匹配",
+            "search": "/api/v1/search - 全文检索",
+            "stream": "/api/v1/stream - 实时推送 (SSE)",
+            "metrics": "/metrics - Prometheus 指标",
         },
     }
 
@@ -59,3 +111,9 @@ async def root():
 async def health():
     """健康检查"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 指标 (上游延迟、缓存命中、事件循环延迟、评分阶段耗时)"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)